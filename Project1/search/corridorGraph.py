@@ -0,0 +1,129 @@
+# corridorGraph.py
+# ----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a CorridorGraph object which contracts the one cell wide
+corridors of a layout into a weighted graph over its junctions.
+
+Example:
+graph = getCorridorGraph(gameState.getWalls())
+graph.edges[(1,1)]
+
+A corridor cell is an open cell with exactly two open neighbors: anything
+that walks into it can only carry on or turn back.  Every other open cell
+(dead ends, turns into open areas, forks) is a junction.  Each junction
+gets one edge per move out of it, following the corridor to the next
+junction, with the length of the corridor as the weight and the moves
+along it as the edge's actions.  getEdges also walks out of corridor cells,
+for searches that start inside a corridor.
+"""
+
+from game import Directions
+
+MOVES = [(Directions.NORTH, (0, 1)),
+         (Directions.SOUTH, (0, -1)),
+         (Directions.EAST, (1, 0)),
+         (Directions.WEST, (-1, 0))]
+
+class CorridorGraph:
+    def __init__(self, walls):
+        """
+        Contracts the corridors of walls, a Grid.
+        """
+        self.walls = walls
+
+        # exits[pos] lists the (action, nextPos) moves out of open cell pos
+        self.exits = {}
+        for x in range(walls.width):
+            for y in range(walls.height):
+                if walls[x][y]: continue
+                moves = []
+                for action, (dx, dy) in MOVES:
+                    nextx, nexty = x + dx, y + dy
+                    if 0 <= nextx < walls.width and 0 <= nexty < walls.height and not walls[nextx][nexty]:
+                        moves.append((action, (nextx, nexty)))
+                self.exits[(x, y)] = moves
+
+        self.junctions = sorted([pos for pos, moves in self.exits.items() if len(moves) != 2])
+
+        # edges[junction] lists an (action, end, length, actions, cells) tuple for
+        # every move out of junction, where actions leads along the corridor to
+        # end and cells lists the positions they pass through, ending with end
+        self.edges = {}
+        for junction in self.junctions:
+            self.edges[junction] = [self.followCorridor(junction, action, pos)
+                                    for action, pos in self.exits[junction]]
+
+    def getEdges(self, pos):
+        """
+        Returns the edges out of open cell pos: the stored ones for a junction,
+        or the two walks to the ends of the corridor pos lies in.
+        """
+        if pos in self.edges:
+            return self.edges[pos]
+        return [self.followCorridor(pos, action, nextPos) for action, nextPos in self.exits[pos]]
+
+    def isCorridor(self, pos):
+        "Returns whether pos is an open cell with exactly two open neighbors."
+        return len(self.exits[pos]) == 2
+
+    def isDeadEnd(self, pos):
+        "Returns whether pos is an open cell with a single open neighbor."
+        return len(self.exits[pos]) == 1
+
+    def continueCorridor(self, pos, action):
+        """
+        Returns the move that carries on along the corridor through pos, for
+        an agent that entered pos by taking action.
+        """
+        reverse = Directions.REVERSE[action]
+        for nextAction, nextPos in self.exits[pos]:
+            if nextAction != reverse:
+                return nextAction
+
+    def followCorridor(self, start, action, pos):
+        """
+        Walks from start into pos by taking action and onwards until it reaches
+        a junction (or start again), and returns the resulting edge.
+        """
+        actions, cells = [action], [pos]
+        while pos != start and self.isCorridor(pos):
+            action = self.continueCorridor(pos, action)
+            for nextAction, nextPos in self.exits[pos]:
+                if nextAction == action:
+                    pos = nextPos
+                    break
+            actions.append(action)
+            cells.append(pos)
+        return (actions[0], pos, len(actions), tuple(actions), tuple(cells))
+
+    def getNumEdges(self):
+        "Returns the number of directed edges between junctions."
+        return sum([len(edges) for edges in self.edges.values()])
+
+######################################
+# SHARING CORRIDOR GRAPHS PER LAYOUT #
+######################################
+
+graphMap = {}
+
+def getCorridorGraph(walls):
+    """
+    Returns the CorridorGraph for a wall Grid, building it only the first
+    time a layout with these walls is seen.
+    """
+    if walls not in graphMap:
+        graphMap[walls] = CorridorGraph(walls)
+    return graphMap[walls]
@@ -0,0 +1,182 @@
+# dStarLite.py
+# ------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a DStarLite planner, which finds shortest paths from a
+moving start to the nearest of a set of goals on a layout and repairs them
+incrementally when the start, the goals or the blocked cells change.
+
+Example:
+planner = DStarLite(gameState.getWalls(), gameState.getFood().asList(), (1,1))
+planner.getPath()
+planner.moveStart( (1,2) )
+planner.removeGoal( (1,2) )
+planner.setBlocked( (5,5), True )
+planner.getPath()
+
+D* Lite (Koenig and Likhachev) searches backwards from the goals towards
+the start, like A* with the Manhattan distance to the start as heuristic.
+Every cell keeps g, its distance to the nearest goal as last computed, and
+rhs, the distance its neighbors' g values imply.  A change to the layout
+only changes the rhs of the cells next to it, so only the cells whose g
+turns out to be wrong because of it are searched again, and the search
+stops as soon as the start's distance is known.  When the start moves, the
+keys of queued cells are kept valid by adding the distance moved to new
+keys instead of recomputing the whole queue.
+"""
+
+import util
+from game import Directions
+
+MOVES = [(Directions.NORTH, (0, 1)),
+         (Directions.SOUTH, (0, -1)),
+         (Directions.EAST, (1, 0)),
+         (Directions.WEST, (-1, 0))]
+
+INFINITY = float('inf')
+
+class DStarLite:
+    def __init__(self, walls, goals, start):
+        """
+        Plans on walls, a Grid, from start to the nearest position in the
+        list goals.
+        """
+        self.walls = walls
+        self.blocked = set()
+        self.goals = set()
+        self.start = start
+        # how far the start has moved in Manhattan distance, added to new keys
+        self.offset = 0
+        self.g = {}
+        self.rhs = {}
+        self.queue = util.IndexedPriorityQueue()
+        # cells whose g was set by the searches so far
+        self.expanded = 0
+        for goal in goals:
+            self.addGoal(goal)
+
+    def isOpen(self, pos):
+        x, y = pos
+        return 0 <= x < self.walls.width and 0 <= y < self.walls.height and \
+               not self.walls[x][y] and pos not in self.blocked
+
+    def getNeighbors(self, pos):
+        "Returns (action, neighbor) for every move out of pos into an open cell."
+        x, y = pos
+        neighbors = []
+        for action, (dx, dy) in MOVES:
+            neighbor = (x + dx, y + dy)
+            if self.isOpen(neighbor):
+                neighbors.append((action, neighbor))
+        return neighbors
+
+    def getKey(self, pos):
+        cost = min(self.g.get(pos, INFINITY), self.rhs.get(pos, INFINITY))
+        estimate = abs(pos[0] - self.start[0]) + abs(pos[1] - self.start[1])
+        return (cost + estimate + self.offset, cost)
+
+    def updateCell(self, pos):
+        "Recomputes the rhs of pos and queues it if its g is now wrong."
+        if pos in self.goals and self.isOpen(pos):
+            rhs = 0
+        elif self.isOpen(pos):
+            rhs = min([self.g.get(neighbor, INFINITY) + 1 for action, neighbor in self.getNeighbors(pos)] + [INFINITY])
+        else:
+            rhs = INFINITY
+        self.rhs[pos] = rhs
+        if self.g.get(pos, INFINITY) != rhs:
+            if self.queue.contains(pos):
+                self.queue.setPriority(pos, self.getKey(pos))
+            else:
+                self.queue.push(pos, self.getKey(pos))
+        elif self.queue.contains(pos):
+            self.queue.remove(pos)
+
+    def updateNeighbors(self, pos):
+        x, y = pos
+        for action, (dx, dy) in MOVES:
+            neighbor = (x + dx, y + dy)
+            if self.isOpen(neighbor):
+                self.updateCell(neighbor)
+
+    def computeShortestPath(self):
+        "Searches until the start's distance to the nearest goal is known."
+        queue, g, rhs = self.queue, self.g, self.rhs
+        start = self.start
+        while not queue.isEmpty() and (queue.getMinPriority() < self.getKey(start) or
+                                       rhs.get(start, INFINITY) != g.get(start, INFINITY)):
+            pos = queue.peek()
+            oldKey = queue.getMinPriority()
+            newKey = self.getKey(pos)
+            if oldKey < newKey:
+                # queued before the start moved
+                queue.setPriority(pos, newKey)
+                continue
+            self.expanded += 1
+            queue.pop()
+            if g.get(pos, INFINITY) > rhs[pos]:
+                g[pos] = rhs[pos]
+            else:
+                g[pos] = INFINITY
+                self.updateCell(pos)
+            self.updateNeighbors(pos)
+
+    def getDistance(self):
+        "Returns the distance from the start to the nearest goal, or None if there is none."
+        self.computeShortestPath()
+        distance = self.g.get(self.start, INFINITY)
+        if distance == INFINITY:
+            return None
+        return distance
+
+    def getPath(self):
+        """
+        Returns a list of Directions leading from the start to the nearest
+        goal, or None if no goal can be reached.
+        """
+        if self.getDistance() is None:
+            return None
+        actions = []
+        pos = self.start
+        while pos not in self.goals:
+            # step to the neighbor nearest to a goal
+            action, pos = min(self.getNeighbors(pos), key=lambda move: self.g.get(move[1], INFINITY))
+            actions.append(action)
+        return actions
+
+    def moveStart(self, start):
+        "Moves the start, say to Pacman's new position."
+        self.offset += abs(start[0] - self.start[0]) + abs(start[1] - self.start[1])
+        self.start = start
+
+    def addGoal(self, pos):
+        self.goals.add(pos)
+        self.updateCell(pos)
+
+    def removeGoal(self, pos):
+        "Removes a goal, say a piece of food that was eaten."
+        self.goals.discard(pos)
+        self.updateCell(pos)
+
+    def setBlocked(self, pos, blocked):
+        "Blocks or unblocks an open cell, say one with a ghost in it."
+        if blocked == (pos in self.blocked):
+            return
+        if blocked:
+            self.blocked.add(pos)
+        else:
+            self.blocked.remove(pos)
+        self.updateCell(pos)
+        self.updateNeighbors(pos)
@@ -0,0 +1,183 @@
+# distanceField.py
+# ----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a DistanceField object which knows, for every open cell
+of a layout, the distance to the nearest of a set of targets (such as food)
+and the first move towards it.
+
+Example:
+field = DistanceField(gameState.getWalls(), gameState.getFood().asList())
+field.getPath( (1,1) )
+field.removeTarget( (3,1) )
+
+The field is built by a single breadth first search started from all the
+targets at once.  Every cell remembers which target reached it first, so
+when a target is removed only the cells that were closest to it are
+searched again, starting from the cells around them.
+"""
+
+import array, heapq
+from game import Directions
+
+# Stored for cells no target can reach
+UNREACHABLE = -1
+
+class DistanceField:
+    def __init__(self, walls, targets):
+        """
+        Runs a breadth first search on walls, a Grid, from every position in
+        the list targets.
+        """
+        self.width = walls.width
+        self.height = walls.height
+        height = self.height
+        size = self.width * height
+        self.isOpen = [not walls[x][y] for x in range(self.width) for y in range(height)]
+
+        # for the cell with index x * height + y, distances[cell] is its
+        # distance to the nearest target, sources[cell] that target's index and
+        # parents[cell] the next cell on the way there
+        self.distances = array.array('i', [UNREACHABLE]) * size
+        self.sources = array.array('i', [UNREACHABLE]) * size
+        self.parents = array.array('i', [UNREACHABLE]) * size
+        self.isTarget = [False] * size
+        self.numTargets = 0
+        # moves[offset] is the action taking a cell to the cell offset away
+        self.moves = {1: Directions.NORTH, -1: Directions.SOUTH,
+                      height: Directions.EAST, -height: Directions.WEST}
+
+        frontier = []
+        for pos in targets:
+            cell = self.getCell(pos)
+            if self.isTarget[cell]: continue
+            self.isTarget[cell] = True
+            self.numTargets += 1
+            self.distances[cell] = 0
+            self.sources[cell] = cell
+            frontier.append(cell)
+        distance = 0
+        while frontier:
+            distance += 1
+            nextFrontier = []
+            for cell in frontier:
+                for neighbor in self.getNeighbors(cell):
+                    if self.distances[neighbor] == UNREACHABLE:
+                        self.distances[neighbor] = distance
+                        self.sources[neighbor] = self.sources[cell]
+                        self.parents[neighbor] = cell
+                        nextFrontier.append(neighbor)
+            frontier = nextFrontier
+
+    def getCell(self, pos):
+        x, y = int(pos[0]), int(pos[1])
+        if not (0 <= x < self.width and 0 <= y < self.height) or not self.isOpen[x * self.height + y]:
+            raise Exception, 'Position not an open cell: %s' % str(pos)
+        return x * self.height + y
+
+    def getPosition(self, cell):
+        return (cell / self.height, cell % self.height)
+
+    def getNeighbors(self, cell):
+        "Returns the indices of the open cells next to cell."
+        height, isOpen = self.height, self.isOpen
+        y = cell % height
+        neighbors = []
+        if y + 1 < height and isOpen[cell + 1]: neighbors.append(cell + 1)
+        if y > 0 and isOpen[cell - 1]: neighbors.append(cell - 1)
+        if cell + height < len(isOpen) and isOpen[cell + height]: neighbors.append(cell + height)
+        if cell >= height and isOpen[cell - height]: neighbors.append(cell - height)
+        return neighbors
+
+    def getDistance(self, pos):
+        """
+        Returns the maze distance from pos to the nearest target, or None if
+        no target can be reached.
+        """
+        distance = self.distances[self.getCell(pos)]
+        if distance == UNREACHABLE:
+            return None
+        return distance
+
+    def getNearestTarget(self, pos):
+        "Returns the target nearest to pos, or None if none can be reached."
+        source = self.sources[self.getCell(pos)]
+        if source == UNREACHABLE:
+            return None
+        return self.getPosition(source)
+
+    def getPath(self, pos):
+        """
+        Returns a list of Directions leading from pos to the nearest target,
+        or None if no target can be reached.
+        """
+        cell = self.getCell(pos)
+        if self.distances[cell] == UNREACHABLE:
+            return None
+        actions = []
+        while self.distances[cell] > 0:
+            parent = self.parents[cell]
+            actions.append(self.moves[parent - cell])
+            cell = parent
+        return actions
+
+    def removeTarget(self, pos):
+        """
+        Removes the target at pos and repairs the field.  Only the cells whose
+        nearest target was pos are searched again, and their number is
+        returned.
+        """
+        target = self.getCell(pos)
+        if not self.isTarget[target]:
+            raise Exception, 'Not a target: %s' % str(pos)
+        self.isTarget[target] = False
+        self.numTargets -= 1
+        distances, sources, parents = self.distances, self.sources, self.parents
+
+        # the cells that were closest to target are connected to it through
+        # their parents, so they are found by a search that stays among them
+        region = [target]
+        sources[target] = UNREACHABLE
+        for cell in region:
+            for neighbor in self.getNeighbors(cell):
+                if sources[neighbor] == target:
+                    sources[neighbor] = UNREACHABLE
+                    region.append(neighbor)
+        for cell in region:
+            distances[cell] = parents[cell] = UNREACHABLE
+
+        # seed the region from the cells around it, then search it again in
+        # order of distance
+        fringe = []
+        for cell in region:
+            for neighbor in self.getNeighbors(cell):
+                if sources[neighbor] != UNREACHABLE:
+                    distance = distances[neighbor] + 1
+                    if distances[cell] == UNREACHABLE or distance < distances[cell]:
+                        distances[cell] = distance
+                        sources[cell] = sources[neighbor]
+                        parents[cell] = neighbor
+            if distances[cell] != UNREACHABLE:
+                heapq.heappush(fringe, (distances[cell], cell))
+        while fringe:
+            distance, cell = heapq.heappop(fringe)
+            if distance > distances[cell]: continue
+            for neighbor in self.getNeighbors(cell):
+                if distances[neighbor] == UNREACHABLE or distance + 1 < distances[neighbor]:
+                    distances[neighbor] = distance + 1
+                    sources[neighbor] = sources[cell]
+                    parents[neighbor] = cell
+                    heapq.heappush(fringe, (distance + 1, neighbor))
+        return len(region)
@@ -0,0 +1,253 @@
+# externalSearch.py
+# -----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains breadth first and uniform cost search with the frontier
+and the closed set kept in files on disk, for state spaces that don't fit
+in memory.
+
+Example:
+actions = externalSearch(problem, lambda stepCost: 1)
+
+The search works through layers: all the states reached at one cost g.
+Successors are buffered in memory and written out, sorted by the hash of
+the state, into run files of the layer of their cost.  When a layer comes
+up for expansion its runs are merged, along with the layers already closed,
+and every state in it is kept only if it is in no closed layer and wasn't
+kept before (delayed duplicate detection, Korf 2004).  Because every file is
+sorted by hash, the duplicates of a state are next to it in the merge, and
+only a few records are ever in memory at once apart from the buffer.
+
+Each record holds the hash of its parent and the cost of its parent's layer
+rather than the path, so the path is found at the end by looking up the
+parent of the goal in its layer, and so on back to the start.
+
+Set the EXTERNAL_SEARCH_DIRECTORY environment variable to put the files
+on another disk; by default they go in the system's temporary directory.
+They are removed when the search ends.
+"""
+
+import cPickle, heapq, os, shutil, tempfile
+
+# Successors kept in memory before they are written to a sorted run
+BUFFER_RECORDS = 100000
+
+# Most files merged at once; more runs than this are merged in passes
+MERGE_WIDTH = 64
+
+SEARCH_DIRECTORY = os.environ.get('EXTERNAL_SEARCH_DIRECTORY') or None
+
+def writeRecords(path, records):
+    "Writes records to a new file at path."
+    outFile = open(path, 'wb')
+    pickler = cPickle.Pickler(outFile, cPickle.HIGHEST_PROTOCOL)
+    # the pickler would otherwise remember every record it has written
+    pickler.fast = True
+    for record in records:
+        pickler.dump(record)
+    outFile.close()
+
+def readRecords(path):
+    "Yields the records in the file at path."
+    inFile = open(path, 'rb')
+    unpickler = cPickle.Unpickler(inFile)
+    try:
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+    finally:
+        inFile.close()
+
+def readRanked(path, rank):
+    """
+    Yields (hash, rank, path, count, record) for the records in the file at
+    path, so that records with the same hash from several files merge by
+    rank and the states themselves are never compared.
+    """
+    for count, record in enumerate(readRecords(path)):
+        yield (record[0], rank, path, count, record)
+
+class Layer:
+    """
+    The states reached at one cost, as sorted run files until the layer is
+    closed and then as a single sorted file.
+    """
+    def __init__(self, directory, cost):
+        self.directory = directory
+        self.cost = cost
+        self.runs = []
+        self.path = None
+
+    def getNewPath(self):
+        "Creates a new empty file in the search directory and returns its path."
+        fd, path = tempfile.mkstemp(prefix='layer%s-' % self.cost, dir=self.directory)
+        os.close(fd)
+        return path
+
+    def addRun(self, records):
+        "Sorts records, tuples starting with the hash of the state, into a new run."
+        records.sort(key=lambda record: record[0])
+        path = self.getNewPath()
+        writeRecords(path, records)
+        self.runs.append(path)
+
+    def mergeRuns(self):
+        """
+        Merges the runs down to at most MERGE_WIDTH, without removing
+        duplicates, and returns their paths.
+        """
+        while len(self.runs) > MERGE_WIDTH:
+            runs, self.runs = self.runs[:MERGE_WIDTH], self.runs[MERGE_WIDTH:]
+            path = self.getNewPath()
+            merged = heapq.merge(*[readRanked(run, 0) for run in runs])
+            writeRecords(path, (ranked[-1] for ranked in merged))
+            for run in runs:
+                os.remove(run)
+            self.runs.append(path)
+        return self.runs
+
+    def findParent(self, problem, child, parentHash, action):
+        "Returns the state in this closed layer that reaches child by action."
+        for record in readRecords(self.path):
+            if record[0] < parentHash:
+                continue
+            if record[0] > parentHash:
+                break
+            state = record[1]
+            for successor, successorAction, stepCost in problem.getSuccessors(state):
+                if successorAction == action and successor == child:
+                    return record
+        raise Exception, 'The parent of a state is missing from its layer'
+
+def closeLayer(layer, closedLayers):
+    """
+    Merges the runs of layer into one file of the states in it that are in
+    no layer of closedLayers, and yields those states' records as they are
+    written.
+    """
+    layer.path = layer.getNewPath()
+    outFile = open(layer.path, 'wb')
+    pickler = cPickle.Pickler(outFile, cPickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    # closed layers rank first, so their states are seen before any new copy
+    sources = [readRanked(closed.path, 0) for closed in closedLayers]
+    sources += [readRanked(run, 1) for run in layer.mergeRuns()]
+
+    groupHash, seen = None, []
+    try:
+        for stateHash, rank, path, count, record in heapq.merge(*sources):
+            if stateHash != groupHash:
+                groupHash, seen = stateHash, []
+            state = record[1]
+            if state in seen:
+                continue
+            seen.append(state)
+            if rank == 1:
+                pickler.dump(record)
+                yield record
+    finally:
+        outFile.close()
+        for run in layer.runs:
+            os.remove(run)
+        layer.runs = []
+
+def getPath(problem, goalRecord, layers):
+    "Follows the parents of goalRecord back through layers to the start."
+    expanded = getattr(problem, '_expanded', None)
+    actions = []
+    record = goalRecord
+    while record[2] is not None:
+        stateHash, state, parentHash, parentCost, action = record
+        record = layers[parentCost].findParent(problem, state, parentHash, action)
+        actions.append(action)
+    actions.reverse()
+    # looking up the parents isn't part of the search
+    if expanded is not None:
+        problem._expanded = expanded
+    return actions
+
+class Frontier:
+    """
+    The layers of a search, with the successors not yet written to a run
+    buffered in memory.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.layers = {}
+        self.buffers = {}
+        self.buffered = 0
+
+    def add(self, record, cost):
+        "Adds record, (hash, state, parent hash, parent cost, action), to the layer of cost."
+        if cost not in self.layers:
+            self.layers[cost] = Layer(self.directory, cost)
+        self.buffers.setdefault(cost, []).append(record)
+        self.buffered += 1
+        if self.buffered >= BUFFER_RECORDS:
+            self.flush()
+
+    def flush(self):
+        for cost, records in self.buffers.items():
+            self.layers[cost].addRun(records)
+        self.buffers = {}
+        self.buffered = 0
+
+    def getNextLayer(self):
+        "Returns the cheapest layer not closed yet, or None if there is none."
+        self.flush()
+        waiting = [cost for cost, layer in self.layers.items() if layer.path is None]
+        if not waiting:
+            return None
+        return self.layers[min(waiting)]
+
+def externalSearch(problem, getCost, locality=None):
+    """
+    Returns the cheapest list of actions to a goal of problem, where a step
+    costs getCost(stepCost) and costs are positive, keeping the states on
+    disk.  With getCost returning 1 this is breadth first search.
+
+    A new state is checked against the last locality closed layers, or all
+    of them if locality is None.  In problems where every move can be
+    undone, any repeated state lies in the last two layers of breadth first
+    search, so locality=2 saves reading the rest.
+    """
+    directory = tempfile.mkdtemp(prefix='externalSearch-', dir=SEARCH_DIRECTORY)
+    try:
+        frontier = Frontier(directory)
+        closedLayers = []
+        start = problem.getStartState()
+        frontier.add((hash(start), start, None, None, None), 0)
+        while True:
+            layer = frontier.getNextLayer()
+            if layer is None:
+                print "SHEESH, we have failed."
+                return None
+            checked = closedLayers
+            if locality is not None:
+                checked = closedLayers[max(0, len(closedLayers) - locality):]
+            records = closeLayer(layer, checked)
+            for record in records:
+                stateHash, state = record[0], record[1]
+                if problem.isGoalState(state):
+                    records.close()
+                    return getPath(problem, record, frontier.layers)
+                for successor, action, stepCost in problem.getSuccessors(state):
+                    frontier.add((hash(successor), successor, stateHash, layer.cost, action),
+                                 layer.cost + getCost(stepCost))
+            closedLayers.append(layer)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -160,69 +160,99 @@ class AgentState:
 
 class Grid:
     """
-    A 2-dimensional array of objects backed by a list of lists.  Data is accessed
-    via grid[x][y] where (x,y) are positions on a Pacman map with x horizontal,
-    y vertical and the origin (0,0) in the bottom left corner.
+    A 2-dimensional array of booleans backed by a single integer bitset.  Data
+    is accessed via grid[x][y] where (x,y) are positions on a Pacman map with
+    x horizontal, y vertical and the origin (0,0) in the bottom left corner.
+
+    Cell (x,y) is bit x * height + y of self.bits, so copying, hashing and
+    comparing grids and counting their True cells are single integer
+    operations rather than walks over every cell.  A Grid therefore holds
+    only booleans: the initial value must be True or False, and any value
+    written to a cell is stored as its truth value.
+
+    grid[x] is a GridColumn, a list of the column's cells made the first
+    time the column is read and kept in step with the bits after that, so
+    reading grid[x][y] costs a list lookup, as it did before the bitset.
 
     The __str__ method constructs an output that is oriented like a pacman board.
     """
     def __init__(self, width, height, initialValue=False, bitRepresentation=None):
-        if initialValue not in [False, True]: raise Exception('Grids can only contain booleans')
+        if type(initialValue) is not bool: raise TypeError('Grids can only contain booleans')
         self.CELLS_PER_INT = 30
 
         self.width = width
         self.height = height
-        self.data = [[initialValue for y in range(height)] for x in range(width)]
+        # the GridColumn of each column, made the first time it is read
+        self.columns = [None] * width
+        if initialValue:
+            self.bits = (1 << (width * height)) - 1
+        else:
+            self.bits = 0
         if bitRepresentation:
             self._unpackBits(bitRepresentation)
 
     def __getitem__(self, i):
-        return self.data[i]
+        column = self.columns[i]
+        if column is None:
+            column = self.columns[i] = GridColumn(self, (i % self.width) * self.height)
+        return column
+
+    def __getstate__(self):
+        # the columns refer back to this grid, so copies and pickles make their own
+        state = self.__dict__.copy()
+        del state['columns']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.columns = [None] * self.width
 
     def __setitem__(self, key, item):
-        self.data[key] = item
+        column = self[key]
+        for y in range(self.height):
+            column[y] = item[y]
 
     def __str__(self):
-        out = [[str(self.data[x][y])[0] for x in range(self.width)] for y in range(self.height)]
+        out = [[str(self[x][y])[0] for x in range(self.width)] for y in range(self.height)]
         out.reverse()
         return '\n'.join([''.join(x) for x in out])
 
     def __eq__(self, other):
         if other == None: return False
-        return self.data == other.data
+        return self.bits == other.bits and self.width == other.width and self.height == other.height
+
+    def __ne__(self, other):
+        return not self == other
 
     def __hash__(self):
-        # return hash(str(self))
-        base = 1
-        h = 0
-        for l in self.data:
-            for i in l:
-                if i:
-                    h += base
-                base *= 2
-        return hash(h)
+        return hash(self.bits)
 
     def copy(self):
         g = Grid(self.width, self.height)
-        g.data = [x[:] for x in self.data]
+        g.bits = self.bits
         return g
 
     def deepCopy(self):
         return self.copy()
 
     def shallowCopy(self):
-        g = Grid(self.width, self.height)
-        g.data = self.data
-        return g
+        "The same as copy: the bits are one immutable integer, so there is nothing to share."
+        return self.copy()
 
     def count(self, item =True ):
-        return sum([x.count(item) for x in self.data])
+        trueCount = bin(self.bits).count('1')
+        if item: return trueCount
+        return self.width * self.height - trueCount
 
     def asList(self, key = True):
+        bits = self.bits
+        if not key:
+            bits ^= (1 << (self.width * self.height)) - 1
         list = []
-        for x in range(self.width):
-            for y in range(self.height):
-                if self[x][y] == key: list.append( (x,y) )
+        while bits:
+            lowest = bits & -bits
+            list.append(self._cellIndexToPosition(lowest.bit_length() - 1))
+            bits ^= lowest
         return list
 
     def packBits(self):
@@ -230,18 +260,15 @@ class Grid:
         Returns an efficient int list representation
 
         (width, height, bitPackedInts...)
+
+        Each packed int holds CELLS_PER_INT cells with the first cell in its
+        most significant bit.
         """
         bits = [self.width, self.height]
-        currentInt = 0
-        for i in range(self.height * self.width):
-            bit = self.CELLS_PER_INT - (i % self.CELLS_PER_INT) - 1
-            x, y = self._cellIndexToPosition(i)
-            if self[x][y]:
-                currentInt += 2 ** bit
-            if (i + 1) % self.CELLS_PER_INT == 0:
-                bits.append(currentInt)
-                currentInt = 0
-        bits.append(currentInt)
+        size = self.width * self.height
+        for start in range(0, size + 1, self.CELLS_PER_INT):
+            chunk = (self.bits >> start) & ((1 << self.CELLS_PER_INT) - 1)
+            bits.append(int(bin(chunk)[2:].zfill(self.CELLS_PER_INT)[::-1], 2))
         return tuple(bits)
 
     def _cellIndexToPosition(self, index):
@@ -253,25 +280,34 @@ class Grid:
         """
         Fills in data from a bit-level representation
         """
-        cell = 0
-        for packed in bits:
-            for bit in self._unpackInt(packed, self.CELLS_PER_INT):
-                if cell == self.width * self.height: break
-                x, y = self._cellIndexToPosition(cell)
-                self[x][y] = bit
-                cell += 1
-
-    def _unpackInt(self, packed, size):
-        bools = []
-        if packed < 0: raise ValueError, "must be a positive integer"
-        for i in range(size):
-            n = 2 ** (self.CELLS_PER_INT - i - 1)
-            if packed >= n:
-                bools.append(True)
-                packed -= n
-            else:
-                bools.append(False)
-        return bools
+        self.bits = 0
+        for i, packed in enumerate(bits):
+            if packed < 0: raise ValueError, "must be a positive integer"
+            chunk = int(bin(packed)[2:].zfill(self.CELLS_PER_INT)[::-1], 2)
+            self.bits |= chunk << (i * self.CELLS_PER_INT)
+        self.bits &= (1 << (self.width * self.height)) - 1
+
+class GridColumn(list):
+    """
+    The cells of one column of a Grid, so that grid[x][y] reads a list and
+    grid[x][y] = value writes both the list and the bit for cell (x,y).
+    """
+    __slots__ = ('grid', 'offset')
+
+    def __init__(self, grid, offset):
+        bits = grid.bits >> offset
+        list.__init__(self, [(bits >> y) & 1 == 1 for y in range(grid.height)])
+        self.grid = grid
+        self.offset = offset
+
+    def __setitem__(self, y, value):
+        value = bool(value)
+        list.__setitem__(self, y, value)
+        if y < 0: y += len(self)
+        if value:
+            self.grid.bits |= 1 << (self.offset + y)
+        else:
+            self.grid.bits &= ~(1 << (self.offset + y))
 
 def reconstituteGrid(bitRep):
     if type(bitRep) is not type((1,2)):
@@ -433,7 +469,7 @@ class GameStateData:
 
     def __str__( self ):
         width, height = self.layout.width, self.layout.height
-        map = Grid(width, height)
+        map = [[None] * height for x in range(width)]
         if type(self.food) == type((1,2)):
             self.food = reconstituteGrid(self.food)
         for x in range(width):
@@ -454,7 +490,9 @@ class GameStateData:
         for x, y in self.capsules:
             map[x][y] = 'o'
 
-        return str(map) + ("\nScore: %d\n" % self.score)
+        rows = [''.join([map[x][y] for x in range(width)]) for y in range(height)]
+        rows.reverse()
+        return '\n'.join(rows) + ("\nScore: %d\n" % self.score)
 
     def _foodWallStr( self, hasFood, hasWall ):
         if hasFood:
@@ -0,0 +1,183 @@
+# hierarchicalBenchmark.py
+# ------------------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+Compares the query latency of hierarchical pathfinding (HPA*) with
+aStarSearch and manhattanHeuristic on random start and goal positions.
+
+Runs on the bundled layouts and on synthetic mazes and open fields.  For
+every layout, it prints the one-off cost of building the cluster graph, the
+mean time and expanded nodes per query for both searches, and how much
+longer the HPA* paths are on average.
+
+To run on the bundled layouts and the default synthetic ones:
+    python hierarchicalBenchmark.py
+To run on a few layouts and a large synthetic maze only:
+    python hierarchicalBenchmark.py -l bigMaze,openMaze -m 201 -o 0
+"""
+
+import os, random, sys, time
+import layout, pacman, search, searchAgents
+import hierarchicalPathfinding
+
+def mazeLayout(size, loops, rand):
+    """
+    Returns a size by size Layout of one wide corridors: a random spanning
+    tree maze with a fraction loops of its remaining inner walls knocked down.
+    """
+    size = size | 1
+    grid = [['%'] * size for y in range(size)]
+    stack = [(1, 1)]
+    grid[1][1] = ' '
+    while stack:
+        x, y = stack[-1]
+        unvisited = [(x + dx, y + dy) for dx, dy in [(2, 0), (-2, 0), (0, 2), (0, -2)]
+                     if 0 < x + dx < size - 1 and 0 < y + dy < size - 1 and grid[y + dy][x + dx] == '%']
+        if not unvisited:
+            stack.pop()
+            continue
+        nextx, nexty = rand.choice(unvisited)
+        grid[(y + nexty) / 2][(x + nextx) / 2] = ' '
+        grid[nexty][nextx] = ' '
+        stack.append((nextx, nexty))
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if grid[y][x] == '%' and (x + y) % 2 == 1 and rand.random() < loops:
+                grid[y][x] = ' '
+    return makeLayout(grid)
+
+def openLayout(size, density, rand):
+    "Returns a size by size Layout with a fraction density of its cells walls."
+    grid = [['%'] * size for y in range(size)]
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if rand.random() >= density:
+                grid[y][x] = ' '
+    return makeLayout(grid)
+
+def makeLayout(grid):
+    "Places Pacman in the first open cell and returns the Layout for grid."
+    for row in grid:
+        if ' ' in row:
+            row[row.index(' ')] = 'P'
+            break
+    return layout.Layout([''.join(row) for row in grid])
+
+def connectedGroups(walls):
+    "Returns the open cells of walls grouped into connected lists."
+    unseen = set(walls.asList(False))
+    groups = []
+    while unseen:
+        group = [unseen.pop()]
+        for x, y in group:
+            for neighbor in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+                if neighbor in unseen:
+                    unseen.remove(neighbor)
+                    group.append(neighbor)
+        groups.append(group)
+    return groups
+
+def benchmark(name, lay, numQueries, clusterSize, rand):
+    """
+    Times numQueries random queries on lay with both searches and prints a
+    row of results.
+    """
+    state = pacman.GameState()
+    state.initialize(lay, 0)
+    walls = lay.walls
+
+    start = time.time()
+    graph = hierarchicalPathfinding.ClusterGraph(walls, clusterSize)
+    buildTime = time.time() - start
+
+    # queries are drawn from the largest connected part of the layout
+    cells = max(connectedGroups(walls), key=len)
+    astarTime = hpaTime = 0.0
+    astarExpanded = hpaExpanded = 0
+    astarCost = hpaCost = 0
+    queries = 0
+    while queries < numQueries and len(cells) > 1:
+        source, goal = rand.sample(cells, 2)
+        problem = searchAgents.PositionSearchProblem(state, goal=goal, start=source, warn=False, visualize=False)
+        start = time.time()
+        actions = search.aStarSearch(problem, searchAgents.manhattanHeuristic)
+        astarTime += time.time() - start
+
+        start = time.time()
+        path = graph.findPath(source, goal)
+        hpaTime += time.time() - start
+        if path is None:
+            raise Exception, 'HPA* found no path from %s to %s on %s' % (source, goal, name)
+
+        queries += 1
+        astarExpanded += problem._expanded
+        hpaExpanded += graph.expanded
+        astarCost += len(actions)
+        hpaCost += len(path)
+
+    if queries == 0:
+        return
+    print '%-28s %9d %9.1f %9.2f %9.2f %9d %9d %8.1f%%' % (
+        name, len(cells), buildTime * 1000,
+        astarTime * 1000 / queries, hpaTime * 1000 / queries,
+        astarExpanded / queries, hpaExpanded / queries,
+        100.0 * (hpaCost - astarCost) / max(astarCost, 1))
+
+def readCommand(argv):
+    from optparse import OptionParser
+    parser = OptionParser(__doc__)
+    parser.add_option('-l', '--layouts', dest='layouts', default='',
+                      help='comma separated bundled layouts to run on (default: all of them)')
+    parser.add_option('-n', '--numQueries', dest='numQueries', type='int', default=20,
+                      help='random queries per layout (default %default)')
+    parser.add_option('-m', '--mazeSizes', dest='mazeSizes', default='51,101,201',
+                      help='comma separated sizes of synthetic mazes, or 0 for none (default %default)')
+    parser.add_option('-o', '--openSizes', dest='openSizes', default='50,100,200',
+                      help='comma separated sizes of synthetic open fields, or 0 for none (default %default)')
+    parser.add_option('-c', '--clusterSize', dest='clusterSize', type='int',
+                      default=hierarchicalPathfinding.CLUSTER_SIZE,
+                      help='cluster width and height (default %default)')
+    parser.add_option('-s', '--seed', dest='seed', type='int', default=0,
+                      help='random seed (default %default)')
+    options, otherjunk = parser.parse_args(argv)
+    if len(otherjunk) != 0:
+        raise Exception('Command line input not understood: ' + str(otherjunk))
+    return options
+
+def runBenchmarks(options):
+    rand = random.Random(options.seed)
+
+    layouts = []
+    names = [name for name in options.layouts.split(',') if name]
+    if not names:
+        names = sorted([name[:-4] for name in os.listdir('layouts') if name.endswith('.lay')])
+    for name in names:
+        lay = layout.getLayout(name)
+        if lay == None: raise Exception("The layout " + name + " cannot be found")
+        layouts.append((name, lay))
+    for size in [int(size) for size in options.mazeSizes.split(',') if int(size)]:
+        layouts.append(('maze%d' % size, mazeLayout(size, 0.0, rand)))
+        layouts.append(('loopyMaze%d' % size, mazeLayout(size, 0.1, rand)))
+    for size in [int(size) for size in options.openSizes.split(',') if int(size)]:
+        layouts.append(('open%d' % size, openLayout(size, 0.2, rand)))
+
+    print '%-28s %9s %9s %9s %9s %9s %9s %9s' % (
+        'layout', 'cells', 'build ms', 'A* ms', 'HPA* ms', 'A* exp', 'HPA* exp', 'longer')
+    for name, lay in layouts:
+        benchmark(name, lay, options.numQueries, options.clusterSize, rand)
+
+if __name__ == '__main__':
+    options = readCommand(sys.argv[1:])
+    runBenchmarks(options)
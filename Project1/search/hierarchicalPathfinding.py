@@ -0,0 +1,270 @@
+# hierarchicalPathfinding.py
+# --------------------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a ClusterGraph object for hierarchical pathfinding (HPA*)
+on a layout's walls.
+
+Example:
+graph = getClusterGraph(gameState.getWalls())
+graph.findPath( (1,1), (10,10) )
+
+The layout is cut into square clusters of CLUSTER_SIZE cells.  Wherever
+open cells face each other across the border of two clusters, one or two
+entrance cells are placed on each side, and the distances between the
+entrances of each cluster are precomputed.  A query connects the start and
+goal to the entrances of their own clusters, runs A* on this small abstract
+graph and then refines each abstract step into moves, searching only
+inside one cluster at a time.  Refined steps between entrances are cached.
+
+Paths can only cross between clusters at entrances, so they may be a
+little longer than the shortest path.
+"""
+
+import util
+from game import Directions
+
+# Width and height of a cluster, in cells
+CLUSTER_SIZE = 10
+
+# Entrances at least this wide get a transition at both ends instead of one
+# in the middle
+WIDE_ENTRANCE = 6
+
+MOVES = [(Directions.NORTH, (0, 1)),
+         (Directions.SOUTH, (0, -1)),
+         (Directions.EAST, (1, 0)),
+         (Directions.WEST, (-1, 0))]
+
+class ClusterGraph:
+    def __init__(self, walls, clusterSize=CLUSTER_SIZE):
+        """
+        Builds the abstract graph for walls, a Grid.
+        """
+        self.width = walls.width
+        self.height = walls.height
+        self.clusterSize = clusterSize
+        self.isOpen = [[not walls[x][y] for y in range(self.height)] for x in range(self.width)]
+
+        # (node, node) -> actions for intra-cluster steps refined so far
+        self.refined = {}
+        # cells searched by the last findPath
+        self.expanded = 0
+
+        # edges[node] maps each abstract node reachable in one abstract step
+        # to the cost of that step
+        self.edges = {}
+        self.addEntrances()
+        for cx in range((self.width + clusterSize - 1) / clusterSize):
+            for cy in range((self.height + clusterSize - 1) / clusterSize):
+                self.connectCluster((cx, cy))
+
+    def getCluster(self, pos):
+        return (pos[0] / self.clusterSize, pos[1] / self.clusterSize)
+
+    def addEntrances(self):
+        """
+        Finds the runs of open cells facing each other across every cluster
+        border and joins each run's transitions with edges of cost one.
+        """
+        size = self.clusterSize
+        # borders between horizontally adjacent clusters
+        for x in range(size - 1, self.width - 1, size):
+            self.addTransitions([((x, y), (x + 1, y)) for y in range(self.height)])
+        # borders between vertically adjacent clusters
+        for y in range(size - 1, self.height - 1, size):
+            self.addTransitions([((x, y), (x, y + 1)) for x in range(self.width)])
+
+    def addTransitions(self, border):
+        size = self.clusterSize
+        run = []
+        for i, (a, b) in enumerate(border):
+            facing = self.isOpen[a[0]][a[1]] and self.isOpen[b[0]][b[1]]
+            # runs never cross a corner shared by several clusters
+            if facing and run and i % size != 0:
+                run.append((a, b))
+                continue
+            self.addRun(run)
+            run = []
+            if facing:
+                run = [(a, b)]
+        self.addRun(run)
+
+    def addRun(self, run):
+        if not run: return
+        if len(run) >= WIDE_ENTRANCE:
+            transitions = [run[0], run[-1]]
+        else:
+            transitions = [run[len(run) / 2]]
+        for a, b in transitions:
+            self.edges.setdefault(a, {})[b] = 1
+            self.edges.setdefault(b, {})[a] = 1
+
+    def getClusterBounds(self, cluster):
+        "Returns the (xmin, ymin, xmax, ymax) cells of a cluster, inclusive."
+        size = self.clusterSize
+        x0, y0 = cluster[0] * size, cluster[1] * size
+        return (x0, y0, min(x0 + size, self.width) - 1, min(y0 + size, self.height) - 1)
+
+    def connectCluster(self, cluster):
+        "Adds the intra-cluster edges between the entrances of a cluster."
+        nodes = [node for node in self.edges if self.getCluster(node) == cluster]
+        for node in nodes:
+            distances = self.clusterDistances(node, cluster)
+            for other in nodes:
+                if other != node and other in distances:
+                    self.edges[node][other] = distances[other]
+
+    def clusterDistances(self, start, cluster):
+        """
+        Breadth first search from start that never leaves cluster.  Returns a
+        dictionary from each cell reached to its distance.
+        """
+        xmin, ymin, xmax, ymax = self.getClusterBounds(cluster)
+        isOpen = self.isOpen
+        distances = {start: 0}
+        frontier = [start]
+        while frontier:
+            self.expanded += len(frontier)
+            nextFrontier = []
+            for x, y in frontier:
+                distance = distances[(x, y)] + 1
+                for _, (dx, dy) in MOVES:
+                    nextx, nexty = x + dx, y + dy
+                    if xmin <= nextx <= xmax and ymin <= nexty <= ymax and \
+                       isOpen[nextx][nexty] and (nextx, nexty) not in distances:
+                        distances[(nextx, nexty)] = distance
+                        nextFrontier.append((nextx, nexty))
+            frontier = nextFrontier
+        return distances
+
+    def clusterPath(self, start, goal):
+        """
+        Returns the moves of a shortest path from start to goal that stays
+        inside their cluster, or None if there is none.
+        """
+        xmin, ymin, xmax, ymax = self.getClusterBounds(self.getCluster(start))
+        isOpen = self.isOpen
+        parents = {start: None}
+        frontier = [start]
+        while frontier and goal not in parents:
+            self.expanded += len(frontier)
+            nextFrontier = []
+            for x, y in frontier:
+                for action, (dx, dy) in MOVES:
+                    nextx, nexty = x + dx, y + dy
+                    if xmin <= nextx <= xmax and ymin <= nexty <= ymax and \
+                       isOpen[nextx][nexty] and (nextx, nexty) not in parents:
+                        parents[(nextx, nexty)] = ((x, y), action)
+                        nextFrontier.append((nextx, nexty))
+            frontier = nextFrontier
+        if goal not in parents:
+            return None
+        actions = []
+        while parents[goal] is not None:
+            goal, action = parents[goal]
+            actions.append(action)
+        actions.reverse()
+        return actions
+
+    def findPath(self, start, goal):
+        """
+        Returns a list of Directions leading from start to goal, or None if
+        goal can't be reached.  The number of cells and abstract nodes
+        searched is left in self.expanded.
+        """
+        self.expanded = 0
+        start, goal = tuple(map(int, start)), tuple(map(int, goal))
+        if start == goal:
+            return []
+
+        # temporary edges joining start and goal to their clusters' entrances
+        startCluster, goalCluster = self.getCluster(start), self.getCluster(goal)
+        startEdges = {}
+        for node, distance in self.clusterDistances(start, startCluster).items():
+            if node in self.edges or node == goal:
+                startEdges[node] = distance
+        goalEdges = {}
+        for node, distance in self.clusterDistances(goal, goalCluster).items():
+            if node in self.edges:
+                goalEdges[node] = distance
+
+        # A* over the abstract graph
+        fringe = util.PriorityQueue()
+        costs = {start: 0}
+        parents = {start: None}
+        closed = set()
+        fringe.push(start, manhattan(start, goal))
+        while not fringe.isEmpty():
+            node = fringe.pop()
+            if node in closed: continue
+            if node == goal: break
+            closed.add(node)
+            self.expanded += 1
+            neighbors = self.edges.get(node, {}).items()
+            if node == start:
+                neighbors = neighbors + startEdges.items()
+            if node in goalEdges:
+                neighbors = neighbors + [(goal, goalEdges[node])]
+            for neighbor, stepCost in neighbors:
+                cost = costs[node] + stepCost
+                if neighbor not in closed and cost < costs.get(neighbor, cost + 1):
+                    costs[neighbor] = cost
+                    parents[neighbor] = node
+                    fringe.push(neighbor, cost + manhattan(neighbor, goal))
+        if goal not in parents:
+            return None
+
+        path = [goal]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return self.refine(path)
+
+    def refine(self, path):
+        "Turns a path of abstract nodes into moves."
+        actions = []
+        for a, b in zip(path[:-1], path[1:]):
+            if self.getCluster(a) != self.getCluster(b):
+                for action, (dx, dy) in MOVES:
+                    if (a[0] + dx, a[1] + dy) == b:
+                        actions.append(action)
+                continue
+            if (a, b) not in self.refined:
+                step = self.clusterPath(a, b)
+                if a not in self.edges or b not in self.edges:
+                    actions.extend(step)
+                    continue
+                self.refined[(a, b)] = step
+            actions.extend(self.refined[(a, b)])
+        return actions
+
+def manhattan(xy1, xy2):
+    return abs(xy1[0] - xy2[0]) + abs(xy1[1] - xy2[1])
+
+#####################################
+# SHARING CLUSTER GRAPHS PER LAYOUT #
+#####################################
+
+graphMap = {}
+
+def getClusterGraph(walls):
+    """
+    Returns the ClusterGraph for a wall Grid, building it only the first
+    time a layout with these walls is seen.
+    """
+    if walls not in graphMap:
+        graphMap[walls] = ClusterGraph(walls)
+    return graphMap[walls]
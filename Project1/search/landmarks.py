@@ -0,0 +1,144 @@
+# landmarks.py
+# ------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a Landmarks object which gives lower bounds on maze
+distances from a few precomputed distance arrays (the ALT heuristic).
+
+Example:
+landmarks = getLandmarks(gameState.getWalls())
+landmarks.getLowerBound( (1,1), (10,10) )
+
+NUM_LANDMARKS cells of the layout are chosen as landmarks, each as far as
+possible from the ones before it, and the maze distance from every landmark
+to every cell is computed once.  By the triangle inequality, the distance
+between two cells is at least the difference of their distances to any
+landmark, so the largest such difference is an admissible and consistent
+estimate of their maze distance that costs O(NUM_LANDMARKS) to evaluate.
+"""
+
+import array
+
+# Number of landmarks chosen per layout
+NUM_LANDMARKS = 8
+
+# Stored for cells a landmark can't reach
+UNREACHABLE = -1
+
+class Landmarks:
+    def __init__(self, walls, numLandmarks=NUM_LANDMARKS):
+        """
+        Chooses landmarks on walls, a Grid, and computes their distance arrays.
+        """
+        self.width = walls.width
+        self.height = walls.height
+        self.isOpen = [not walls[x][y] for x in range(self.width) for y in range(self.height)]
+        cells = [i for i in range(len(self.isOpen)) if self.isOpen[i]]
+
+        # landmarks[i] is the index x * height + y of the i-th landmark and
+        # distances[i][x * height + y] its distance to (x,y)
+        self.landmarks = []
+        self.distances = []
+        if not cells:
+            return
+
+        # each landmark is the cell farthest from the landmarks chosen so far
+        # (the first from an arbitrary cell), and cells none of them can reach
+        # come first.  nearest[cell] is that distance.
+        infinity = len(self.isOpen)
+        nearest = self.computeDistances(cells[0])
+        for cell in cells:
+            if nearest[cell] == UNREACHABLE: nearest[cell] = infinity
+        while len(self.landmarks) < numLandmarks:
+            landmark = max(cells, key=lambda cell: nearest[cell])
+            if nearest[landmark] == 0:
+                break
+            distances = self.computeDistances(landmark)
+            self.landmarks.append(landmark)
+            self.distances.append(distances)
+            for cell in cells:
+                if distances[cell] != UNREACHABLE and distances[cell] < nearest[cell]:
+                    nearest[cell] = distances[cell]
+
+    def computeDistances(self, source):
+        """
+        Breadth first search from the cell with index source.  Returns an
+        array of the distance to every cell, UNREACHABLE for walls and cells
+        that can't be reached.
+        """
+        height = self.height
+        isOpen = self.isOpen
+        distances = array.array('i', [UNREACHABLE]) * len(isOpen)
+        distances[source] = 0
+        frontier = [source]
+        distance = 0
+        while frontier:
+            distance += 1
+            nextFrontier = []
+            for cell in frontier:
+                y = cell % height
+                for neighbor, valid in [(cell + 1, y + 1 < height), (cell - 1, y > 0),
+                                        (cell + height, cell + height < len(isOpen)),
+                                        (cell - height, cell >= height)]:
+                    if valid and isOpen[neighbor] and distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = distance
+                        nextFrontier.append(neighbor)
+            frontier = nextFrontier
+        return distances
+
+    def getLandmarkPositions(self):
+        return [(cell / self.height, cell % self.height) for cell in self.landmarks]
+
+    def getLowerBound(self, pos1, pos2):
+        """
+        Returns a lower bound on the maze distance between two open cells: the
+        largest difference of their distances to a landmark that reaches both,
+        or their Manhattan distance if that is larger.
+        """
+        x1, y1 = int(pos1[0]), int(pos1[1])
+        x2, y2 = int(pos2[0]), int(pos2[1])
+        cell1 = x1 * self.height + y1
+        cell2 = x2 * self.height + y2
+        bound = abs(x1 - x2) + abs(y1 - y2)
+        for distances in self.distances:
+            d1, d2 = distances[cell1], distances[cell2]
+            if d1 == UNREACHABLE or d2 == UNREACHABLE:
+                continue
+            if d1 - d2 > bound:
+                bound = d1 - d2
+            elif d2 - d1 > bound:
+                bound = d2 - d1
+        return bound
+
+################################
+# SHARING LANDMARKS PER LAYOUT #
+################################
+
+landmarkMap = {}
+lastWalls, lastLandmarks = None, None
+
+def getLandmarks(walls):
+    """
+    Returns the Landmarks for a wall Grid, computing them only the first
+    time a layout with these walls is seen.
+    """
+    global lastWalls, lastLandmarks
+    # Heuristics are called with the same wall grid over and over
+    if walls is lastWalls:
+        return lastLandmarks
+    if walls not in landmarkMap:
+        landmarkMap[walls] = Landmarks(walls)
+    lastWalls, lastLandmarks = walls, landmarkMap[walls]
+    return lastLandmarks
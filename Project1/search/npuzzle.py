@@ -0,0 +1,459 @@
+# npuzzle.py
+# ----------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file generalizes eightpuzzle.py to sliding puzzles on any square board
+up to 4x4 (the eight puzzle and the fifteen puzzle), with additive pattern
+database heuristics and a fast IDA* solver.
+
+Example:
+puzzle = createRandomPuzzle(4)
+moves = solvePuzzle(puzzle)
+
+A puzzle's state is a single integer: the tile on cell i (numbered row by
+row, with 0 for the blank) is kept in bits 4i to 4i+3.  In the goal, tile i
+is on cell i.
+
+A pattern database holds, for every placement of a group of tiles, the
+number of moves of those tiles needed to bring them home, ignoring all the
+other tiles.  Moves of the other tiles aren't counted, so the databases of
+a partition of the tiles into disjoint groups can be added up and still
+never overestimate.  Each database is filled in once by a breadth first
+search backwards from the goal, stored as a byte per placement and saved
+to PATTERN_DIRECTORY, so later runs just read it back.
+"""
+
+import copy, os, random, sys, tempfile
+import search
+
+# Moves of the blank, as (name, row change, column change)
+MOVES = [('up', -1, 0), ('down', 1, 0), ('left', 0, -1), ('right', 0, 1)]
+
+# Disjoint groups of tiles with a pattern database each, per board side
+PARTITIONS = {3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+              4: [(1, 4, 5, 8, 9), (2, 3, 6, 7, 10), (11, 12, 13, 14, 15)]}
+
+# Directory where pattern databases are saved between runs, next to the
+# maze distance tables under the user's cache directory ($XDG_CACHE_HOME, or
+# ~/.cache).  Set the PUZZLE_PATTERN_CACHE environment variable to use
+# another directory, or to an empty string to turn the on-disk cache off.
+PATTERN_DIRECTORY = os.environ.get('PUZZLE_PATTERN_CACHE',
+    os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                 'pacman', 'patternDatabases'))
+
+# Stored for placements of a group of tiles that can't occur
+UNSEEN = 0xFF
+
+class Board:
+    """
+    The cells of a side by side board and the moves between them.
+    """
+    def __init__(self, side):
+        if not 2 <= side <= 4:
+            raise Exception, 'Boards must be from 2x2 to 4x4, not %dx%d' % (side, side)
+        self.side = side
+        self.size = side * side
+        # neighbors[cell] lists (move, cell the blank moves to) for a blank on cell
+        self.neighbors = []
+        for cell in range(self.size):
+            row, col = divmod(cell, side)
+            self.neighbors.append([(move, (row + dr) * side + col + dc) for move, dr, dc in MOVES
+                                   if 0 <= row + dr < side and 0 <= col + dc < side])
+        self.goal = sum([tile << 4 * tile for tile in range(self.size)])
+
+boards = {}
+
+def getBoard(side):
+    if side not in boards:
+        boards[side] = Board(side)
+    return boards[side]
+
+class NPuzzleState:
+    """
+    A sliding puzzle on a side by side board, packed into an integer.
+    """
+    def __init__(self, numbers):
+        """
+        numbers lists the tiles row by row, with 0 for the blank.  Like
+        eightpuzzle.EightPuzzleState([1, 0, 2, 3, 4, 5, 6, 7, 8]), and
+        NPuzzleState(range(16)) is the solved fifteen puzzle.
+        """
+        side = int(round(len(numbers) ** 0.5))
+        if sorted(numbers) != range(side * side):
+            raise Exception, 'Not a square puzzle: %s' % str(numbers)
+        self.board = getBoard(side)
+        self.state = sum([tile << 4 * cell for cell, tile in enumerate(numbers)])
+        self.blank = list(numbers).index(0)
+
+    def getNumbers(self):
+        return [self.state >> 4 * cell & 15 for cell in range(self.board.size)]
+
+    def isGoal(self):
+        return self.state == self.board.goal
+
+    def isSolvable(self):
+        """
+        Returns whether the goal can be reached: every move keeps the parity
+        of the number of inversions, plus the blank's row on even boards.
+        """
+        numbers = self.getNumbers()
+        tiles = [tile for tile in numbers if tile]
+        inversions = sum([1 for i in range(len(tiles)) for j in range(i + 1, len(tiles))
+                          if tiles[i] > tiles[j]])
+        if self.board.side % 2 == 1:
+            return inversions % 2 == 0
+        return (inversions + self.blank / self.board.side) % 2 == 0
+
+    def legalMoves(self):
+        return [move for move, cell in self.board.neighbors[self.blank]]
+
+    def result(self, move):
+        "Returns the puzzle after moving the blank up, down, left or right."
+        for name, cell in self.board.neighbors[self.blank]:
+            if name == move:
+                break
+        else:
+            raise Exception, 'Illegal move: %s' % move
+        tile = self.state >> 4 * cell & 15
+        puzzle = copy.copy(self)
+        puzzle.state = self.state - (tile << 4 * cell) + (tile << 4 * self.blank)
+        puzzle.blank = cell
+        return puzzle
+
+    def __eq__(self, other):
+        return isinstance(other, NPuzzleState) and self.state == other.state
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.state)
+
+    def __str__(self):
+        side = self.board.side
+        width = len(str(self.board.size - 1))
+        numbers = [tile and str(tile).rjust(width) or ' ' * width for tile in self.getNumbers()]
+        line = '-' * ((width + 3) * side + 1)
+        lines = [line]
+        for row in range(side):
+            lines.append('| ' + ' | '.join(numbers[row * side:(row + 1) * side]) + ' |')
+            lines.append(line)
+        return '\n'.join(lines)
+
+class NPuzzleSearchProblem(search.SearchProblem):
+    """
+    A SearchProblem for an NPuzzleState.  Each move of the blank costs 1.
+    patternDatabaseHeuristic works as its heuristic.
+    """
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+        self._expanded = 0
+
+    def getStartState(self):
+        return self.puzzle
+
+    def isGoalState(self, state):
+        return state.isGoal()
+
+    def getSuccessors(self, state):
+        self._expanded += 1
+        return [(state.result(move), move, 1) for move in state.legalMoves()]
+
+    def getCostOfActions(self, actions):
+        return len(actions)
+
+def createRandomPuzzle(side, moves=None, rand=random):
+    """
+    Returns a random solvable puzzle on a side by side board: one made by
+    moves random moves from the goal, or one drawn uniformly from all the
+    solvable puzzles if moves is None.
+    """
+    if moves is None:
+        while True:
+            numbers = range(side * side)
+            rand.shuffle(numbers)
+            puzzle = NPuzzleState(numbers)
+            if puzzle.isSolvable():
+                return puzzle
+    puzzle = NPuzzleState(range(side * side))
+    for i in range(moves):
+        puzzle = puzzle.result(rand.choice(puzzle.legalMoves()))
+    return puzzle
+
+#####################
+# PATTERN DATABASES #
+#####################
+
+class PatternDatabase:
+    """
+    The number of moves the tiles of one group need to get home, for every
+    placement of the group.  A placement with tile tiles[i] on cell c[i] is
+    stored at index sum(c[i] * size ** i), so each table takes size **
+    len(tiles) bytes.
+    """
+    def __init__(self, side, tiles):
+        self.board = getBoard(side)
+        self.tiles = tuple(tiles)
+        size = self.board.size
+        self.weights = [size ** i for i in range(len(self.tiles))]
+        self.costs = loadPatternDatabase(self)
+
+    def getIndex(self, positions):
+        "Returns the index of the placement with tiles[i] on cell positions[i]."
+        return sum([cell * weight for cell, weight in zip(positions, self.weights)])
+
+    def getFileName(self):
+        return 'puzzle%d-%s.pdb' % (self.board.side, '-'.join(map(str, self.tiles)))
+
+    def compute(self):
+        """
+        Breadth first search backwards from the goal over placements of the
+        group.  The blank can move freely through cells the group doesn't
+        cover, so a search state is a placement plus the region of those
+        cells the blank is in.
+        """
+        board = self.board
+        size, neighbors = board.size, board.neighbors
+        costs = bytearray([UNSEEN]) * (size ** len(self.tiles))
+
+        # regions[(covered, cell)] is the set of cells the blank can reach
+        # from cell when the group covers the cells in the bit mask covered
+        regions = {}
+        def getRegion(covered, cell):
+            key = (covered, cell)
+            if key not in regions:
+                region = [cell]
+                reached = covered | 1 << cell
+                for current in region:
+                    for move, neighbor in neighbors[current]:
+                        if not reached >> neighbor & 1:
+                            reached |= 1 << neighbor
+                            region.append(neighbor)
+                region = tuple(sorted(region))
+                for current in region:
+                    regions[(covered, current)] = region
+            return regions[key]
+
+        positions = list(self.tiles)
+        covered = sum([1 << cell for cell in positions])
+        index = self.getIndex(positions)
+        region = getRegion(covered, 0)
+        costs[index] = 0
+        seen = set([(index, region[0])])
+        frontier = [(positions, covered, index, region)]
+        cost = 0
+        while frontier:
+            cost += 1
+            nextFrontier = []
+            for positions, covered, index, region in frontier:
+                for cell in region:
+                    # slide any tile of the group next to the blank onto cell,
+                    # which leaves the blank where the tile was
+                    for move, other in neighbors[cell]:
+                        if not covered >> other & 1: continue
+                        i = positions.index(other)
+                        nextIndex = index + (cell - other) * self.weights[i]
+                        nextCovered = covered ^ (1 << cell) ^ (1 << other)
+                        nextRegion = getRegion(nextCovered, other)
+                        key = (nextIndex, nextRegion[0])
+                        if key in seen: continue
+                        seen.add(key)
+                        if costs[nextIndex] == UNSEEN:
+                            costs[nextIndex] = cost
+                        nextPositions = positions[:]
+                        nextPositions[i] = cell
+                        nextFrontier.append((nextPositions, nextCovered, nextIndex, nextRegion))
+            frontier = nextFrontier
+        return costs
+
+def loadPatternDatabase(database):
+    """
+    Returns the costs of a PatternDatabase, reading them from
+    PATTERN_DIRECTORY if an earlier run saved them, and computing and saving
+    them otherwise.
+    """
+    if not PATTERN_DIRECTORY:
+        return database.compute()
+    path = os.path.join(PATTERN_DIRECTORY, database.getFileName())
+    size = database.board.size ** len(database.tiles)
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        f = open(path, 'rb')
+        try:
+            return bytearray(f.read())
+        finally:
+            f.close()
+    costs = database.compute()
+    try:
+        if not os.path.isdir(PATTERN_DIRECTORY):
+            os.makedirs(PATTERN_DIRECTORY)
+        # written to a temporary file and renamed, so no reader sees half of it
+        fd, tempPath = tempfile.mkstemp(dir=PATTERN_DIRECTORY)
+        f = os.fdopen(fd, 'wb')
+        try:
+            f.write(costs)
+        finally:
+            f.close()
+        os.rename(tempPath, path)
+    except (IOError, OSError):
+        pass
+    return costs
+
+databaseMap = {}
+
+def getPatternDatabases(side, partition=None):
+    """
+    Returns the PatternDatabases for a partition of the tiles of a side by
+    side board (PARTITIONS[side] by default), loading each only once.
+    """
+    if partition is None:
+        partition = PARTITIONS[side]
+    key = (side, tuple(map(tuple, partition)))
+    if key not in databaseMap:
+        databaseMap[key] = [PatternDatabase(side, tiles) for tiles in partition]
+    return databaseMap[key]
+
+def getPatternCost(puzzle, databases):
+    "Returns the sum of the pattern database costs of a puzzle."
+    numbers = puzzle.getNumbers()
+    cells = [0] * len(numbers)
+    for cell, tile in enumerate(numbers):
+        cells[tile] = cell
+    return sum([database.costs[database.getIndex([cells[tile] for tile in database.tiles])]
+                for database in databases])
+
+def patternDatabaseHeuristic(state, problem):
+    """
+    An admissible and consistent heuristic for the NPuzzleSearchProblem:
+    the sum of the additive pattern databases of the board.
+    """
+    return getPatternCost(state, getPatternDatabases(state.board.side))
+
+###################
+# SOLVING PUZZLES #
+###################
+
+def solvePuzzle(puzzle, databases=None):
+    """
+    Returns a shortest list of moves solving puzzle, found with IDA* using
+    the additive pattern databases (those of PARTITIONS by default).
+
+    The heuristic is the larger of the databases' sum for the puzzle and for
+    its reflection in the main diagonal: the goal is its own reflection, so
+    both are admissible.  This doesn't go through
+    search.iterativeDeepeningAStarSearch: instead of building a state per
+    node, it moves tiles on one board in place and updates both sums from
+    the database each holds the moved tile in.  The number of nodes expanded
+    is left in solvePuzzle.expanded.
+    """
+    if not puzzle.isSolvable():
+        raise Exception, 'The puzzle can not be solved:\n%s' % puzzle
+    board = puzzle.board
+    if databases is None:
+        databases = getPatternDatabases(board.side)
+    side, neighbors = board.side, board.neighbors
+    tiles = puzzle.getNumbers()
+    goal = range(board.size)
+    # mirror[cell] is the cell's reflection in the main diagonal.  Tile t on
+    # cell c of the puzzle is tile mirror[t] on cell mirror[c] of the
+    # reflected puzzle.
+    mirror = [cell % side * side + cell / side for cell in range(board.size)]
+
+    # group[tile] is the number of the database holding tile and weight[tile]
+    # how much its cell counts in that database's index; mirrorGroup and
+    # mirrorWeight are the same for the reflected puzzle
+    group = [None] * board.size
+    weight = [0] * board.size
+    for number, database in enumerate(databases):
+        for tile, tileWeight in zip(database.tiles, database.weights):
+            group[tile], weight[tile] = number, tileWeight
+    mirrorGroup = [group[mirror[tile]] for tile in goal]
+    mirrorWeight = [weight[mirror[tile]] for tile in goal]
+    costs = [database.costs for database in databases]
+    indices = [0] * len(databases)
+    mirrorIndices = [0] * len(databases)
+    for cell, tile in enumerate(tiles):
+        if group[tile] is not None:
+            indices[group[tile]] += cell * weight[tile]
+        if mirrorGroup[tile] is not None:
+            mirrorIndices[mirrorGroup[tile]] += mirror[cell] * mirrorWeight[tile]
+    estimate = sum([costs[i][indices[i]] for i in range(len(databases))])
+    mirrorEstimate = sum([costs[i][mirrorIndices[i]] for i in range(len(databases))])
+
+    moves = []
+    solvePuzzle.expanded = 0
+
+    def expand(blank, cost, estimate, mirrorEstimate, bound, previous):
+        "Returns the smallest f past the bound, or None once moves holds a solution."
+        if estimate == 0 and tiles == goal:
+            return None
+        solvePuzzle.expanded += 1
+        smallest = INFINITY
+        for move, cell in neighbors[blank]:
+            # never undo the last move
+            if cell == previous: continue
+            tile = tiles[cell]
+            # tiles not in any database cost nothing to move
+            number = group[tile]
+            nextEstimate = estimate
+            if number is not None:
+                index = indices[number]
+                nextIndex = index + (blank - cell) * weight[tile]
+                nextEstimate += costs[number][nextIndex] - costs[number][index]
+            mirrorNumber = mirrorGroup[tile]
+            nextMirrorEstimate = mirrorEstimate
+            if mirrorNumber is not None:
+                mirrorIndex = mirrorIndices[mirrorNumber]
+                nextMirrorIndex = mirrorIndex + (mirror[blank] - mirror[cell]) * mirrorWeight[tile]
+                nextMirrorEstimate += costs[mirrorNumber][nextMirrorIndex] - costs[mirrorNumber][mirrorIndex]
+            f = cost + 1 + max(nextEstimate, nextMirrorEstimate)
+            if f > bound:
+                if f < smallest: smallest = f
+                continue
+            tiles[blank], tiles[cell] = tile, 0
+            if number is not None: indices[number] = nextIndex
+            if mirrorNumber is not None: mirrorIndices[mirrorNumber] = nextMirrorIndex
+            moves.append(move)
+            result = expand(cell, cost + 1, nextEstimate, nextMirrorEstimate, bound, blank)
+            if result is None:
+                return None
+            moves.pop()
+            tiles[blank], tiles[cell] = 0, tile
+            if number is not None: indices[number] = index
+            if mirrorNumber is not None: mirrorIndices[mirrorNumber] = mirrorIndex
+            if result < smallest: smallest = result
+        return smallest
+
+    bound = max(estimate, mirrorEstimate)
+    while True:
+        result = expand(tiles.index(0), 0, estimate, mirrorEstimate, bound, None)
+        if result is None:
+            return moves
+        bound = result
+
+INFINITY = float('inf')
+
+if __name__ == '__main__':
+    import time
+    side = len(sys.argv) > 1 and int(sys.argv[1]) or 4
+    start = time.time()
+    databases = getPatternDatabases(side)
+    print('Pattern databases ready in %.1f seconds' % (time.time() - start))
+    puzzle = createRandomPuzzle(side)
+    print('A random puzzle:')
+    print(puzzle)
+    start = time.time()
+    moves = solvePuzzle(puzzle, databases)
+    print('IDA* found a path of %d moves in %.1f seconds, expanding %d nodes: %s' %
+          (len(moves), time.time() - start, solvePuzzle.expanded, ' '.join(moves)))
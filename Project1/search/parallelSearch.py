@@ -0,0 +1,215 @@
+# parallelSearch.py
+# -----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains hash distributed A* (HDA*), which spreads one A* search
+over several worker processes.
+
+Example:
+actions = hashDistributedAStarSearch(problem, heuristic, numWorkers=4)
+
+Every state belongs to worker hash(state) % numWorkers, which keeps the
+open list and the table of best costs and parents for the states it owns.
+Successors that belong to other workers are collected into one batch per
+worker, along with their heuristic values, and sent straight to that
+worker's inbox at the end of the round.
+
+Rounds run in lockstep under the calling process, which learns after each
+round how many batches are on their way to every worker and tells each
+worker how many to wait for before its next round.  Workers also report
+the lowest f among their open nodes and the nodes they sent, and in the
+next round only expand nodes with that lowest f over all workers (at most
+ROUND_EXPANSIONS of them), so they expand about the same nodes A* would
+rather than running ahead on nodes A* would never reach.  Nor do they
+expand nodes whose f isn't below the cheapest goal found so far.  The
+search ends after a round in which no batch was sent and every open list
+is empty or holds nothing cheaper than that goal.  No node that could lead
+to a cheaper goal is left anywhere then, so with an admissible heuristic
+the solution is optimal, as with aStarSearch.
+
+Workers are forked from the calling process, so they start with their own
+copies of the problem and heuristic and nothing needs to be pickled but the
+states in the batches.  States must hash the same way in every process.
+"""
+
+import heapq, multiprocessing
+
+# Nodes a worker expands per round before exchanging batches
+ROUND_EXPANSIONS = 200
+
+INFINITY = float('inf')
+
+class Worker:
+    """
+    The part of the search owned by one process: the states whose hash
+    picks this worker.
+    """
+    def __init__(self, number, numWorkers, problem, heuristic, inboxes):
+        self.number = number
+        self.numWorkers = numWorkers
+        self.problem = problem
+        self.heuristic = heuristic
+        self.inboxes = inboxes
+        # heap of (f, -g, count, state); count keeps states from being compared
+        self.openList = []
+        self.count = 0
+        # costs[state] is the cheapest g found for state and parents[state] the
+        # (parent state, action) it was reached by
+        self.costs = {}
+        self.parents = {}
+        self.estimates = {}
+        self.expanded = 0
+
+    def add(self, state, cost, estimate, parent, action):
+        "Records a path to a state this worker owns, if it is the cheapest so far."
+        if state in self.costs and self.costs[state] <= cost:
+            return
+        self.costs[state] = cost
+        self.parents[state] = (parent, action)
+        self.count += 1
+        heapq.heappush(self.openList, (cost + estimate, -cost, self.count, state))
+
+    def getEstimate(self, state):
+        if state not in self.estimates:
+            self.estimates[state] = self.heuristic(state, self.problem)
+        return self.estimates[state]
+
+    def runRound(self, goalCost, limit, numBatches):
+        """
+        Adds the nodes of numBatches batches from the inbox and then expands
+        nodes with f at most limit and below goalCost.  Returns the number of
+        batches sent to each worker, the cheapest (cost, goal) found or None,
+        the lowest f left open or sent and the number of nodes expanded.
+        """
+        for i in range(numBatches):
+            for node in self.inboxes[self.number].get():
+                self.add(*node)
+
+        batches = [[] for i in range(self.numWorkers)]
+        found = None
+        expanded = 0
+        lowest = INFINITY
+        openList = self.openList
+        while openList and expanded < ROUND_EXPANSIONS:
+            f, negativeCost, count, state = openList[0]
+            if f > limit or f >= goalCost:
+                break
+            heapq.heappop(openList)
+            cost = -negativeCost
+            # skip nodes a cheaper path has replaced
+            if cost > self.costs[state]:
+                continue
+            if self.problem.isGoalState(state):
+                found = (cost, state)
+                goalCost = cost
+                continue
+            expanded += 1
+            for successor, action, stepCost in self.problem.getSuccessors(state):
+                successorCost = cost + stepCost
+                estimate = self.getEstimate(successor)
+                owner = hash(successor) % self.numWorkers
+                if owner == self.number:
+                    self.add(successor, successorCost, estimate, state, action)
+                else:
+                    batches[owner].append((successor, successorCost, estimate, state, action))
+                    lowest = min(lowest, successorCost + estimate)
+
+        sent = [0] * self.numWorkers
+        for owner, batch in enumerate(batches):
+            if batch:
+                self.inboxes[owner].put(batch)
+                sent[owner] = 1
+        if openList:
+            lowest = min(lowest, openList[0][0])
+        self.expanded += expanded
+        return sent, found, lowest, expanded
+
+def runWorker(worker, connection):
+    "Serves the requests of the calling process until it sends 'stop'."
+    while True:
+        request = connection.recv()
+        if request[0] == 'round':
+            connection.send(worker.runRound(*request[1:]))
+        elif request[0] == 'parent':
+            connection.send(worker.parents[request[1]])
+        else:
+            break
+
+def hashDistributedAStarSearch(problem, heuristic, numWorkers=None):
+    """
+    Returns an optimal list of actions for problem, like aStarSearch, found
+    by numWorkers processes (one per CPU by default).  The nodes expanded
+    by all workers are counted in problem._expanded.
+    """
+    if numWorkers is None:
+        numWorkers = multiprocessing.cpu_count()
+    inboxes = [multiprocessing.Queue() for i in range(numWorkers)]
+    connections = []
+    processes = []
+    for number in range(numWorkers):
+        connection, workerConnection = multiprocessing.Pipe()
+        worker = Worker(number, numWorkers, problem, heuristic, inboxes)
+        process = multiprocessing.Process(target=runWorker, args=(worker, workerConnection))
+        process.daemon = True
+        process.start()
+        connections.append(connection)
+        processes.append(process)
+
+    try:
+        start = problem.getStartState()
+        owner = hash(start) % numWorkers
+        lowest = heuristic(start, problem)
+        inboxes[owner].put([(start, 0, lowest, None, None)])
+        pending = [0] * numWorkers
+        pending[owner] = 1
+
+        goalCost, goal = INFINITY, None
+        expanded = 0
+        while True:
+            for number, connection in enumerate(connections):
+                connection.send(('round', goalCost, lowest, pending[number]))
+            pending = [0] * numWorkers
+            lowest = INFINITY
+            for connection in connections:
+                sent, found, workerLowest, workerExpanded = connection.recv()
+                pending = [a + b for a, b in zip(pending, sent)]
+                if found is not None and found[0] < goalCost:
+                    goalCost, goal = found
+                lowest = min(lowest, workerLowest)
+                expanded += workerExpanded
+            if sum(pending) == 0 and lowest >= goalCost:
+                break
+        problem._expanded += expanded
+
+        if goal is None:
+            print "SHEESH, we have failed."
+            return None
+        # follow the parent pointers back to the start, asking each state's owner
+        actions = []
+        state = goal
+        while True:
+            connections[hash(state) % numWorkers].send(('parent', state))
+            parent, action = connections[hash(state) % numWorkers].recv()
+            if parent is None:
+                break
+            actions.append(action)
+            state = parent
+        actions.reverse()
+        return actions
+    finally:
+        for connection in connections:
+            connection.send(('stop',))
+        for process in processes:
+            process.join()
@@ -20,6 +20,11 @@ by Pacman agents (in searchAgents.py).
 
 import util
 
+# Set to True to cross-check the path costs accumulated from getSuccessors
+# against problem.getCostOfActions during search (slow; for debugging
+# search problems whose step costs may be inconsistent)
+CHECK_PATH_COSTS = False
+
 class SearchProblem:
     """
     This class outlines the structure of a search problem, but doesn't implement
@@ -74,6 +79,115 @@ def tinyMazeSearch(problem):
     w = Directions.WEST
     return  [s,s,w,s,w,w,s,w]
 
+def graphSearch(problem, fringe, priorityFunction=None, checkCosts=None):
+    """
+    Generic graph search shared by all of the search functions below.
+
+    Search nodes live in a table of (state, parent, action, cost) entries,
+    where parent is the index of the node that was expanded to reach state
+    and cost is the path cost g, accumulated from the stepCost returned by
+    getSuccessors.  The fringe only holds indices into that table, so pushing
+    a successor is O(1) and the action list is rebuilt from the parent
+    pointers once, when a goal is dequeued.  Expanded states are kept in a
+    set so the closed-set test is a hash lookup.
+
+    When the fringe is a util.IndexedPriorityQueue it is keyed by state
+    instead: rediscovering a queued state lowers its priority if the new path
+    is better and is dropped otherwise, so the fringe never holds more
+    entries than there are distinct states.
+
+    fringe:           an empty util.Stack, util.Queue, util.PriorityQueue or
+                      util.IndexedPriorityQueue
+    priorityFunction: (state, cost) -> priority; required when fringe is
+                      a priority queue and None otherwise
+    checkCosts:       if true, every accumulated cost is cross-checked against
+                      problem.getCostOfActions and the latter wins when they
+                      disagree.  Defaults to CHECK_PATH_COSTS.
+    """
+    if checkCosts is None:
+        checkCosts = CHECK_PATH_COSTS
+    warned = False
+
+    # for an indexed fringe, maps each queued state to its best node so far
+    indexed = isinstance(fringe, util.IndexedPriorityQueue)
+    best = {}
+
+    startState = problem.getStartState()
+    nodes = [(startState, None, None, 0)]
+    if priorityFunction is None:
+        fringe.push(0)
+    elif indexed:
+        fringe.push(startState, 0)
+        best[startState] = 0
+    else:
+        fringe.push(0, 0)
+
+    # states we have already expanded
+    closed = set()
+
+    while not fringe.isEmpty():
+        if indexed:
+            index = best.pop(fringe.pop())
+        else:
+            index = fringe.pop()
+        state, _, _, cost = nodes[index]
+
+        # if this node is a goal state, walk the parent pointers back to the start
+        if problem.isGoalState(state):
+            return reconstructPath(nodes, index)
+
+        # if we already expanded this state, we don't wanna explore it anymore
+        if state in closed:
+            continue
+        closed.add(state)
+
+        # push every successor we haven't expanded yet into the fringe
+        for successor, action, stepCost in problem.getSuccessors(state):
+            if successor in closed:
+                continue
+            successorCost = cost + stepCost
+            if checkCosts:
+                actualCost = problem.getCostOfActions(reconstructPath(nodes, index) + [action])
+                if actualCost != successorCost:
+                    if not warned:
+                        print 'Warning: step costs do not add up to getCostOfActions (%s != %s)' % (successorCost, actualCost)
+                        warned = True
+                    successorCost = actualCost
+
+            if priorityFunction is None:
+                nodes.append((successor, index, action, successorCost))
+                fringe.push(len(nodes) - 1)
+                continue
+
+            priority = priorityFunction(successor, successorCost)
+            if indexed:
+                # keep the queued path unless this one is strictly better
+                if fringe.contains(successor) and fringe.getPriority(successor) <= priority:
+                    continue
+                nodes.append((successor, index, action, successorCost))
+                best[successor] = len(nodes) - 1
+                fringe.update(successor, priority)
+            else:
+                nodes.append((successor, index, action, successorCost))
+                fringe.push(len(nodes) - 1, priority)
+
+    # we exhausted all paths and couldn't find the goal
+    print "SHEESH, we have failed."
+    return None
+
+def reconstructPath(nodes, index):
+    """
+    Returns the list of actions leading from the start node to nodes[index]
+    by following the parent pointers stored in the node table.
+    """
+    actions = []
+    parent, action = nodes[index][1:3]
+    while parent is not None:
+        actions.append(action)
+        parent, action = nodes[parent][1:3]
+    actions.reverse()
+    return actions
+
 def depthFirstSearch(problem):
     """
     Search the deepest nodes in the search tree first
@@ -88,180 +202,890 @@ def depthFirstSearch(problem):
     print "Is the start a goal?", problem.isGoalState(problem.getStartState())
     print "Start's successors:", problem.getSuccessors(problem.getStartState())
     """
+    return graphSearch(problem, util.Stack())
 
-    # fringe consists of lists of nodes of form ((x,y), path)
-    #  where path is list of actions from start
-    fringe = util.Stack()
-    fringe.push((problem.getStartState(), []))
+def breadthFirstSearch(problem):
+    """
+    Search the shallowest nodes in the search tree first.
+    """
+    return graphSearch(problem, util.Queue())
 
-    # keep list of locations we have visited
-    visited = []
+def uniformCostSearch(problem):
+    "Search the node of least total cost first. "
+    return graphSearch(problem, util.IndexedPriorityQueue(),
+                       lambda state, cost: cost)
 
-    while True:
-        # if empty, we exhausted all paths and couldn't find goal
-        if fringe.isEmpty():
-            print "SHEESH, we have failed."
-            return
+def nullHeuristic(state, problem=None):
+    """
+    A heuristic function estimates the cost from the current state to the nearest
+    goal in the provided SearchProblem.  This heuristic is trivial.
+    """
+    return 0
 
-        node = fringe.pop()
-        state = node[0]
-        actions = node[1]
+def aStarSearch(problem, heuristic=nullHeuristic):
+    "Search the node that has the lowest combined cost and heuristic first."
+    return graphSearch(problem, util.IndexedPriorityQueue(),
+                       lambda state, cost: cost + heuristic(state, problem))
 
-        # if final location in path is goal state, return the path
-        if problem.isGoalState(state):
-            # print "Oh yeah, we have success."
-            print actions
+def jumpPointSearch(problem, heuristic=nullHeuristic):
+    """
+    A* over jump points, for grid problems with unit step costs such as
+    PositionSearchProblem with the default costFn or AnyFoodSearchProblem.
+
+    This is the 4-connected variant of Jump Point Search.  Instead of pushing
+    every neighbor, each expanded cell jumps in a straight line until it
+    reaches a goal or a cell with a forced neighbor (an open cell beside the
+    line that could not be reached as cheaply without passing through it).
+    Vertical jumps also stop where a horizontal jump would find such a cell.
+    Only these jump points enter the fringe, so the many symmetric paths
+    through open areas are never expanded, but the path is still optimal.
+
+    States must be (x,y) positions and problem.walls the wall Grid.  Every
+    expanded jump point is counted in problem._expanded.
+    """
+    from game import Actions
+    walls = problem.walls
+    isGoalState = problem.isGoalState
+
+    def jumpHorizontally(x, y, dx):
+        while not walls[x][y]:
+            if isGoalState((x, y)):
+                return (x, y)
+            if (not walls[x][y+1] and walls[x-dx][y+1]) or \
+               (not walls[x][y-1] and walls[x-dx][y-1]):
+                return (x, y)
+            x += dx
+        return None
+
+    def jumpVertically(x, y, dy):
+        while not walls[x][y]:
+            if isGoalState((x, y)):
+                return (x, y)
+            if (not walls[x+1][y] and walls[x+1][y-dy]) or \
+               (not walls[x-1][y] and walls[x-1][y-dy]):
+                return (x, y)
+            if jumpHorizontally(x+1, y, 1) or jumpHorizontally(x-1, y, -1):
+                return (x, y)
+            y += dy
+        return None
+
+    def jumpPoints(position, parent):
+        x, y = position
+        if parent is None:
+            directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        elif parent[0] != x:
+            dx = cmp(x, parent[0])
+            directions = [(dx, 0), (0, 1), (0, -1)]
+        else:
+            dy = cmp(y, parent[1])
+            directions = [(0, dy), (1, 0), (-1, 0)]
+        points = []
+        for dx, dy in directions:
+            if dx != 0:
+                point = jumpHorizontally(x + dx, y, dx)
+            else:
+                point = jumpVertically(x, y + dy, dy)
+            if point is not None:
+                points.append(point)
+        return points
+
+    trackVisited = '_visited' in dir(problem)
+    start = problem.getStartState()
+    parents, costs = {start: None}, {start: 0}
+    fringe = util.IndexedPriorityQueue()
+    fringe.push(start, heuristic(start, problem))
+    closed = set()
+
+    while not fringe.isEmpty():
+        position = fringe.pop()
+        if isGoalState(position):
+            # walk back through the jump points, filling in the straight runs between them
+            actions = []
+            while parents[position] is not None:
+                parent = parents[position]
+                dx, dy = cmp(position[0], parent[0]), cmp(position[1], parent[1])
+                steps = abs(position[0] - parent[0]) + abs(position[1] - parent[1])
+                actions.extend([Actions.vectorToDirection((dx, dy))] * steps)
+                position = parent
+            actions.reverse()
             return actions
+        closed.add(position)
 
-        # if we already visited this location, we don't wanna explore it anymore
-        if state in visited:
-            continue
+        # the same bookkeeping getSuccessors does for SearchAgent and the display
+        problem._expanded += 1
+        if trackVisited and position not in problem._visited:
+            problem._visited[position] = True
+            problem._visitedlist.append(position)
 
-        # get all of the next possible moves, push them into the fringe
-        successors = problem.getSuccessors(state)
-        for successor in successors:
-            new_actions = list(actions)
-            new_actions.append(successor[1])
-            new_node = (successor[0], new_actions)
-            fringe.push(new_node)
+        for point in jumpPoints(position, parents[position]):
+            if point in closed:
+                continue
+            cost = costs[position] + abs(point[0] - position[0]) + abs(point[1] - position[1])
+            if point not in costs or cost < costs[point]:
+                costs[point] = cost
+                parents[point] = position
+                fringe.update(point, cost + heuristic(point, problem))
 
-        # mark current location as visited
-        visited.append(state)
+    print "SHEESH, we have failed."
+    return None
 
-def breadthFirstSearch(problem):
+def bidirectionalSearch(problem):
     """
-    Search the shallowest nodes in the search tree first.
+    Breadth first search from the start and the goal at the same time, for
+    problems with a single goal state problem.goal, unit step costs and
+    reversible moves, such as PositionSearchProblem.
+
+    Each round expands a whole layer of the smaller frontier, or of the side
+    that has expanded fewer layers when the frontiers are the same size, so
+    that even in a corridor both sides advance.  The search stops as soon as
+    a successor is found that the other side has already reached.  Because
+    both sides grow in complete layers, that first meeting point lies on a
+    shortest path.  Each side only has to reach about half the solution
+    depth.  On a grid, where the number of cells within a distance
+    grows with its square, that is about half the expansions of a one-sided
+    breadth first search; in branching state spaces the saving is far larger.
+
+    Successors of the goal side are generated with getSuccessors, so moves
+    must be legal in both directions (true for Pacman's walls).
+    """
+    from game import Actions
+    start, goal = problem.getStartState(), problem.goal
+    if problem.isGoalState(start):
+        return []
+
+    # state -> (state it was reached from, action joining the two) for each side
+    forward, backward = {start: (None, None)}, {goal: (None, None)}
+    forwardLayer, backwardLayer = [start], [goal]
+    # layers expanded by each side; equal frontiers go to the shallower side
+    forwardDepth, backwardDepth = 0, 0
+    meeting = None
+
+    while meeting is None and forwardLayer and backwardLayer:
+        if (len(forwardLayer), forwardDepth) <= (len(backwardLayer), backwardDepth):
+            reached, other, layer = forward, backward, forwardLayer
+        else:
+            reached, other, layer = backward, forward, backwardLayer
+        nextLayer = []
+        for state in layer:
+            for successor, action, stepCost in problem.getSuccessors(state):
+                if successor in reached:
+                    continue
+                reached[successor] = (state, action)
+                if successor in other:
+                    meeting = successor
+                    break
+                nextLayer.append(successor)
+            if meeting is not None:
+                break
+        if reached is forward:
+            forwardLayer = nextLayer
+            forwardDepth += 1
+        else:
+            backwardLayer = nextLayer
+            backwardDepth += 1
+
+    if meeting is None:
+        print "SHEESH, we have failed."
+        return None
+
+    # actions from the start to the meeting point...
+    actions = []
+    state = meeting
+    while forward[state][0] is not None:
+        state, action = forward[state]
+        actions.append(action)
+    actions.reverse()
+    # ...followed by the goal side's moves, reversed, from there to the goal
+    state = meeting
+    while backward[state][0] is not None:
+        state, action = backward[state]
+        actions.append(Actions.reverseDirection(action))
+    return actions
+
+def hierarchicalSearch(problem):
+    """
+    Hierarchical pathfinding (HPA*) for PositionSearchProblem with the
+    default costFn on large layouts.
+
+    The layout's walls are cut into clusters whose entrance-to-entrance
+    distances are precomputed once per layout (hierarchicalPathfinding.py).
+    Each query plans on that abstract graph and only then searches inside
+    the few clusters the plan passes through.  Because paths change clusters
+    only at entrances, they can be slightly longer than the shortest path.
+
+    Uses problem.walls and problem.goal.  The cells and abstract nodes
+    searched by the query are counted in problem._expanded.
+    """
+    import hierarchicalPathfinding
+    graph = hierarchicalPathfinding.getClusterGraph(problem.walls)
+    actions = graph.findPath(problem.getStartState(), problem.goal)
+    problem._expanded += graph.expanded
+    if actions is None:
+        print "SHEESH, we have failed."
+    return actions
+
+# The suboptimality bound w weightedAStarSearch, focalSearch and
+# explicitEstimationSearch use when they aren't given one
+SUBOPTIMALITY_BOUND = 1.5
+
+def weightedAStarSearch(problem, heuristic=nullHeuristic, weight=None):
+    """
+    A* ordered by cost + weight * heuristic.  With a consistent heuristic the
+    path costs at most weight times the optimal cost; that bound is stored
+    in problem._suboptimalityBound.
+    """
+    if weight is None:
+        weight = SUBOPTIMALITY_BOUND
+    actions = graphSearch(problem, util.IndexedPriorityQueue(),
+                          lambda state, cost: cost + weight * heuristic(state, problem))
+    if actions is not None:
+        problem._suboptimalityBound = weight
+    return actions
+
+class FocalNode:
+    "A search node of focalSearch and explicitEstimationSearch."
+    def __init__(self, state, parent, action, cost, estimate):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.cost = cost
+        self.estimate = estimate
+        self.f = cost + estimate
+        # cleared once the node is expanded or a cheaper path to its state is found
+        self.isOpen = True
+
+    def getActions(self):
+        actions = []
+        node = self
+        while node.parent is not None:
+            actions.append(node.action)
+            node = node.parent
+        actions.reverse()
+        return actions
+
+class FocalList:
+    """
+    The open nodes of a focal search, in three heaps: all of them by f, all
+    of them by a second key, and those whose second key is within a limit by
+    a third key (the focal list).  Closed nodes are dropped lazily when they
+    reach the top of a heap.
+    """
+    def __init__(self, pendingKey, focalKey):
+        self.pendingKey = pendingKey
+        self.focalKey = focalKey
+        self.byF = []
+        # nodes not moved into focal yet, by pendingKey
+        self.pending = []
+        self.byPendingKey = []
+        self.focal = []
+        self.count = 0
+
+    def push(self, node):
+        import heapq
+        self.count += 1
+        heapq.heappush(self.byF, (node.f, self.count, node))
+        heapq.heappush(self.pending, (self.pendingKey(node), self.count, node))
+        heapq.heappush(self.byPendingKey, (self.pendingKey(node), self.count, node))
+
+    def getTop(self, heap):
+        "Returns the top open node of heap, or None if it has none."
+        import heapq
+        while heap and not heap[0][-1].isOpen:
+            heapq.heappop(heap)
+        if heap:
+            return heap[0][-1]
+        return None
+
+    def getLowestF(self):
+        return self.getTop(self.byF)
+
+    def getLowestPendingKey(self):
+        return self.getTop(self.byPendingKey)
+
+    def getFocalTop(self, limit):
+        """
+        Returns the open node with the lowest focalKey among those whose
+        pendingKey is at most limit, or None if there are none.
+        """
+        import heapq
+        while self.pending and self.pending[0][0] <= limit:
+            key, count, node = heapq.heappop(self.pending)
+            if node.isOpen:
+                heapq.heappush(self.focal, (self.focalKey(node), count, node))
+        while True:
+            node = self.getTop(self.focal)
+            # the limit drops when cheaper nodes are found
+            if node is None or self.pendingKey(node) <= limit:
+                return node
+            key, count, node = heapq.heappop(self.focal)
+            heapq.heappush(self.pending, (self.pendingKey(node), count, node))
+
+def expandFocalNode(problem, node, heuristic, best, openNodes, estimate=None):
+    """
+    Pushes the successors of node into openNodes, a FocalList, unless a path
+    to them at least as cheap is known.  best maps every state to its
+    cheapest node; a cheaper path replaces the old node, even a closed one.
+    Returns the new nodes.
     """
-    
-    # fringe consists of lists of nodes of form ((x,y), path)
-    #  where path is list of actions from start
-    fringe = util.Queue()
-    fringe.push((problem.getStartState(), []))
+    node.isOpen = False
+    children = []
+    for successor, action, stepCost in problem.getSuccessors(node.state):
+        cost = node.cost + stepCost
+        if successor in best:
+            if best[successor].cost <= cost:
+                continue
+            best[successor].isOpen = False
+        child = FocalNode(successor, node, action, cost, heuristic(successor, problem))
+        if estimate is not None:
+            estimate(child)
+        best[successor] = child
+        openNodes.push(child)
+        children.append(child)
+    return children
 
-    # keep list of locations we have visited
-    visited = []
+def getAchievedBound(cost, lowestF, weight):
+    """
+    Returns how many times the optimal cost a path of cost can be at most,
+    given that no open node had f below lowestF and the search kept to weight.
+    """
+    if lowestF <= 0:
+        return weight
+    return min(weight, cost / float(lowestF))
 
+def focalSearch(problem, heuristic=nullHeuristic, weight=None):
+    """
+    Focal search (A*epsilon) with suboptimality bound weight.
+
+    Of the open nodes whose f = cost + heuristic is at most weight times the
+    lowest f, it expands the one with the lowest heuristic, the one that
+    looks closest to a goal.  With an admissible heuristic the lowest f is
+    never more than the optimal cost, so the path costs at most weight times
+    the optimal.  The ratio of its cost to the lowest f when it was found,
+    which can be tighter than weight, is stored in
+    problem._suboptimalityBound.
+    """
+    if weight is None:
+        weight = SUBOPTIMALITY_BOUND
+    start = problem.getStartState()
+    startNode = FocalNode(start, None, None, 0, heuristic(start, problem))
+    best = {start: startNode}
+    openNodes = FocalList(lambda node: node.f, lambda node: (node.estimate, -node.cost))
+    openNodes.push(startNode)
     while True:
-        # if empty, we exhausted all paths and couldn't find goal
-        if fringe.isEmpty():
+        lowest = openNodes.getLowestF()
+        if lowest is None:
             print "SHEESH, we have failed."
-            return
+            return None
+        # the node with the lowest f is always in the focal list
+        node = openNodes.getFocalTop(weight * lowest.f)
+        if problem.isGoalState(node.state):
+            problem._suboptimalityBound = getAchievedBound(node.cost, lowest.f, weight)
+            return node.getActions()
+        expandFocalNode(problem, node, heuristic, best, openNodes)
 
-        node = fringe.pop()
-        state = node[0]
-        actions = node[1]
+def explicitEstimationSearch(problem, heuristic=nullHeuristic, weight=None):
+    """
+    Explicit Estimation Search (Thayer and Ruml) with suboptimality bound
+    weight.
 
-        # if final location in path is goal state, return the path
-        if problem.isGoalState(state):
-            # print "Oh yeah, we have success."
-            return actions
+    The heuristic is admissible, so usually too low.  EES learns how much
+    too low while it searches: for each expanded node it compares the
+    heuristic with the step to its best child plus the child's heuristic,
+    and averages these one-step errors.  Each new node then gets a
+    corrected estimate of its cost to go, hhat, and of its number of steps
+    to go, dhat, with the heuristic itself as the uncorrected step count.
+    fhat = cost + hhat.
 
-        # if we already visited this state, we don't wanna explore it anymore
-        if state in visited:
-            continue
+    Nodes are selected by the published rule (selectNode in the paper),
+    with bestF the open node with the lowest f, bestFhat the one with the
+    lowest fhat and bestDhat the one with the lowest dhat among those whose
+    fhat is at most weight * fhat(bestFhat):
 
-        # get all of the next possible moves, push them into the fringe
-        successors = problem.getSuccessors(state)
-        for successor in successors:
-            new_actions = list(actions)
-            new_actions.append(successor[1])
-            new_node = (successor[0], new_actions)
-            fringe.push(new_node)
+        if fhat(bestDhat) <= weight * f(bestF): expand bestDhat
+        elif fhat(bestFhat) <= weight * f(bestF): expand bestFhat
+        else: expand bestF
 
-        # mark current location as visited
-        visited.append(state)
+    The corrected fhat of the candidate is checked against the admissible f
+    of bestF.  A goal has a heuristic of 0, so its dhat is 0 and its fhat is
+    its cost: a goal is only selected if it costs at most weight * f(bestF),
+    or if it is bestF, and f(bestF) is never more than the optimal cost.
+    Like focalSearch, the path therefore costs at most weight times the
+    optimal, and the achieved bound is stored in
+    problem._suboptimalityBound.
+    """
+    if weight is None:
+        weight = SUBOPTIMALITY_BOUND
+    # running sums of the one-step errors of the heuristic and step count
+    errors = {'cost': 0.0, 'steps': 0.0, 'samples': 0}
 
-def uniformCostSearch(problem):
-    "Search the node of least total cost first. "
+    def estimate(node):
+        samples = max(errors['samples'], 1)
+        costError = errors['cost'] / samples
+        # each step needs 1 / (1 - stepError) steps in fact; keep that finite
+        stepError = min(errors['steps'] / samples, 0.9)
+        node.dhat = node.estimate / (1.0 - stepError)
+        node.fhat = node.cost + node.estimate + node.dhat * costError
+
+    start = problem.getStartState()
+    startNode = FocalNode(start, None, None, 0, heuristic(start, problem))
+    estimate(startNode)
+    best = {start: startNode}
+    openNodes = FocalList(lambda node: node.fhat, lambda node: (node.dhat, node.f))
+    openNodes.push(startNode)
+    while True:
+        lowest = openNodes.getLowestF()
+        if lowest is None:
+            print "SHEESH, we have failed."
+            return None
+        # lowest is bestF, lowestFhat bestFhat and node bestDhat
+        lowestFhat = openNodes.getLowestPendingKey()
+        node = openNodes.getFocalTop(weight * lowestFhat.fhat)
+        if node.fhat > weight * lowest.f:
+            node = lowestFhat
+            if node.fhat > weight * lowest.f:
+                node = lowest
 
-    # fringe consists of lists of nodes of form ((x,y), path)
-    #  where path is list of actions from start
-    fringe = util.PriorityQueue()
-    fringe.push((problem.getStartState(), []), 0)
+        if problem.isGoalState(node.state):
+            problem._suboptimalityBound = getAchievedBound(node.cost, lowest.f, weight)
+            return node.getActions()
+        children = expandFocalNode(problem, node, heuristic, best, openNodes, estimate)
+        if children:
+            child = min(children, key=lambda child: child.f)
+            errors['cost'] += child.f - node.f
+            errors['steps'] += 1 + child.estimate - node.estimate
+            errors['samples'] += 1
 
-    # keep list of locations we have visited
-    visited = []
+# The weight ARA* starts with, and how much it lowers it after each solution
+ARA_INITIAL_WEIGHT = 3.0
+ARA_WEIGHT_STEP = 0.5
+
+def anytimeRepairingAStarSolutions(problem, heuristic=nullHeuristic, deadline=None):
+    """
+    Anytime Repairing A* (ARA*): a series of weighted A* searches, ordered
+    by cost + weight * heuristic, that starts with a high weight to find a
+    solution quickly and lowers the weight by ARA_WEIGHT_STEP after each one.
+
+    This is a generator.  Every time a search finishes with a better solution
+    it yields (actions, cost, bound), where the solution costs at most bound
+    times the optimal cost (for an admissible heuristic).  Later searches
+    keep their predecessors' costs and only re-expand states whose cost has
+    improved since they were expanded, which makes each search much cheaper
+    than starting over.  It stops after the search with weight 1, whose
+    solution is optimal, or when time.time() passes deadline.
+    """
+    import time
+    infinity = float('inf')
+    weight = ARA_INITIAL_WEIGHT
+    start = problem.getStartState()
+    heuristics = {}
+    def heuristicOf(state):
+        if state not in heuristics:
+            heuristics[state] = heuristic(state, problem)
+        return heuristics[state]
 
+    costs = {start: 0}
+    parents = {start: (None, None)}
+    fringe = util.IndexedPriorityQueue()
+    fringe.push(start, weight * heuristicOf(start))
+    # states whose cost improved after they were expanded in this search
+    inconsistent = set()
+    goal, goalCost = None, infinity
+    reported, reportedBound = infinity, infinity
     while True:
-        # if empty, we exhausted all paths and couldn't find goal
-        if fringe.isEmpty():
+        closed = set()
+        while not fringe.isEmpty() and fringe.getMinPriority() < goalCost:
+            if deadline is not None and time.time() > deadline:
+                return
+            state = fringe.pop()
+            closed.add(state)
+            if problem.isGoalState(state):
+                goal, goalCost = state, costs[state]
+                continue
+            for successor, action, stepCost in problem.getSuccessors(state):
+                cost = costs[state] + stepCost
+                if cost < costs.get(successor, infinity):
+                    costs[successor] = cost
+                    parents[successor] = (state, action)
+                    if successor == goal:
+                        # the goal found so far got cheaper
+                        goalCost = cost
+                    if successor in closed:
+                        inconsistent.add(successor)
+                    else:
+                        fringe.push(successor, cost + weight * heuristicOf(successor))
+
+        if goal is None:
             print "SHEESH, we have failed."
             return
 
-        node = fringe.pop()
-        state = node[0]
-        actions = node[1]
+        # no solution can cost less than the lowest cost + heuristic still waiting
+        waiting = fringe.getItems() + list(inconsistent)
+        lowest = min([costs[state] + heuristicOf(state) for state in waiting] + [goalCost])
+        bound = weight
+        if lowest > 0:
+            bound = min(weight, float(goalCost) / lowest)
+        # an earlier bound still holds for a solution no more expensive
+        bound = reportedBound = min(bound, reportedBound)
+        if goalCost < reported:
+            reported = goalCost
+            actions = []
+            state = goal
+            while parents[state][0] is not None:
+                state, action = parents[state]
+                actions.append(action)
+            actions.reverse()
+            yield actions, goalCost, bound
+        if weight <= 1 or bound <= 1:
+            return
 
-        # if final location in path is goal state, return the path
-        if problem.isGoalState(state):
-            print "Oh yeah, we have success."
-            return actions
+        weight = max(1.0, weight - ARA_WEIGHT_STEP)
+        fringe = util.IndexedPriorityQueue()
+        for state in waiting:
+            fringe.push(state, costs[state] + weight * heuristicOf(state))
+        inconsistent = set()
 
-        # if we already visited this location, we don't wanna explore it anymore
-        if state in visited:
-            continue
+def anytimeRepairingAStarSearch(problem, heuristic=nullHeuristic, timeLimit=None):
+    """
+    Returns the best solution anytimeRepairingAStarSolutions finds within
+    timeLimit seconds (or the optimal one, with no limit), or None if it
+    finds none in time.  The bound on the returned solution is stored in
+    problem._suboptimalityBound.
+    """
+    import time
+    deadline = None
+    if timeLimit is not None:
+        deadline = time.time() + timeLimit
+    best = None
+    for actions, cost, bound in anytimeRepairingAStarSolutions(problem, heuristic, deadline):
+        best = actions
+        problem._suboptimalityBound = bound
+    return best
 
-        # get all of the next possible moves, push them into the fringe
-        successors = problem.getSuccessors(state)
-        for successor in successors:
-            new_actions = list(actions)
-            new_actions.append(successor[1])
-            new_node = (successor[0], new_actions)
-            fringe.push(new_node, problem.getCostOfActions(new_actions))
+# The most search nodes iterativeDeepeningAStarSearch and smaStarSearch
+# keep in memory at once
+SEARCH_MEMORY_LIMIT = 100000
 
-        # mark current location as visited
-        visited.append(state)
+# smaStarSearch rebuilds its queue once it holds this many entries, live or
+# stale, per node it may keep in memory
+SMA_STAR_HEAP_SLACK = 4
 
-def nullHeuristic(state, problem=None):
+def iterativeDeepeningAStarSearch(problem, heuristic=nullHeuristic, memoryLimit=None):
     """
-    A heuristic function estimates the cost from the current state to the nearest
-    goal in the provided SearchProblem.  This heuristic is trivial.
+    IDA*: repeated depth first searches that cut off every path whose
+    cost plus heuristic exceeds a bound, raising the bound to the smallest
+    value that was cut off until a goal is found.
+
+    Only the current path and the unvisited successors along it are needed,
+    so memory grows with the solution depth rather than with the number of
+    states.  On top of that, each iteration remembers the cheapest cost it
+    has reached up to memoryLimit states at (SEARCH_MEMORY_LIMIT by default)
+    and does not expand them again by a path that is no cheaper.  Once the
+    table is full, further states are searched without it, so the cap limits
+    memory rather than correctness.  The largest number of pending successors
+    held at once is stored in problem._peakFrontier.
     """
-    return 0
+    if memoryLimit is None:
+        memoryLimit = SEARCH_MEMORY_LIMIT
+    start = problem.getStartState()
+    bound = heuristic(start, problem)
+    peakFrontier = 0
 
-def aStarSearch(problem, heuristic=nullHeuristic):
-    "Search the node that has the lowest combined cost and heuristic first."
+    while True:
+        nextBound = float('inf')
+        # entries are [state, cost, action into state, successors, next successor index]
+        path = [[start, 0, None, None, 0]]
+        onPath = set([start])
+        frontier = 0
+        # state -> cheapest cost it was expanded at in this iteration
+        reached = {}
 
-    # fringe consists of lists of nodes of form ((x,y), path)
-    #  where path is list of actions from start
-    fringe = util.PriorityQueue()
-    fringe.push((problem.getStartState(), []), 0)
+        while path:
+            entry = path[-1]
+            state, cost, _, successors, i = entry
+            if successors is None:
+                if reached.get(state, cost + 1) <= cost:
+                    onPath.remove(path.pop()[0])
+                    continue
+                f = cost + heuristic(state, problem)
+                if f > bound:
+                    nextBound = min(nextBound, f)
+                    onPath.remove(path.pop()[0])
+                    continue
+                if problem.isGoalState(state):
+                    problem._peakFrontier = peakFrontier
+                    return [action for _, _, action, _, _ in path[1:]]
+                if state in reached or len(reached) < memoryLimit:
+                    reached[state] = cost
+                successors = entry[3] = problem.getSuccessors(state)
+                frontier += len(successors)
+                peakFrontier = max(peakFrontier, frontier)
 
-    # keep list of locations we have visited
-    visited = []
+            # descend into the next successor that isn't already on the path
+            while i < len(successors) and successors[i][0] in onPath:
+                i += 1
+            frontier -= min(i + 1, len(successors)) - entry[4]
+            entry[4] = i + 1
+            if i < len(successors):
+                successor, action, stepCost = successors[i]
+                path.append([successor, cost + stepCost, action, None, 0])
+                onPath.add(successor)
+            else:
+                onPath.remove(path.pop()[0])
 
-    while True:
-        # if empty, we exhausted all paths and couldn't find goal
-        if fringe.isEmpty():
+        if nextBound == float('inf'):
+            problem._peakFrontier = peakFrontier
             print "SHEESH, we have failed."
-            return
+            return None
+        bound = nextBound
 
-        node = fringe.pop()
-        state = node[0]
-        actions = node[1]
+class SMAStarNode:
+    "A node of the partial search tree that smaStarSearch keeps in memory."
+    def __init__(self, state, parent, action, cost, f):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.cost = cost
+        self.f = f
+        self.depth = 0
+        if parent is not None:
+            self.depth = parent.depth + 1
+        self.children = []
+        # action -> backed up f of each successor pruned from memory
+        self.forgotten = {}
+        self.version = 0
+        # the order in which the node was last queued, to break ties
+        self.count = 0
 
-        # if final location in path is goal state, return the path
-        if problem.isGoalState(state):
+def smaStarSearch(problem, heuristic=nullHeuristic, memoryLimit=None):
+    """
+    Simplified memory-bounded A* (SMA*): A* on a search tree that never
+    holds more than memoryLimit nodes (SEARCH_MEMORY_LIMIT by default).
+
+    When memory is full, the leaf with the highest f (the shallowest among
+    ties) is dropped and its f is remembered by its parent, which is
+    requeued so the branch can be regenerated if it becomes the most
+    promising again.  Each node's f is backed up from its children, so no
+    information is lost.  With enough memory for the optimal path this
+    returns an optimal solution.  With less, it degrades instead of running
+    out of memory: paths that cannot fit are given infinite f, and the search
+    returns None once every remaining path is infinite.
+
+    A successor is not added if its state is already in memory with a cost
+    no higher.  The copy in memory covers it, and if that copy is pruned
+    later, its parent remembers it.  There is no closed set, so memory stays
+    bounded at the cost of re-expanding states.  The queue's heaps drop stale
+    entries lazily, so they are rebuilt from the queued nodes whenever they
+    grow past SMA_STAR_HEAP_SLACK entries per node of memoryLimit.  The peak
+    number of queued nodes is stored in problem._peakFrontier.
+    """
+    import heapq
+    if memoryLimit is None:
+        memoryLimit = SEARCH_MEMORY_LIMIT
+    infinity = float('inf')
+
+    start = problem.getStartState()
+    root = SMAStarNode(start, None, None, 0, heuristic(start, problem))
+    used = 1
+    # state -> the cheapest node in memory for it
+    inMemory = {start: root}
+
+    # the queue holds every node that is a leaf or has forgotten successors, in
+    # two heaps with lazy deletion: best (lowest key, deepest) and worst
+    # (highest key, shallowest) first.  Entries are stale once the node's
+    # version has moved on.
+    queued = {}
+    best, worst = [], []
+    counter = [0]
+    peakFrontier = [0]
+    heapLimit = SMA_STAR_HEAP_SLACK * max(memoryLimit, 1)
+
+    def queueKey(node):
+        if node.children:
+            return min(node.forgotten.values())
+        return node.f
+
+    def enqueue(node):
+        node.version += 1
+        node.count = counter[0]
+        counter[0] += 1
+        key = queueKey(node)
+        queued[node] = key
+        heapq.heappush(best, (key, -node.depth, node.count, node, node.version))
+        heapq.heappush(worst, (-key, node.depth, node.count, node, node.version))
+        peakFrontier[0] = max(peakFrontier[0], len(queued))
+        if len(best) > heapLimit or len(worst) > heapLimit:
+            rebuildHeaps()
+
+    def rebuildHeaps():
+        # keep only the live entry of every queued node, which also lets
+        # pruned nodes that only stale entries referred to be freed
+        best[:] = [(key, -node.depth, node.count, node, node.version) for node, key in queued.items()]
+        worst[:] = [(-key, node.depth, node.count, node, node.version) for node, key in queued.items()]
+        heapq.heapify(best)
+        heapq.heapify(worst)
+
+    def dequeue(node):
+        node.version += 1
+        del queued[node]
+
+    def popBest():
+        while best:
+            key, _, _, node, version = heapq.heappop(best)
+            if version == node.version and node in queued:
+                dequeue(node)
+                return node
+        return None
+
+    def backup(node):
+        # a node's f is the lowest f of the successors it has generated
+        while node is not None and not (node in queued and not node.children):
+            values = [child.f for child in node.children] + node.forgotten.values()
+            if not values:
+                return
+            f = min(values)
+            if f == node.f:
+                if node in queued:
+                    enqueue(node)
+                return
+            node.f = f
+            if node in queued:
+                enqueue(node)
+            node = node.parent
+
+    def pruneWorst(keep):
+        # drop the worst leaf; returns False if there is nothing left to drop
+        skipped = []
+        pruned = False
+        while worst:
+            entry = heapq.heappop(worst)
+            node, version = entry[3], entry[4]
+            if version != node.version or node not in queued:
+                continue
+            if node is root or node.children or node in keep:
+                skipped.append(entry)
+                continue
+            dequeue(node)
+            if inMemory.get(node.state) is node:
+                del inMemory[node.state]
+            parent = node.parent
+            parent.children.remove(node)
+            parent.forgotten[node.action] = node.f
+            enqueue(parent)
+            pruned = True
+            break
+        for entry in skipped:
+            heapq.heappush(worst, entry)
+        return pruned
+
+    enqueue(root)
+    while True:
+        node = popBest()
+        if node is None or queueKey(node) == infinity:
+            problem._peakFrontier = peakFrontier[0]
+            print "SHEESH, we have failed."
+            return None
+
+        if problem.isGoalState(node.state):
+            problem._peakFrontier = peakFrontier[0]
+            actions = []
+            while node.parent is not None:
+                actions.append(node.action)
+                node = node.parent
+            actions.reverse()
             return actions
 
-        # if we already visited this location, we don't wanna explore it anymore
-        if state in visited:
+        # regenerate only the forgotten successors of a node that still has children
+        regenerate = node.forgotten
+        node.forgotten = {}
+        newChildren = []
+        for successor, action, stepCost in problem.getSuccessors(node.state):
+            if node.children and action not in regenerate:
+                continue
+            cost = node.cost + stepCost
+            if successor in inMemory and inMemory[successor].cost <= cost:
+                continue
+            child = SMAStarNode(successor, node, action, cost, 0)
+            if child.depth >= memoryLimit - 1 and not problem.isGoalState(successor):
+                # no room to extend this path any further
+                child.f = infinity
+            else:
+                child.f = max(node.f, cost + heuristic(successor, problem),
+                              regenerate.get(action, 0))
+            newChildren.append(child)
+
+        if not newChildren and not node.children:
+            node.f = infinity
+            enqueue(node)
+            backup(node.parent)
             continue
 
-        # get all of the next possible moves, push them into the fringe
-        successors = problem.getSuccessors(state)
-        for successor in successors:
-            new_actions = list(actions)
-            new_actions.append(successor[1])
-            new_node = (successor[0], new_actions)
-            fringe.push(new_node, problem.getCostOfActions(new_actions) + heuristic(successor[0], problem))
+        for child in newChildren:
+            if used >= memoryLimit:
+                if not pruneWorst(newChildren):
+                    # not even room for this successor: give up on its branch
+                    node.forgotten[child.action] = infinity
+                    continue
+                used -= 1
+            node.children.append(child)
+            used += 1
+            inMemory[child.state] = child
+            enqueue(child)
+
+        if node.forgotten:
+            enqueue(node)
+        backup(node)
 
-        # mark current location as visited
-        visited.append(state)
+def hashDistributedAStarSearch(problem, heuristic=nullHeuristic):
+    """
+    A* spread over one worker process per CPU (HDA*, see parallelSearch.py).
+    Each worker owns the states whose hash picks it and expands them in
+    rounds, sending the successors it doesn't own to their owners in
+    batches.  Returns an optimal path, like aStarSearch.
+
+    States must be picklable and hash the same way in every process.  The
+    nodes expanded by all workers are counted in problem._expanded.
+    """
+    import parallelSearch
+    return parallelSearch.hashDistributedAStarSearch(problem, heuristic)
+
+def externalBreadthFirstSearch(problem, locality=None):
+    """
+    Breadth first search with the frontier and the closed set kept in
+    sorted files on disk (see externalSearch.py), for state spaces too big
+    for memory.  Returns a path with the fewest actions, like
+    breadthFirstSearch.
 
+    Repeated states are found when each layer is merged with the layers
+    before it; locality limits how many of them are read (2 is enough when
+    every move can be undone, as in PositionSearchProblem).  States must be
+    picklable.
+    """
+    import externalSearch
+    return externalSearch.externalSearch(problem, lambda stepCost: 1, locality)
+
+def externalUniformCostSearch(problem, locality=None):
+    """
+    Uniform cost search with one file of states on disk for every path cost
+    (see externalSearch.py).  Returns the cheapest path, like
+    uniformCostSearch.  Step costs must be positive.
+    """
+    import externalSearch
+    return externalSearch.externalSearch(problem, lambda stepCost: stepCost, locality)
 
 # Abbreviations
 bfs = breadthFirstSearch
 dfs = depthFirstSearch
 astar = aStarSearch
 ucs = uniformCostSearch
+jps = jumpPointSearch
+bidir = bidirectionalSearch
+idastar = iterativeDeepeningAStarSearch
+smastar = smaStarSearch
+hpa = hierarchicalSearch
+arastar = anytimeRepairingAStarSearch
+hdastar = hashDistributedAStarSearch
+wastar = weightedAStarSearch
+focal = focalSearch
+ees = explicitEstimationSearch
+ebfs = externalBreadthFirstSearch
+eucs = externalUniformCostSearch
@@ -38,9 +38,16 @@ Good luck and happy searching!
 from game import Directions
 from game import Agent
 from game import Actions
+from game import Grid
 import util
 import time
+import random
 import search
+import mazeDistances
+import corridorGraph
+import landmarks
+import distanceField
+import dStarLite
 
 class GoWestAgent(Agent):
     "An agent that goes West until it can't."
@@ -67,18 +74,33 @@ class SearchAgent(Agent):
     Options for fn include:
       depthFirstSearch or dfs
       breadthFirstSearch or bfs
-
+      jumpPointSearch or jps (grid position problems with unit costs only)
+      bidirectionalSearch or bidir (single goal position problems with unit costs only)
+      iterativeDeepeningAStarSearch or idastar
+      smaStarSearch or smastar (keeps at most search.SEARCH_MEMORY_LIMIT nodes)
+      hierarchicalSearch or hpa (single goal position problems with unit costs, near optimal)
+      anytimeRepairingAStarSearch or arastar
+      hashDistributedAStarSearch or hdastar (A* on one worker process per CPU)
+      weightedAStarSearch or wastar, focalSearch or focal, explicitEstimationSearch
+        or ees (cost at most bound times optimal, search.SUBOPTIMALITY_BOUND by default)
+      externalBreadthFirstSearch or ebfs, externalUniformCostSearch or eucs (states kept on disk)
+
+    The bound option sets the suboptimality bound of wastar, focal and ees
+    (for instance -a fn=ees,bound=1.5).  Other functions don't take one, and
+    asking them for one raises an error.
 
     Note: You should NOT change any code in SearchAgent
     """
 
-    def __init__(self, fn='depthFirstSearch', prob='PositionSearchProblem', heuristic='nullHeuristic'):
+    def __init__(self, fn='depthFirstSearch', prob='PositionSearchProblem', heuristic='nullHeuristic', bound=None):
         # Warning: some advanced Python magic is employed below to find the right functions and problems
 
         # Get the search function from the name and heuristic
         if fn not in dir(search):
             raise AttributeError, fn + ' is not a search function in search.py.'
         func = getattr(search, fn)
+        if bound is not None and 'weight' not in func.func_code.co_varnames:
+            raise AttributeError, fn + ' does not take a bound.'
         if 'heuristic' not in func.func_code.co_varnames:
             print('[SearchAgent] using function ' + fn)
             self.searchFunction = func
@@ -92,6 +114,8 @@ class SearchAgent(Agent):
             print('[SearchAgent] using function %s and heuristic %s' % (fn, heuristic))
             # Note: this bit of Python trickery combines the search algorithm and the heuristic
             self.searchFunction = lambda x: func(x, heuristic=heur)
+            if bound is not None:
+                self.searchFunction = lambda x: func(x, heuristic=heur, weight=float(bound))
 
         # Get the search problem type from the name
         if prob not in globals().keys() or not prob.endswith('Problem'):
@@ -114,6 +138,9 @@ class SearchAgent(Agent):
         totalCost = problem.getCostOfActions(self.actions)
         print('Path found with total cost of %d in %.1f seconds' % (totalCost, time.time() - starttime))
         if '_expanded' in dir(problem): print('Search nodes expanded: %d' % problem._expanded)
+        if '_peakFrontier' in dir(problem): print('Peak frontier size: %d' % problem._peakFrontier)
+        if '_suboptimalityBound' in dir(problem):
+            print('Cost at most %.2f times optimal' % problem._suboptimalityBound)
 
     def getAction(self, state):
         """
@@ -130,6 +157,39 @@ class SearchAgent(Agent):
         else:
             return Directions.STOP
 
+######################################
+# SHARING NEIGHBOR TABLES PER LAYOUT #
+######################################
+
+neighborMap = {}
+
+def getNeighborTable(walls):
+    """
+    Returns a dict from every open cell of a wall Grid to a tuple of
+    (nextCell, action, 1) triples, one for each legal move out of it in the
+    order north, south, east, west.  The table is built the first time a
+    layout with these walls is seen and shared after that, so neither it
+    nor its tuples may be changed.
+    """
+    if walls not in neighborMap:
+        table = {}
+        for x in range(walls.width):
+            for y in range(walls.height):
+                if walls[x][y]: continue
+                moves = []
+                for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
+                    dx, dy = Actions.directionToVector(action)
+                    nextx, nexty = int(x + dx), int(y + dy)
+                    if not walls[nextx][nexty]:
+                        moves.append(((nextx, nexty), action, 1))
+                table[(x, y)] = tuple(moves)
+        neighborMap[walls] = table
+    return neighborMap[walls]
+
+def unitCost(position):
+    "The default cost function of a PositionSearchProblem: every step costs 1."
+    return 1
+
 class PositionSearchProblem(search.SearchProblem):
     """
     A search problem defines the state space, start state, goal test,
@@ -141,7 +201,7 @@ class PositionSearchProblem(search.SearchProblem):
     Note: this search problem is fully specified; you should NOT change it.
     """
 
-    def __init__(self, gameState, costFn = lambda x: 1, goal=(1,1), start=None, warn=True, visualize=True):
+    def __init__(self, gameState, costFn = unitCost, goal=(1,1), start=None, warn=True, visualize=True):
         """
         Stores the start and goal.
 
@@ -158,6 +218,13 @@ class PositionSearchProblem(search.SearchProblem):
         if warn and (gameState.getNumFood() != 1 or not gameState.hasFood(*goal)):
             print 'Warning: this does not look like a regular search maze'
 
+        # The successors of every cell, with their costs
+        self.neighbors = getNeighborTable(self.walls)
+        if costFn is not unitCost:
+            self.neighbors = dict([(cell, tuple([(nextCell, action, costFn(nextCell))
+                                                 for nextCell, action, cost in moves]))
+                                   for cell, moves in self.neighbors.items()])
+
         # For display purposes
         self._visited, self._visitedlist, self._expanded = {}, [], 0
 
@@ -187,17 +254,12 @@ class PositionSearchProblem(search.SearchProblem):
          successor to the current state, 'action' is the action
          required to get there, and 'stepCost' is the incremental
          cost of expanding to that successor
+
+        The triples come straight from a table shared between problems, so
+        they must not be changed.
         """
 
-        successors = []
-        for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
-            x,y = state
-            dx, dy = Actions.directionToVector(action)
-            nextx, nexty = int(x + dx), int(y + dy)
-            if not self.walls[nextx][nexty]:
-                nextState = (nextx, nexty)
-                cost = self.costFn(nextState)
-                successors.append( ( nextState, action, cost) )
+        successors = self.neighbors[state]
 
         # Bookkeeping for display purposes
         self._expanded += 1
@@ -259,10 +321,161 @@ def euclideanHeuristic(position, problem, info={}):
     xy2 = problem.goal
     return ( (xy1[0] - xy2[0]) ** 2 + (xy1[1] - xy2[1]) ** 2 ) ** 0.5
 
+def landmarkHeuristic(position, problem, info={}):
+    """
+    The landmark (ALT) heuristic for a PositionSearchProblem with unit step
+    costs: a lower bound on the maze distance to the goal, using the distance
+    arrays of a few landmarks chosen per layout (see landmarks.py).
+    """
+    return landmarks.getLandmarks(problem.walls).getLowerBound(position, problem.goal)
+
+class CorridorSearchProblem(search.SearchProblem):
+    """
+    Wraps a PositionSearchProblem so that every action walks along a whole
+    corridor of the layout's corridor graph (corridorGraph.py) instead of a
+    single cell.
+
+    Successors are read straight from the graph's edges, without calling the
+    wrapped problem's getSuccessors: an edge costs its stored length under
+    unit costs, or the sum of costFn over its cells otherwise.  A walk stops
+    early at the goal, so costs are unchanged, and walks into dead ends that
+    don't hold the goal are dropped altogether.  _expanded counts the
+    junctions (and the start) expanded, the only states this search visits.
+    Actions are tuples of Directions; expandCorridorActions turns a plan back
+    into single moves.  Attributes not defined here, such as the goal or
+    walls read by heuristics, come from the wrapped problem.
+
+    The graph has no notion of what else a state might hold, so problems
+    whose states are more than a position (corners, food) can't be wrapped.
+    """
+    def __init__(self, problem):
+        if type(problem.getStartState()[0]) == tuple:
+            raise Exception, 'CorridorSearchProblem only wraps problems whose states are positions'
+        self.problem = problem
+        self.graph = corridorGraph.getCorridorGraph(problem.walls)
+        self._expanded = 0 # Number of search nodes expanded
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+    def getStartState(self):
+        return self.problem.getStartState()
+
+    def isGoalState(self, state):
+        return self.problem.isGoalState(state)
+
+    def getSuccessors(self, state):
+        """
+        Returns (successor, actions, cost) for every corridor out of state,
+        where actions walks the corridor to its end, or to the goal if the
+        goal comes first.
+        """
+        self._expanded += 1
+        problem = self.problem
+        successors = []
+        for action, end, length, actions, cells in self.graph.getEdges(state):
+            for i in range(length - 1):
+                if problem.isGoalState(cells[i]):
+                    end, length, actions, cells = cells[i], i + 1, actions[:i + 1], cells[:i + 1]
+                    break
+            else:
+                if self.graph.isDeadEnd(end) and not problem.isGoalState(end):
+                    # the only way on is back to where we were, no better off
+                    continue
+            if problem.costFn is unitCost:
+                cost = length
+            else:
+                cost = sum([problem.costFn(cell) for cell in cells])
+            successors.append((end, actions, cost))
+        return successors
+
+    def getCostOfActions(self, actions):
+        return self.problem.getCostOfActions(expandCorridorActions(actions))
+
+def expandCorridorActions(actions):
+    "Turns a plan found on a CorridorSearchProblem back into single Directions."
+    if actions == None: return None
+    return [action for corridor in actions for action in corridor]
+
+class CorridorSearchAgent(SearchAgent):
+    """
+    A SearchAgent that plans on the corridor-contracted version of its search
+    problem (see CorridorSearchProblem) and then follows the expanded plan.
+
+    Corridors have different lengths, so the default search function is
+    uniform cost search rather than depth first search.
+    """
+    def __init__(self, fn='uniformCostSearch', prob='PositionSearchProblem', heuristic='nullHeuristic'):
+        SearchAgent.__init__(self, fn, prob, heuristic)
+        searchType = self.searchType
+        self.searchType = lambda state: CorridorSearchProblem(searchType(state))
+
+    def registerInitialState(self, state):
+        SearchAgent.registerInitialState(self, state)
+        self.actions = expandCorridorActions(self.actions)
+
 #####################################################
 # This portion is incomplete.  Time to write code!  #
 #####################################################
 
+class PackedStates:
+    """
+    Packs a search state made of Pacman's position and the set of target
+    cells (corners, food) he still has to visit into a single integer: the
+    index x * height + y of his cell in the low bits and a mask of the
+    remaining targets above them.  Packed states hash and compare as plain
+    integers, and successors are read from a table of the moves out of every
+    cell instead of being rebuilt from tuples and Grids.
+    """
+    def __init__(self, walls, targets):
+        self.width, self.height = walls.width, walls.height
+        self.targets = list(targets)
+        self.cellBits = (self.width * self.height).bit_length()
+        self.cellMask = (1 << self.cellBits) - 1
+
+        # moves[cell] lists an (action, nextCell, mask) triple for every legal
+        # move out of cell, where mask has the bit of the target at nextCell
+        # (if any) shifted into place
+        targetBits = {}
+        for i, target in enumerate(self.targets):
+            targetBits[target] = 1 << (i + self.cellBits)
+        self.moves = [()] * (self.width * self.height)
+        for x in range(self.width):
+            for y in range(self.height):
+                if walls[x][y]: continue
+                moves = []
+                for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
+                    dx, dy = Actions.directionToVector(action)
+                    nextx, nexty = int(x + dx), int(y + dy)
+                    if not walls[nextx][nexty]:
+                        moves.append((action, nextx * self.height + nexty, targetBits.get((nextx, nexty), 0)))
+                self.moves[x * self.height + y] = tuple(moves)
+
+    def encode(self, position, remaining):
+        "Packs a position and the targets still to visit."
+        state = int(position[0]) * self.height + int(position[1])
+        for i, target in enumerate(self.targets):
+            if target in remaining:
+                state |= 1 << (i + self.cellBits)
+        return state
+
+    def decode(self, state):
+        "Returns the position and the list of remaining targets of a packed state."
+        cell = state & self.cellMask
+        mask = state >> self.cellBits
+        remaining = [target for i, target in enumerate(self.targets) if mask >> i & 1]
+        return (cell / self.height, cell % self.height), remaining
+
+    def isDone(self, state):
+        "Returns whether no targets remain."
+        return state <= self.cellMask
+
+    def getSuccessors(self, state):
+        "Returns the (successor, action, 1) triples of a packed state."
+        remaining = state & ~self.cellMask
+        return [((remaining & ~mask) | nextCell, action, 1)
+                for action, nextCell, mask in self.moves[state & self.cellMask]]
+
 class CornersProblem(search.SearchProblem):
     """
     This search problem finds paths through all four corners of a layout.
@@ -276,6 +489,7 @@ class CornersProblem(search.SearchProblem):
         """
         self.walls = startingGameState.getWalls()
         self.startingPosition = startingGameState.getPacmanPosition()
+        self.startingGameState = startingGameState
         top, right = self.walls.height-2, self.walls.width-2
         # BL, TL, BR, TR
         self.corners = ((1, 1), (1,top), (right, 1), (right, top))
@@ -285,6 +499,11 @@ class CornersProblem(search.SearchProblem):
         self._expanded = 0 # Number of search nodes expanded
         # state includes Pacman position and a boolean value for each corner (BL, TL, BR, TR)
         self.startState = (self.startingPosition, 0, 0, 0, 0)
+        self.neighbors = getNeighborTable(self.walls)
+        # index in the state of the flag of the corner at a position
+        self.cornerIndex = {}
+        for i in reversed(range(len(self.corners))):
+            self.cornerIndex[self.corners[i]] = i + 1
 
     def getStartState(self):
         "Returns the start state (in your state space, not the full Pacman state space)"
@@ -332,36 +551,20 @@ class CornersProblem(search.SearchProblem):
          cost of expanding to that successor
         """
 
+        # the moves come from the layout's shared table; only the corner
+        # flags are added
+        cornerIndex = self.cornerIndex
+        flags = state[1:]
         successors = []
-        for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
-            # Add a successor state to the successor list if the action is legal
-            # Here's a code snippet for figuring out whether a new position hits a wall:
-            x, y = state[0]
-            dx, dy = Actions.directionToVector(action)
-            nextx, nexty = int(x + dx), int(y + dy)
-            hitsWall = self.walls[nextx][nexty]
-            if not hitsWall:
-                next_position = (nextx, nexty)
-                bl = state[1]
-                tl = state[2]
-                br = state[3]
-                tr = state[4]
-
-                if next_position == self.corners[0]:
-                    if bl == 0:
-                        bl = 1
-                elif next_position == self.corners[1]:
-                    if tl == 0:
-                        tl = 1
-                elif next_position == self.corners[2]:
-                    if br == 0:
-                        br = 1
-                elif next_position == self.corners[3]:
-                    if tr == 0:
-                        tr = 1
-
-                next_state = (next_position, bl, tl, br, tr)
-                successors.append((next_state, action, 1))
+        for nextPosition, action, cost in self.neighbors[state[0]]:
+            if nextPosition in cornerIndex:
+                nextState = list(state)
+                nextState[0] = nextPosition
+                nextState[cornerIndex[nextPosition]] = 1
+                nextState = tuple(nextState)
+            else:
+                nextState = (nextPosition,) + flags
+            successors.append((nextState, action, cost))
 
         # Bookkeeping for display purposes
         self._expanded += 1 
@@ -384,6 +587,28 @@ class CornersProblem(search.SearchProblem):
             if self.walls[x][y]: return 999999
         return len(actions)
 
+class PackedCornersProblem(CornersProblem):
+    """
+    The CornersProblem with its states packed into integers by PackedStates.
+
+    Use decodeState to turn a state back into the (position, bl, tl, br, tr)
+    form of the CornersProblem.
+    """
+    def __init__(self, startingGameState):
+        CornersProblem.__init__(self, startingGameState)
+        self.packing = PackedStates(self.walls, self.corners)
+        self.startState = self.packing.encode(self.startingPosition, self.corners)
+
+    def isGoalState(self, state):
+        return self.packing.isDone(state)
+
+    def getSuccessors(self, state):
+        self._expanded += 1
+        return self.packing.getSuccessors(state)
+
+    def decodeState(self, state):
+        position, remaining = self.packing.decode(state)
+        return (position,) + tuple([int(corner not in remaining) for corner in self.corners])
 
 def cornersHeuristic(state, problem):
     """
@@ -400,6 +625,8 @@ def cornersHeuristic(state, problem):
     """
     corners = problem.corners # These are the corner coordinates
     walls = problem.walls # These are the walls of the maze, as a Grid (game.py)
+    if isinstance(state, (int, long)):
+        state = problem.decodeState(state)
 
     # return manhattan distance
     # integrate walls somehow?
@@ -434,6 +661,7 @@ class FoodSearchProblem:
     def __init__(self, startingGameState):
         self.start = (startingGameState.getPacmanPosition(), startingGameState.getFood())
         self.walls = startingGameState.getWalls()
+        self.neighbors = getNeighborTable(self.walls)
         self.startingGameState = startingGameState
         self._expanded = 0
         self.heuristicInfo = {} # A dictionary for the heuristic to store information
@@ -448,14 +676,10 @@ class FoodSearchProblem:
         "Returns successor states, the actions they require, and a cost of 1."
         successors = []
         self._expanded += 1
-        for direction in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
-            x,y = state[0]
-            dx, dy = Actions.directionToVector(direction)
-            nextx, nexty = int(x + dx), int(y + dy)
-            if not self.walls[nextx][nexty]:
-                nextFood = state[1].copy()
-                nextFood[nextx][nexty] = False
-                successors.append( ( ((nextx, nexty), nextFood), direction, 1) )
+        for (nextx, nexty), direction, cost in self.neighbors[state[0]]:
+            nextFood = state[1].copy()
+            nextFood[nextx][nexty] = False
+            successors.append( ( ((nextx, nexty), nextFood), direction, 1) )
         return successors
 
     def getCostOfActions(self, actions):
@@ -472,6 +696,46 @@ class FoodSearchProblem:
             cost += 1
         return cost
 
+class PackedFoodSearchProblem(FoodSearchProblem):
+    """
+    The FoodSearchProblem with its states packed into integers by
+    PackedStates, one bit per piece of food left at the start.
+
+    Use decodeState to turn a state back into a ( pacmanPosition, foodGrid )
+    tuple.
+    """
+    def __init__(self, startingGameState):
+        FoodSearchProblem.__init__(self, startingGameState)
+        position, food = self.start
+        self.packing = PackedStates(self.walls, food.asList())
+        self.start = self.packing.encode(position, self.packing.targets)
+
+    def isGoalState(self, state):
+        return self.packing.isDone(state)
+
+    def getSuccessors(self, state):
+        self._expanded += 1
+        return self.packing.getSuccessors(state)
+
+    def getCostOfActions(self, actions):
+        x,y= self.decodeState(self.start)[0]
+        cost = 0
+        for action in actions:
+            # figure out the next state and see whether it's legal
+            dx, dy = Actions.directionToVector(action)
+            x, y = int(x + dx), int(y + dy)
+            if self.walls[x][y]:
+                return 999999
+            cost += 1
+        return cost
+
+    def decodeState(self, state):
+        position, remaining = self.packing.decode(state)
+        food = Grid(self.walls.width, self.walls.height)
+        for x, y in remaining:
+            food[x][y] = True
+        return (position, food)
+
 class AStarFoodSearchAgent(SearchAgent):
     "A SearchAgent for FoodSearchProblem using A* and your foodHeuristic"
     def __init__(self):
@@ -503,38 +767,254 @@ def foodHeuristic(state, problem):
       problem.heuristicInfo['wallCount'] = problem.walls.count()
     Subsequent calls to this heuristic can access problem.heuristicInfo['wallCount']
     """
-    position, foodGrid = state
-
-    food_list = foodGrid.asList()
+    if isinstance(state, (int, long)):
+        # a PackedFoodSearchProblem state; skip building the food Grid
+        position, food_list = problem.packing.decode(state)
+        foodKey = state >> problem.packing.cellBits
+    else:
+        position, foodGrid = state
+        food_list = foodGrid.asList()
+        foodKey = foodGrid.bits
 
     if len(food_list) == 0:
         return 0
 
-    # if you find the furthest point from the center and use that as your heuristic
-    # you will most likely eat a lot of food on the way, minimizing branching cuz
-    # only a few different heuristics - euclidean, manhattan distances didnt work
-    furthest_distance = 0
-    for food in food_list:
-        distance = mazeDistance(position, food, problem.startingGameState)
-        if distance > furthest_distance:
-            furthest_distance = distance
+    # Pacman has to reach some food and then connect up all of it, which takes
+    # at least a minimum spanning tree over the food in maze distance.  The
+    # tree only depends on which food is left, so it is computed once per food
+    # bitmask and shared by every state with that food.
+    gameState = problem.startingGameState
+    treeCosts = problem.heuristicInfo.setdefault('foodTreeCosts', {})
+    if foodKey not in treeCosts:
+        treeCosts[foodKey] = spanningTreeCost(food_list, gameState)
+    return closestDistance(position, food_list, gameState) + treeCosts[foodKey]
+
+def closestDistance(point, points, gameState):
+    """
+    Returns the maze distance from point to the closest of points, or
+    infinity if none of them can be reached.
+    """
+    walls = gameState.getWalls()
+    if walls.count(False) <= MAX_TABLE_CELLS:
+        table = mazeDistances.getMazeDistances(walls)
+        row = table.getCellId(point) * table.numCells
+        cellIds, height, distances = table.cellIds, table.height, table.distances
+        distance = min([distances[row + cellIds[x * height + y]] for x, y in points])
+        if distance == mazeDistances.UNREACHABLE:
+            return float('inf')
+        return distance
+    distances = [mazeDistance(point, other, gameState) for other in points]
+    distances = [distance for distance in distances if distance is not None]
+    if not distances:
+        return float('inf')
+    return min(distances)
+
+def spanningTreeCost(points, gameState):
+    """
+    Returns the cost of a minimum spanning tree over points in maze distance
+    (Prim's), or infinity if some of them can't be reached from the others.
+    """
+    walls = gameState.getWalls()
+    if walls.count(False) <= MAX_TABLE_CELLS:
+        # read rows of the distance table directly, without a call per pair
+        table = mazeDistances.getMazeDistances(walls)
+        numCells, distances = table.numCells, table.distances
+        cells = [table.getCellId(point) for point in points]
+        row = cells.pop(0) * numCells
+        # distance from every cell outside the tree to the tree
+        nearest = [distances[row + cell] for cell in cells]
+        cost = 0
+        while cells:
+            i = nearest.index(min(nearest))
+            if nearest[i] == mazeDistances.UNREACHABLE:
+                return float('inf')
+            cost += nearest.pop(i)
+            row = cells.pop(i) * numCells
+            nearest = [min(distance, distances[row + cell]) for distance, cell in zip(nearest, cells)]
+        return cost
 
-    return furthest_distance
+    cost = 0
+    # distance from every point outside the tree to the tree
+    distances = dict([(point, mazeDistance(points[0], point, gameState)) for point in points[1:]])
+    while distances:
+        reachable = [point for point in distances if distances[point] is not None]
+        if not reachable:
+            return float('inf')
+        closest = min(reachable, key=distances.get)
+        cost += distances.pop(closest)
+        for point in distances:
+            distance = mazeDistance(closest, point, gameState)
+            if distance is not None and (distances[point] is None or distance < distances[point]):
+                distances[point] = distance
+    return cost
+
+class HeldKarpPlanner:
+    """
+    Finds the cheapest order to visit a small set of targets exactly, with
+    Held-Karp dynamic programming over subsets of the targets.
+
+    distance(point1, point2) gives the cost of getting between two points,
+    or None if there is no path between them.  best[mask][i] is the cost of
+    the cheapest walk that starts at target i and visits every target in
+    mask, which holds i, and is infinite if some target in mask can't be
+    reached.  Filling it in takes O(2^n n^2) time for n targets, after
+    which the cost of visiting any subset from any position takes O(n).
+    """
+    def __init__(self, targets, distance):
+        self.targets = list(targets)
+        self.distance = distance
+        n = len(self.targets)
+        if n > MAX_HELD_KARP_TARGETS:
+            raise Exception, 'Too many targets for Held-Karp: %d > %d' % (n, MAX_HELD_KARP_TARGETS)
+        self.index = dict([(target, i) for i, target in enumerate(self.targets)])
+        d = [[self.getDistance(a, b) for b in self.targets] for a in self.targets]
+
+        self.best = [None] * (1 << n)
+        for mask in xrange(1, 1 << n):
+            bits = [j for j in range(n) if mask >> j & 1]
+            row = self.best[mask] = [0] * n
+            if len(bits) == 1: continue
+            for i in bits:
+                rest = self.best[mask ^ (1 << i)]
+                di = d[i]
+                row[i] = min([di[j] + rest[j] for j in bits if j != i])
+
+    def getDistance(self, point1, point2):
+        "Returns the distance between two points, or infinity if there is no path."
+        distance = self.distance(point1, point2)
+        if distance is None:
+            return float('inf')
+        return distance
+
+    def getMask(self, remaining):
+        mask = 0
+        for target in remaining:
+            mask |= 1 << self.index[target]
+        return mask
+
+    def getCost(self, position, remaining):
+        """
+        Returns the cost of visiting every target in remaining from position,
+        or infinity if some of them can't be reached.
+        """
+        mask = self.getMask(remaining)
+        if mask == 0: return 0
+        best = self.best[mask]
+        return min([self.getDistance(position, self.targets[i]) + best[i]
+                    for i in range(len(self.targets)) if mask >> i & 1])
+
+    def getOrder(self, position, remaining):
+        "Returns the targets in remaining in the cheapest order to visit them from position."
+        mask = self.getMask(remaining)
+        order = []
+        while mask:
+            best = self.best[mask]
+            i = min([i for i in range(len(self.targets)) if mask >> i & 1],
+                    key=lambda i: self.getDistance(position, self.targets[i]) + best[i])
+            position = self.targets[i]
+            order.append(position)
+            mask ^= 1 << i
+        return order
+
+# The most targets HeldKarpPlanner accepts; its tables grow as 2^n n, and
+# filling them in for 13 targets takes about a tenth of a second
+MAX_HELD_KARP_TARGETS = 13
+
+def getPositionAndTargets(state, problem):
+    """
+    Splits a state of a CornersProblem or FoodSearchProblem (or their packed
+    versions) into Pacman's position and the list of targets still to visit.
+    """
+    if isinstance(state, (int, long)):
+        return problem.packing.decode(state)
+    if isinstance(state[1], Grid):
+        return state[0], state[1].asList()
+    return state[0], [corner for corner, visited in zip(problem.corners, state[1:]) if not visited]
+
+def getHeldKarpPlanner(problem):
+    "Returns the HeldKarpPlanner for the targets of a problem, building it on first use."
+    if 'heldKarpPlanner' not in problem.__dict__:
+        position, targets = getPositionAndTargets(problem.getStartState(), problem)
+        gameState = problem.startingGameState
+        problem.heldKarpPlanner = HeldKarpPlanner(targets, lambda a, b: mazeDistance(a, b, gameState))
+    return problem.heldKarpPlanner
+
+def heldKarpHeuristic(state, problem):
+    """
+    A perfect heuristic for the CornersProblem and FoodSearchProblems with
+    at most MAX_HELD_KARP_TARGETS pieces of food: the exact cost of the
+    cheapest way to visit the remaining targets.  A* with it expands little
+    more than the nodes on an optimal path.  It is infinite for states from
+    which some target can't be reached.
+    """
+    position, remaining = getPositionAndTargets(state, problem)
+    return getHeldKarpPlanner(problem).getCost(position, remaining)
+
+def heldKarpSearch(problem):
+    """
+    Solves a CornersProblem or small FoodSearchProblem without searching its
+    state space: HeldKarpPlanner picks the order to visit the targets, and
+    Pacman walks to each in turn along a shortest path.  Returns None if
+    some target can't be reached.
+    """
+    start = problem.getStartState()
+    position, remaining = getPositionAndTargets(start, problem)
+    planner = getHeldKarpPlanner(problem)
+    if planner.getCost(position, remaining) == float('inf'):
+        print "SHEESH, we have failed."
+        return None
+    order = planner.getOrder(position, remaining)
+    return walkThrough(position, order, problem.startingGameState)
+
+def walkThrough(position, targets, gameState):
+    """
+    Returns the actions of a walk from position that visits targets in order,
+    taking a shortest path from each to the next, or None if one of them
+    can't be reached.
+    """
+    walls = gameState.getWalls()
+    actions = []
+    for target in targets:
+        if mazeDistance(position, target, gameState) is None:
+            return None
+        # step to whichever neighbor is one closer to the target
+        while position != target:
+            distance = mazeDistance(position, target, gameState)
+            for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
+                x, y = Actions.getSuccessor(position, action)
+                nextPosition = (int(x), int(y))
+                if not walls[nextPosition[0]][nextPosition[1]] and \
+                   mazeDistance(nextPosition, target, gameState) < distance:
+                    break
+            actions.append(action)
+            position = nextPosition
+    return actions
+
+class HeldKarpSearchAgent(SearchAgent):
+    """
+    A SearchAgent that plans a CornersProblem (or a FoodSearchProblem with at
+    most MAX_HELD_KARP_TARGETS pieces of food, with prob=FoodSearchProblem)
+    exactly with heldKarpSearch.
+    """
+    def __init__(self, prob='CornersProblem'):
+        self.searchFunction = heldKarpSearch
+        self.searchType = globals()[prob]
 
 class ClosestDotSearchAgent(SearchAgent):
     "Search for all food using a sequence of searches"
     def registerInitialState(self, state):
         self.actions = []
-        currentState = state
-        while(currentState.getFood().count() > 0):
-            nextPathSegment = self.findPathToClosestDot(currentState) # The missing piece
+        # One search from all the food finds the closest dot from every cell,
+        # and eating a dot only repairs the cells that were closest to it
+        field = distanceField.DistanceField(state.getWalls(), state.getFood().asList())
+        position = state.getPacmanPosition()
+        while field.numTargets > 0:
+            nextPathSegment = field.getPath(position)
+            if nextPathSegment is None:
+                raise Exception, 'No food can be reached from %s' % str(position)
             self.actions += nextPathSegment
-            for action in nextPathSegment:
-                legal = currentState.getLegalActions()
-                if action not in legal:
-                    t = (str(action), str(currentState))
-                    raise Exception, 'findPathToClosestDot returned an illegal move: %s!\n%s' % t
-                currentState = currentState.generateSuccessor(0, action)
+            position = field.getNearestTarget(position)
+            field.removeTarget(position)
         self.actionIndex = 0
         print 'Path found with cost %d.' % len(self.actions)
 
@@ -573,7 +1053,8 @@ class AnyFoodSearchProblem(PositionSearchProblem):
         # Store info for the PositionSearchProblem (no need to change this)
         self.walls = gameState.getWalls()
         self.startState = gameState.getPacmanPosition()
-        self.costFn = lambda x: 1
+        self.costFn = unitCost
+        self.neighbors = getNeighborTable(self.walls)
         self._visited, self._visitedlist, self._expanded = {}, [], 0
 
     def isGoalState(self, state):
@@ -583,38 +1064,282 @@ class AnyFoodSearchProblem(PositionSearchProblem):
         """
         x,y = state
 
-        food_list = self.food.asList()
+        return self.food[x][y]
 
-        if state in food_list:
-            return True
+class DStarLiteAgent(Agent):
+    """
+    Heads for the closest food, planning again before every move with an
+    incremental D* Lite planner (dStarLite.py) that keeps its search between
+    moves.  Each move it only tells the planner what changed: where Pacman
+    is, which food was eaten and, with avoidGhosts, which cells have ghosts
+    in them that aren't scared.  Replanning then only searches the cells
+    those changes affect.
+    """
+    def __init__(self, avoidGhosts='True'):
+        self.avoidGhosts = avoidGhosts == True or str(avoidGhosts).lower() == 'true'
 
-        return False
+    def registerInitialState(self, state):
+        "This method is called before any moves are made."
+        self.planner = dStarLite.DStarLite(state.getWalls(), state.getFood().asList(),
+                                           state.getPacmanPosition())
+        self.moves = 0
+
+    def getAction(self, state):
+        planner = self.planner
+        position = state.getPacmanPosition()
+        planner.moveStart(position)
+        food = state.getFood()
+        for x, y in [goal for goal in planner.goals if not food[goal[0]][goal[1]]]:
+            planner.removeGoal((x, y))
+        if self.avoidGhosts:
+            ghosts = set([util.nearestPoint(ghost.getPosition()) for ghost in state.getGhostStates()
+                          if ghost.scaredTimer == 0])
+            ghosts.discard(position)
+            for cell in planner.blocked - ghosts:
+                planner.setBlocked(cell, False)
+            for cell in ghosts - planner.blocked:
+                planner.setBlocked(cell, True)
+        self.moves += 1
+        path = planner.getPath()
+        if not path:
+            return Directions.STOP
+        return path[0]
+
+    def final(self, state):
+        print 'Planned %d moves, searching %d cells' % (self.moves, self.planner.expanded)
 
 ##################
 # Mini-contest 1 #
 ##################
 
-class ApproximateSearchAgent(Agent):
-    "Implement your contest entry here.  Change anything but the class name."
+# Seconds ApproximateSearchAgent spends improving its plan by default
+APPROXIMATE_TIME_LIMIT = 2.0
+
+# The most ApproximateSearchAgent plans for, as a fraction of the time the
+# game allows registerInitialState
+PLANNING_TIME_FRACTION = 0.8
+
+class ApproximateSearchAgent(ClosestDotSearchAgent):
+    """
+    Eats all the food along a plan that keeps improving for as long as the
+    time limit allows.
+
+    It starts from the closest dot plan, so it always has a plan to follow,
+    and then runs anytime repairing A* (search.anytimeRepairingAStarSolutions)
+    with foodHeuristic on the PackedFoodSearchProblem.  Every plan it finds
+    that is cheaper replaces the current one, and given enough time the plan
+    becomes optimal.  All the planning happens in registerInitialState, so
+    it stops after timeLimit seconds, and never later than
+    PLANNING_TIME_FRACTION of ClassicGameRules.getMaxStartupTime, the time
+    the game allows registerInitialState.  getAction only follows the plan.
+    """
+    def __init__(self, timeLimit=APPROXIMATE_TIME_LIMIT):
+        import pacman
+        startupTime = pacman.ClassicGameRules().getMaxStartupTime(0)
+        self.timeLimit = min(float(timeLimit), startupTime * PLANNING_TIME_FRACTION)
 
     def registerInitialState(self, state):
         "This method is called before any moves are made."
-        "*** YOUR CODE HERE ***"
+        starttime = time.time()
+        ClosestDotSearchAgent.registerInitialState(self, state)
+        problem = PackedFoodSearchProblem(state)
+        solutions = search.anytimeRepairingAStarSolutions(problem, foodHeuristic,
+                                                          starttime + self.timeLimit)
+        for actions, cost, bound in solutions:
+            if cost >= len(self.actions): continue
+            self.actions = actions
+            print('Path improved to cost %d (at most %.2f times optimal) in %.1f seconds' %
+                  (cost, bound, time.time() - starttime))
+        self.actionIndex = 0
 
-    def getAction(self, state):
+class TourPlanner:
+    """
+    Plans a short walk from a start position through a set of targets, as a
+    travelling salesman tour that doesn't return to the start.
+
+    distance(point1, point2) gives the cost of getting between two points;
+    it is called once per pair, and every pair must be connected.  A tour
+    is a list of indices into points, where points[0] is the start and
+    always comes first.  getGreedyTour always moves to the nearest target
+    not yet visited, and improve shortens a tour with 2-opt (reversing a
+    stretch of it) and Or-opt (moving a run of up to OR_OPT_LENGTH targets
+    elsewhere) until neither helps.  plan keeps going until a deadline by
+    kicking the best tour out of its local optimum and improving it again.
+    """
+    def __init__(self, start, targets, distance):
+        self.points = [start] + list(targets)
+        self.d = [[distance(a, b) for b in self.points] for a in self.points]
+
+    def getLength(self, tour):
+        d = self.d
+        return sum([d[a][b] for a, b in zip(tour[:-1], tour[1:])])
+
+    def getGreedyTour(self):
+        d = self.d
+        tour = [0]
+        unvisited = set(range(1, len(self.points)))
+        while unvisited:
+            row = d[tour[-1]]
+            nearest = min(unvisited, key=lambda i: (row[i], i))
+            unvisited.remove(nearest)
+            tour.append(nearest)
+        return tour
+
+    def improve(self, tour, deadline=None):
+        """
+        Applies improving 2-opt and Or-opt moves to a copy of tour until there
+        are none left or time.time() passes deadline, and returns it.
+        """
+        tour = list(tour)
+        improved = True
+        while improved:
+            improved = self.twoOpt(tour, deadline)
+            improved = self.orOpt(tour, deadline) or improved
+            if deadline is not None and time.time() > deadline:
+                break
+        return tour
+
+    def twoOpt(self, tour, deadline):
+        "Reverses stretches of tour in place while that shortens it.  Returns whether it did."
+        d = self.d
+        n = len(tour)
+        changed = False
+        for i in range(1, n - 1):
+            if deadline is not None and time.time() > deadline:
+                break
+            for j in range(i + 1, n):
+                a, b, c = tour[i - 1], tour[i], tour[j]
+                # reversing tour[i..j] swaps the edges (a,b) and (c,next)
+                # for (a,c) and (b,next); the last target has no next
+                if j + 1 < n:
+                    e = tour[j + 1]
+                    delta = d[a][c] + d[b][e] - d[a][b] - d[c][e]
+                else:
+                    delta = d[a][c] - d[a][b]
+                if delta < 0:
+                    tour[i:j + 1] = tour[i:j + 1][::-1]
+                    changed = True
+        return changed
+
+    def orOpt(self, tour, deadline):
+        "Moves runs of targets elsewhere in tour while that shortens it.  Returns whether it did."
+        changed = False
+        for length in range(1, OR_OPT_LENGTH + 1):
+            i = 1
+            while i + length <= len(tour):
+                if deadline is not None and time.time() > deadline:
+                    return changed
+                if self.moveRun(tour, i, length):
+                    changed = True
+                else:
+                    i += 1
+        return changed
+
+    def moveRun(self, tour, i, length):
+        """
+        Moves tour[i:i+length] to the place (and direction) where it shortens
+        tour the most, if there is one.  Returns whether it moved.
         """
-        From game.py:
-        The Agent will receive a GameState and must return an action from
-        Directions.{North, South, East, West, Stop}
+        d = self.d
+        run = tour[i:i + length]
+        first, last = run[0], run[-1]
+        before = tour[i - 1]
+        rest = tour[:i] + tour[i + length:]
+        if i + length < len(tour):
+            after = tour[i + length]
+            saved = d[before][first] + d[last][after] - d[before][after]
+        else:
+            saved = d[before][first]
+
+        best, bestPlace, bestRun = 0, None, None
+        for place in range(len(rest)):
+            if place == i - 1: continue
+            a = rest[place]
+            for candidate, head, tail in [(run, first, last), (run[::-1], last, first)]:
+                if place + 1 < len(rest):
+                    b = rest[place + 1]
+                    delta = d[a][head] + d[tail][b] - d[a][b] - saved
+                else:
+                    delta = d[a][head] - saved
+                if delta < best:
+                    best, bestPlace, bestRun = delta, place, candidate
+        if bestPlace is None:
+            return False
+        tour[:] = rest[:bestPlace + 1] + bestRun + rest[bestPlace + 1:]
+        return True
+
+    def plan(self, deadline, seed=0):
+        """
+        Returns the shortest tour found before time.time() passes deadline,
+        or before TOUR_PATIENCE kicks in a row fail to shorten it.
         """
-        "*** YOUR CODE HERE ***"
-        util.raiseNotDefined()
+        rand = random.Random(seed)
+        best = self.improve(self.getGreedyTour(), deadline)
+        bestLength = self.getLength(best)
+        failures = 0
+        while time.time() < deadline and failures < TOUR_PATIENCE and len(best) > 4:
+            # a double bridge: swap two consecutive stretches of the tour,
+            # which no single 2-opt or Or-opt move can undo
+            p, q, r = sorted(rand.sample(range(1, len(best)), 3))
+            tour = self.improve(best[:p] + best[q:r] + best[p:q] + best[r:], deadline)
+            length = self.getLength(tour)
+            if length < bestLength:
+                best, bestLength, failures = tour, length, 0
+            else:
+                failures += 1
+        return best
+
+    def getTargets(self, tour):
+        "Returns the targets of tour in the order it visits them."
+        return [self.points[i] for i in tour[1:]]
+
+# The longest run of targets Or-opt moves at once
+OR_OPT_LENGTH = 3
+
+# Kicks in a row without a shorter tour after which TourPlanner.plan stops
+TOUR_PATIENCE = 200
+
+# Seconds TourSearchAgent spends improving its tour
+TOUR_TIME_LIMIT = 2.0
+
+class TourSearchAgent(SearchAgent):
+    """
+    Eats all the food by planning a tour through it with TourPlanner: a
+    greedy tour improved by 2-opt and Or-opt for timeLimit seconds.  The
+    result isn't guaranteed to be optimal, but is close on the contest
+    layouts and takes seconds rather than minutes.
+    """
+    def __init__(self, timeLimit=TOUR_TIME_LIMIT):
+        self.timeLimit = float(timeLimit)
+
+    def registerInitialState(self, state):
+        "This method is called before any moves are made."
+        starttime = time.time()
+        position = state.getPacmanPosition()
+        # food walled off from Pacman can't be part of any tour
+        targets = [cell for cell in state.getFood().asList()
+                   if mazeDistance(position, cell, state) is not None]
+        planner = TourPlanner(position, targets, lambda a, b: mazeDistance(a, b, state))
+        tour = planner.plan(starttime + self.timeLimit)
+        self.actions = walkThrough(position, planner.getTargets(tour), state)
+        self.actionIndex = 0
+        print('Tour length %d (greedy %d) planned in %.1f seconds' %
+              (len(self.actions), planner.getLength(planner.getGreedyTour()), time.time() - starttime))
+
+# Layouts with more open cells than this get no all-pairs distance table
+# (it would take 2 * MAX_TABLE_CELLS ** 2 bytes)
+MAX_TABLE_CELLS = 4096
 
 def mazeDistance(point1, point2, gameState):
     """
-    Returns the maze distance between any two points, using the search functions
-    you have already built.  The gameState can be any game state -- Pacman's position
-    in that state is ignored.
+    Returns the maze distance between any two points, or None if there is no
+    path between them.  The gameState can be any game state -- Pacman's
+    position in that state is ignored.
+
+    Distances come from the all-pairs table in mazeDistances.py, which is
+    computed once per layout, so each call is a constant time lookup.  Layouts
+    with more than MAX_TABLE_CELLS open cells are too big for that table and
+    are searched with bidirectional breadth first search instead.
 
     Example usage: mazeDistance( (2,4), (5,6), gameState)
 
@@ -623,7 +1348,12 @@ def mazeDistance(point1, point2, gameState):
     x1, y1 = point1
     x2, y2 = point2
     walls = gameState.getWalls()
-    assert not walls[x1][y1], 'point1 is a wall: ' + point1
+    assert not walls[x1][y1], 'point1 is a wall: ' + str(point1)
     assert not walls[x2][y2], 'point2 is a wall: ' + str(point2)
-    prob = PositionSearchProblem(gameState, start=point1, goal=point2, warn=False, visualize=False)
-    return len(search.bfs(prob))
+    if walls.count(False) > MAX_TABLE_CELLS:
+        prob = PositionSearchProblem(gameState, start=point1, goal=point2, warn=False, visualize=False)
+        actions = search.bidirectionalSearch(prob)
+        if actions is None:
+            return None
+        return len(actions)
+    return mazeDistances.getMazeDistances(walls).getDistance(point1, point2)
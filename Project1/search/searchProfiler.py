@@ -0,0 +1,333 @@
+# searchProfiler.py
+# -----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+Profiles a search function on a search problem: where the time goes, how
+fast nodes are expanded, how big the frontier and closed set get, which
+values the heuristic returns and the effective branching factor.
+
+Example:
+actions, profile = profileSearch(search.astar, problem, searchAgents.manhattanHeuristic)
+print profile.toJson()
+
+Time is split between problem.getSuccessors, the heuristic, the util
+queues (Stack, Queue, PriorityQueue and IndexedPriorityQueue) and
+everything else.  Time spent in one of these called from another, such as
+a heuristic that pushes to a util queue, counts only towards the outer one.
+Searches that keep their frontier in heaps of their own, like smaStarSearch,
+have that time counted as everything else.  The queues are only profiled
+for the module of the search function: for the length of the search, its
+util is swapped for a copy whose queue classes are timed subclasses, so
+queues used anywhere else are left alone.
+
+Searches that don't expand through problem.getSuccessors, like
+jumpPointSearch, still report the expansions they count in
+problem._expanded, but the successors generated, the closed set and the
+effective branching factor can't be measured for them and are left null.
+
+To profile A* with the Manhattan distance on some mazes and save the
+results as JSON:
+    python searchProfiler.py -l mediumMaze,bigMaze -f astar -e manhattanHeuristic -o mazes.json
+To profile the corners problem:
+    python searchProfiler.py -l mediumCorners -f astar -p CornersProblem -e cornersHeuristic
+"""
+
+import json, sys, time, types
+import util
+
+# Methods of the util queues whose time is counted as queue time
+QUEUE_METHODS = [(util.Stack, ['push', 'pop']),
+                 (util.Queue, ['push', 'pop']),
+                 (util.PriorityQueue, ['push', 'pop']),
+                 (util.PriorityQueueWithFunction, ['push']),
+                 (util.IndexedPriorityQueue, ['push', 'pop', 'update', 'setPriority', 'remove'])]
+
+def getQueueSize(queue):
+    "Returns the number of entries in a util queue."
+    if isinstance(queue, util.IndexedPriorityQueue):
+        return len(queue)
+    if isinstance(queue, util.PriorityQueue):
+        return len(queue.heap)
+    return len(queue.list)
+
+def getEffectiveBranchingFactor(generated, depth):
+    """
+    Returns the branching factor b of a uniform tree of the given depth with
+    generated nodes below the root, that is, the b with
+    b + b^2 + ... + b^depth = generated.
+    """
+    if depth == 0 or generated == 0:
+        return None
+    def getSize(b):
+        return sum([b ** i for i in range(1, depth + 1)])
+    # b^depth is at most generated, so b is at most its depth-th root
+    low, high = 0.0, max(1.0, generated ** (1.0 / depth))
+    for i in range(100):
+        middle = (low + high) / 2
+        if getSize(middle) < generated:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+class SearchProfile:
+    """
+    The measurements taken while profiling one search.
+    """
+    def __init__(self):
+        self.seconds = {'successors': 0.0, 'heuristic': 0.0, 'queue': 0.0}
+        # the kind of call being timed, so that calls inside it aren't timed again
+        self.timing = None
+        self.successorCalls = 0
+        self.generated = 0
+        self.closed = set()
+        self.heuristicValues = util.Counter()
+        self.peakFrontier = 0
+        self.totalSeconds = 0.0
+        self.expanded = None
+        self.reportedPeakFrontier = None
+        self.solutionLength = None
+        self.solutionCost = None
+        self.names = {}
+
+    def time(self, kind, function, *args):
+        "Calls function(*args), adding the time it takes to the seconds of kind."
+        if self.timing is not None:
+            return function(*args)
+        self.timing = kind
+        start = time.time()
+        try:
+            return function(*args)
+        finally:
+            self.seconds[kind] += time.time() - start
+            self.timing = None
+
+    def toDict(self):
+        "Returns the measurements as a dict that can be written as JSON."
+        otherSeconds = self.totalSeconds - sum(self.seconds.values())
+        expanded = self.expanded
+        if expanded is None:
+            expanded = self.successorCalls
+        expansionsPerSecond = None
+        if self.totalSeconds > 0:
+            expansionsPerSecond = expanded / self.totalSeconds
+        # unknown for searches that neither use the util queues nor report it
+        peakFrontier = self.peakFrontier or None
+        if self.reportedPeakFrontier is not None:
+            peakFrontier = self.reportedPeakFrontier
+        # unknown for searches that never call getSuccessors
+        generated, closed, branchingFactor = None, None, None
+        if self.successorCalls > 0:
+            generated, closed = self.generated, len(self.closed)
+            if self.solutionLength is not None:
+                branchingFactor = getEffectiveBranchingFactor(self.generated, self.solutionLength)
+        profile = dict(self.names)
+        profile.update({
+            'seconds': self.totalSeconds,
+            'successorSeconds': self.seconds['successors'],
+            'heuristicSeconds': self.seconds['heuristic'],
+            'queueSeconds': self.seconds['queue'],
+            'otherSeconds': max(0.0, otherSeconds),
+            'expanded': expanded,
+            'successorCalls': self.successorCalls,
+            'generated': generated,
+            'expansionsPerSecond': expansionsPerSecond,
+            'peakFrontier': peakFrontier,
+            'closed': closed,
+            'heuristicCalls': self.heuristicValues.totalCount(),
+            # as [value, count] pairs, since JSON keys must be strings
+            'heuristicValues': [[value, self.heuristicValues[value]]
+                                for value in sorted(self.heuristicValues.keys())],
+            'solutionLength': self.solutionLength,
+            'solutionCost': self.solutionCost,
+            'effectiveBranchingFactor': branchingFactor,
+        })
+        return profile
+
+    def toJson(self):
+        return json.dumps(self.toDict(), indent=2, sort_keys=True)
+
+    def writeJson(self, path):
+        outFile = open(path, 'w')
+        outFile.write(self.toJson() + '\n')
+        outFile.close()
+
+class ProfiledProblem:
+    """
+    Wraps a search problem, timing getSuccessors and counting the states it
+    expands.  Every other attribute is read from and written to the wrapped
+    problem, so heuristics and searches see the problem they expect.
+    """
+    def __init__(self, problem, profile):
+        self.__dict__['problem'] = problem
+        self.__dict__['profile'] = profile
+
+    def __getattr__(self, name):
+        if name in ('problem', 'profile'):
+            raise AttributeError, name
+        return getattr(self.problem, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.problem, name, value)
+
+    def __dir__(self):
+        return sorted(set(dir(self.problem)) | set(self.__dict__))
+
+    def getStartState(self):
+        return self.problem.getStartState()
+
+    def isGoalState(self, state):
+        return self.problem.isGoalState(state)
+
+    def getSuccessors(self, state):
+        profile = self.profile
+        successors = profile.time('successors', self.problem.getSuccessors, state)
+        profile.successorCalls += 1
+        profile.generated += len(successors)
+        profile.closed.add(state)
+        return successors
+
+    def getCostOfActions(self, actions):
+        return self.problem.getCostOfActions(actions)
+
+def profileHeuristic(heuristic, profile):
+    "Returns heuristic wrapped to time its calls and count the values it returns."
+    def profiledHeuristic(state, problem):
+        value = profile.time('heuristic', heuristic, state, problem)
+        profile.heuristicValues[value] += 1
+        return value
+    return profiledHeuristic
+
+def getProfiledUtil(profile):
+    """
+    Returns a copy of the util module whose queue classes are subclasses that
+    time the methods in QUEUE_METHODS and track the largest queue.
+    """
+    def profileMethod(method):
+        def profiledMethod(queue, *args):
+            result = profile.time('queue', method, queue, *args)
+            profile.peakFrontier = max(profile.peakFrontier, getQueueSize(queue))
+            return result
+        return profiledMethod
+
+    profiledUtil = types.ModuleType(util.__name__, util.__doc__)
+    profiledUtil.__dict__.update(util.__dict__)
+    for queueClass, names in QUEUE_METHODS:
+        methods = dict([(name, profileMethod(getattr(queueClass, name))) for name in names])
+        # type of an old style class is its metaclass, classobj
+        profiledClass = type(queueClass)(queueClass.__name__, (queueClass,), methods)
+        setattr(profiledUtil, queueClass.__name__, profiledClass)
+    return profiledUtil
+
+def profileSearch(searchFunction, problem, heuristic=None):
+    """
+    Runs searchFunction on problem, with heuristic if one is given, and
+    returns the list of actions it found and a SearchProfile of the search.
+    """
+    profile = SearchProfile()
+    profile.names = {'search': searchFunction.__name__,
+                     'problem': problem.__class__.__name__,
+                     'heuristic': heuristic and heuristic.__name__}
+    profiled = ProfiledProblem(problem, profile)
+    expanded = getattr(problem, '_expanded', None)
+
+    # the module the search function reads util from
+    module = sys.modules.get(searchFunction.__module__)
+    originalUtil = getattr(module, 'util', None)
+    if originalUtil is util:
+        module.util = getProfiledUtil(profile)
+    start = time.time()
+    try:
+        if heuristic is None:
+            actions = searchFunction(profiled)
+        else:
+            actions = searchFunction(profiled, heuristic=profileHeuristic(heuristic, profile))
+    finally:
+        profile.totalSeconds = time.time() - start
+        if originalUtil is util:
+            module.util = originalUtil
+
+    # searches that don't expand through getSuccessors still count in _expanded
+    if expanded is not None:
+        profile.expanded = problem._expanded - expanded
+    profile.reportedPeakFrontier = getattr(problem, '_peakFrontier', None)
+    if actions is not None:
+        profile.solutionLength = len(actions)
+        profile.solutionCost = problem.getCostOfActions(actions)
+    return actions, profile
+
+def readCommand(argv):
+    from optparse import OptionParser
+    parser = OptionParser(__doc__)
+    parser.add_option('-l', '--layouts', dest='layouts', default='mediumMaze',
+                      help='comma separated layouts to profile on (default %default)')
+    parser.add_option('-f', '--function', dest='function', default='bfs',
+                      help='the search function in search.py (default %default)')
+    parser.add_option('-p', '--problem', dest='problem', default='PositionSearchProblem',
+                      help='the search problem in searchAgents.py (default %default)')
+    parser.add_option('-e', '--heuristic', dest='heuristic', default=None,
+                      help='the heuristic in searchAgents.py or search.py')
+    parser.add_option('-o', '--output', dest='output', default=None,
+                      help='file to write the profiles to as JSON (default: print them)')
+    options, otherjunk = parser.parse_args(argv)
+    if len(otherjunk) != 0:
+        raise Exception('Command line input not understood: ' + str(otherjunk))
+    return options
+
+def runProfiles(options):
+    import layout, pacman, search, searchAgents
+    searchFunction = getattr(search, options.function, None)
+    if searchFunction is None:
+        raise AttributeError, options.function + ' is not a search function in search.py.'
+    problemType = getattr(searchAgents, options.problem, None)
+    if problemType is None:
+        raise AttributeError, options.problem + ' is not a search problem type in SearchAgents.py.'
+    heuristic = None
+    if options.heuristic is not None:
+        if options.heuristic in dir(searchAgents):
+            heuristic = getattr(searchAgents, options.heuristic)
+        elif options.heuristic in dir(search):
+            heuristic = getattr(search, options.heuristic)
+        else:
+            raise AttributeError, options.heuristic + ' is not a function in searchAgents.py or search.py.'
+        if 'heuristic' not in searchFunction.func_code.co_varnames:
+            raise Exception, options.function + ' does not take a heuristic'
+
+    profiles = []
+    for name in options.layouts.split(','):
+        lay = layout.getLayout(name)
+        if lay == None: raise Exception("The layout " + name + " cannot be found")
+        state = pacman.GameState()
+        state.initialize(lay, 0)
+        if 'warn' in problemType.__init__.im_func.func_code.co_varnames:
+            problem = problemType(state, warn=False, visualize=False)
+        else:
+            problem = problemType(state)
+        actions, profile = profileSearch(searchFunction, problem, heuristic)
+        profile = profile.toDict()
+        profile['layout'] = name
+        profiles.append(profile)
+
+    output = json.dumps(profiles, indent=2, sort_keys=True)
+    if options.output is None:
+        print output
+    else:
+        outFile = open(options.output, 'w')
+        outFile.write(output + '\n')
+        outFile.close()
+
+if __name__ == '__main__':
+    options = readCommand(sys.argv[1:])
+    runProfiles(options)
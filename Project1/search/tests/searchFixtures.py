@@ -0,0 +1,145 @@
+"""
+Layouts, problems and reference searches shared by the tests.
+
+The reference searches are written out here rather than taken from
+search.py, so the searches under test are checked against code they don't
+share.
+"""
+
+import collections, heapq, os, sys
+
+SEARCH_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SEARCH_DIRECTORY)
+
+import layout, pacman
+
+MAZES = ['tinyMaze', 'smallMaze', 'mediumMaze', 'bigMaze', 'openMaze', 'contoursMaze']
+
+def getGameState(name):
+    "Returns the starting GameState of the layout called name."
+    lay = layout.tryToLoad(os.path.join(SEARCH_DIRECTORY, 'layouts', name + '.lay'))
+    if lay is None: raise Exception, 'The layout ' + name + ' cannot be found'
+    state = pacman.GameState()
+    state.initialize(lay, 0)
+    return state
+
+def getGameStateFromText(rows):
+    "Returns the starting GameState of a layout given as a list of rows of text."
+    state = pacman.GameState()
+    state.initialize(layout.Layout(rows), 0)
+    return state
+
+def getRandomLayoutText(width, height, rand, wallChance=0.3, numFood=0):
+    """
+    Returns the rows of a random layout inside a border of walls, with Pacman
+    and numFood pieces of food on open cells.  Parts of it may be walled off.
+    """
+    rows = [['%'] * width for y in range(height)]
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            if rand.random() >= wallChance:
+                rows[y][x] = ' '
+    cells = [(x, y) for y in range(height) for x in range(width) if rows[y][x] == ' ']
+    chosen = rand.sample(cells, numFood + 1)
+    x, y = chosen[0]
+    rows[y][x] = 'P'
+    for x, y in chosen[1:]:
+        rows[y][x] = '.'
+    return [''.join(row) for row in rows]
+
+def getPositionProblem(name, **options):
+    "Returns a PositionSearchProblem on the layout called name, without display."
+    import searchAgents
+    return searchAgents.PositionSearchProblem(getGameState(name), warn=False, visualize=False, **options)
+
+def getPositionProblemFromText(rows, **options):
+    "Returns a PositionSearchProblem on a layout given as rows of text, without display."
+    import searchAgents
+    return searchAgents.PositionSearchProblem(getGameStateFromText(rows), warn=False, visualize=False, **options)
+
+def getFewestActions(problem):
+    "Returns the number of actions on a shortest path to a goal, or None."
+    start = problem.getStartState()
+    depths = {start: 0}
+    queue = collections.deque([start])
+    while queue:
+        state = queue.popleft()
+        if problem.isGoalState(state):
+            return depths[state]
+        for successor, action, stepCost in problem.getSuccessors(state):
+            if successor not in depths:
+                depths[successor] = depths[state] + 1
+                queue.append(successor)
+    return None
+
+def getReachableStates(problem):
+    "Returns every state reachable from the start of problem, by breadth first search."
+    start = problem.getStartState()
+    seen = set([start])
+    queue = collections.deque([start])
+    while queue:
+        state = queue.popleft()
+        for successor, action, stepCost in problem.getSuccessors(state):
+            if successor not in seen:
+                seen.add(successor)
+                queue.append(successor)
+    return seen
+
+def getCheapestCost(problem):
+    "Returns the cost of a cheapest path to a goal (Dijkstra), or None."
+    start = problem.getStartState()
+    costs = {start: 0}
+    heap = [(0, 0, start)]
+    count = 1
+    while heap:
+        cost, _, state = heapq.heappop(heap)
+        if cost > costs[state]:
+            continue
+        if problem.isGoalState(state):
+            return cost
+        for successor, action, stepCost in problem.getSuccessors(state):
+            if cost + stepCost < costs.get(successor, float('inf')):
+                costs[successor] = cost + stepCost
+                heapq.heappush(heap, (cost + stepCost, count, successor))
+                count += 1
+    return None
+
+def getGridDistances(walls, sources, blocked=()):
+    """
+    Returns a dict from every open cell of walls, a Grid, that can be reached
+    from one of sources without entering blocked cells, to its distance
+    from the nearest source.
+    """
+    distances = dict([(source, 0) for source in sources])
+    queue = collections.deque(sources)
+    while queue:
+        x, y = queue.popleft()
+        for nextCell in [(x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)]:
+            nextx, nexty = nextCell
+            if 0 <= nextx < walls.width and 0 <= nexty < walls.height and \
+               not walls[nextx][nexty] and nextCell not in blocked and nextCell not in distances:
+                distances[nextCell] = distances[(x, y)] + 1
+                queue.append(nextCell)
+    return distances
+
+def followActions(problem, actions):
+    """
+    Returns the state reached by taking actions from the start of problem,
+    or None if one of them isn't a legal move.
+    """
+    state = problem.getStartState()
+    for action in actions:
+        moves = dict([(move, successor) for successor, move, stepCost in problem.getSuccessors(state)])
+        if action not in moves:
+            return None
+        state = moves[action]
+    return state
+
+def checkShortest(test, problem, actions):
+    """
+    Asserts through test, a TestCase, that actions lead from the start of
+    problem to a goal in as few steps as breadth first search needs.
+    """
+    state = followActions(problem, actions)
+    test.assertTrue(state is not None and problem.isGoalState(state))
+    test.assertEqual(len(actions), getFewestActions(problem))
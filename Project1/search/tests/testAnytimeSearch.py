@@ -0,0 +1,58 @@
+"""
+Tests for anytime repairing A* (anytimeRepairingAStarSolutions) and the
+ApproximateSearchAgent built on it.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents
+
+class AnytimeSearchTest(unittest.TestCase):
+    def checkSolutions(self, problem, heuristic, cheapest):
+        solutions = list(search.anytimeRepairingAStarSolutions(problem, heuristic))
+        self.assertTrue(solutions)
+        costs = [cost for actions, cost, bound in solutions]
+        bounds = [bound for actions, cost, bound in solutions]
+        for actions, cost, bound in solutions:
+            self.assertEqual(problem.getCostOfActions(actions), cost)
+            self.assertTrue(cost <= bound * cheapest + 1e-9, (cost, bound, cheapest))
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertEqual(bounds, sorted(bounds, reverse=True))
+        # the last solution is optimal
+        self.assertEqual(costs[-1], cheapest)
+
+    def testMazes(self):
+        for name in MAZES:
+            cheapest = searchFixtures.getCheapestCost(getPositionProblem(name))
+            self.checkSolutions(getPositionProblem(name), searchAgents.manhattanHeuristic, cheapest)
+
+    def testFood(self):
+        for name in ['testSearch', 'tinySearch', 'trickySearch']:
+            problem = searchAgents.FoodSearchProblem(getGameState(name))
+            cheapest = problem.getCostOfActions(search.astar(problem, searchAgents.foodHeuristic))
+            problem = searchAgents.PackedFoodSearchProblem(getGameState(name))
+            self.checkSolutions(problem, searchAgents.foodHeuristic, cheapest)
+
+    def testCorners(self):
+        problem = searchAgents.CornersProblem(getGameState('mediumCorners'))
+        cheapest = searchFixtures.getFewestActions(problem)
+        self.checkSolutions(searchAgents.CornersProblem(getGameState('mediumCorners')),
+                            searchAgents.cornersHeuristic, cheapest)
+
+    def testNoPath(self):
+        problem = getPositionProblem('tinyMaze', goal=(0, 0))
+        self.assertEqual(list(search.anytimeRepairingAStarSolutions(problem)), [])
+
+    def testAgentBudgetFitsStartupTime(self):
+        import pacman
+        startupTime = pacman.ClassicGameRules().getMaxStartupTime(0)
+        self.assertEqual(searchAgents.ApproximateSearchAgent().timeLimit, searchAgents.APPROXIMATE_TIME_LIMIT)
+        self.assertTrue(searchAgents.ApproximateSearchAgent(10 * startupTime).timeLimit < startupTime)
+
+if __name__ == '__main__':
+    unittest.main()
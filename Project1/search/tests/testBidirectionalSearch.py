@@ -0,0 +1,80 @@
+"""
+Tests for bidirectional breadth first search.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import MAZES, getGameState, getPositionProblem, getPositionProblemFromText
+
+import search
+
+# a goal in a pocket cut off from Pacman
+POCKET = ['%%%%%%%',
+          '%P % %%',
+          '%  %.%%',
+          '%%%%%%%']
+
+def recordExpansions(problem):
+    "Makes problem list every state whose successors are asked for in problem.expandedStates."
+    problem.expandedStates = []
+    getSuccessors = problem.getSuccessors
+    def recordingGetSuccessors(state):
+        problem.expandedStates.append(state)
+        return getSuccessors(state)
+    problem.getSuccessors = recordingGetSuccessors
+
+class BidirectionalSearchTest(unittest.TestCase):
+    def testMazes(self):
+        for name in MAZES:
+            problem = getPositionProblem(name)
+            searchFixtures.checkShortest(self, problem, search.bidir(problem))
+
+    def testMeetsInTheMiddle(self):
+        rand = random.Random(5)
+        for name in ['openMaze', 'bigMaze', 'contoursMaze']:
+            walls = getGameState(name).getWalls()
+            cells = walls.asList(False)
+            for i in range(10):
+                start, goal = rand.choice(cells), rand.choice(cells)
+                problem = getPositionProblem(name, start=start, goal=goal)
+                recordExpansions(problem)
+                actions = search.bidir(problem)
+                # the sides expand states to depths a and b from their ends
+                # with a + b one less than the path length, so they meet
+                # somewhere along it without either searching past the other
+                fromStart = searchFixtures.getGridDistances(walls, [start])
+                fromGoal = searchFixtures.getGridDistances(walls, [goal])
+                depths = [(fromStart[state], fromGoal[state]) for state in problem.expandedStates]
+                self.assertTrue([a for a in range(len(actions)) if
+                                 all([d1 <= a or d2 < len(actions) - a for d1, d2 in depths])])
+                searchFixtures.checkShortest(self, problem, actions)
+
+    def testBothSidesSearch(self):
+        for length in range(3, 12):
+            corridor = ['%' * (length + 2), '%P' + ' ' * (length - 1) + '%', '%' * (length + 2)]
+            problem = getPositionProblemFromText(corridor, goal=(length, 1))
+            recordExpansions(problem)
+            actions = search.bidir(problem)
+            # the sides take turns, together covering all but the middle cell
+            self.assertEqual(problem.expandedStates[:2], [(1, 1), (length, 1)])
+            self.assertEqual(sorted(problem.expandedStates), [(x, 1) for x in range(1, length + 1) if x != length / 2 + 1])
+            searchFixtures.checkShortest(self, problem, actions)
+
+    def testFewerExpansionsThanBreadthFirst(self):
+        problem = getPositionProblem('openMaze')
+        search.bidir(problem)
+        reference = getPositionProblem('openMaze')
+        search.bfs(reference)
+        self.assertTrue(problem._expanded < reference._expanded)
+
+    def testUnreachableGoal(self):
+        self.assertEqual(search.bidir(getPositionProblemFromText(POCKET, goal=(4, 1))), None)
+
+    def testStartIsGoal(self):
+        self.assertEqual(search.bidir(getPositionProblem('tinyMaze', start=(1, 1))), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for the bounded suboptimal searches, weightedAStarSearch, focalSearch
+and explicitEstimationSearch, and the bound option of SearchAgent.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents
+
+FUNCTIONS = [search.wastar, search.focal, search.ees]
+
+class BoundedSearchTest(unittest.TestCase):
+    def checkWithinBound(self, problem, heuristic, weight):
+        cheapest = searchFixtures.getCheapestCost(problem)
+        for function in FUNCTIONS:
+            actions = function(problem, heuristic, weight)
+            self.assertTrue(problem.isGoalState(searchFixtures.followActions(problem, actions)))
+            cost = problem.getCostOfActions(actions)
+            self.assertTrue(cost <= weight * cheapest, (function.__name__, cost, cheapest))
+            self.assertTrue(problem._suboptimalityBound <= weight)
+            self.assertTrue(cost <= problem._suboptimalityBound * cheapest + 1e-9)
+
+    def testMazes(self):
+        for name in MAZES:
+            for weight in [1.0, 1.2, search.SUBOPTIMALITY_BOUND, 3.0]:
+                self.checkWithinBound(getPositionProblem(name), searchAgents.manhattanHeuristic, weight)
+
+    def testCorners(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            problem = searchAgents.CornersProblem(getGameState(name))
+            self.checkWithinBound(problem, searchAgents.cornersHeuristic, search.SUBOPTIMALITY_BOUND)
+
+    def testAgentPassesBound(self):
+        agent = searchAgents.SearchAgent('ees', heuristic='manhattanHeuristic', bound='1.2')
+        problem = getPositionProblem('bigMaze')
+        agent.searchFunction(problem)
+        self.assertTrue(problem._suboptimalityBound <= 1.2)
+
+    def testAgentRejectsBoundItCannotUse(self):
+        for fn in ['astar', 'bfs']:
+            self.assertRaises(AttributeError, searchAgents.SearchAgent, fn,
+                              heuristic='manhattanHeuristic', bound='2')
+
+if __name__ == '__main__':
+    unittest.main()
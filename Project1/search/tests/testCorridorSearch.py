@@ -0,0 +1,74 @@
+"""
+Tests for the corridor graph and the searches run on it through
+CorridorSearchProblem.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents, corridorGraph
+
+class CorridorSearchTest(unittest.TestCase):
+    def checkCheapest(self, problem, function, *args):
+        cheapest = searchFixtures.getCheapestCost(problem)
+        corridors = searchAgents.CorridorSearchProblem(problem)
+        actions = searchAgents.expandCorridorActions(function(corridors, *args))
+        self.assertTrue(problem.isGoalState(searchFixtures.followActions(problem, actions)))
+        self.assertAlmostEqual(problem.getCostOfActions(actions), cheapest)
+
+    def testCostsMatchUniformCost(self):
+        for name in MAZES:
+            self.checkCheapest(getPositionProblem(name), search.ucs)
+            self.checkCheapest(getPositionProblem(name), search.astar, searchAgents.manhattanHeuristic)
+
+    def testGoalsAndStartsInsideCorridors(self):
+        walls = getGameState('mediumMaze').getWalls()
+        cells = walls.asList(False)
+        for start, goal in zip(cells[::23], cells[::-29]):
+            self.checkCheapest(getPositionProblem('mediumMaze', start=start, goal=goal), search.ucs)
+
+    def testStepCosts(self):
+        for name, costFn in [('mediumDottedMaze', lambda pos: .5 ** pos[0]),
+                             ('mediumScaryMaze', lambda pos: 2 ** pos[0])]:
+            self.checkCheapest(getPositionProblem(name, costFn=costFn), search.ucs)
+
+    def testSearchesTheGraphOnly(self):
+        problem = getPositionProblem('bigMaze')
+        corridors = searchAgents.CorridorSearchProblem(problem)
+        expansions = [0]
+        getSuccessors = corridors.getSuccessors
+        def countedSuccessors(state):
+            expansions[0] += 1
+            return getSuccessors(state)
+        corridors.getSuccessors = countedSuccessors
+        search.ucs(corridors)
+        # the wrapped problem is never expanded and every expansion is counted
+        self.assertEqual(problem._expanded, 0)
+        self.assertEqual(corridors._expanded, expansions[0])
+        plain = getPositionProblem('bigMaze')
+        search.ucs(plain)
+        self.assertTrue(corridors._expanded < plain._expanded)
+
+    def testEdgesMatchTheMaze(self):
+        walls = getGameState('mediumMaze').getWalls()
+        graph = corridorGraph.getCorridorGraph(walls)
+        problem = getPositionProblem('mediumMaze')
+        for junction, edges in graph.edges.items():
+            for action, end, length, actions, cells in edges:
+                problem.startState = junction
+                path = [searchFixtures.followActions(problem, list(actions[:i + 1]))
+                        for i in range(length)]
+                self.assertEqual(tuple(path), cells)
+                self.assertEqual((action, end, length), (actions[0], cells[-1], len(cells)))
+        self.assertEqual(graph.getNumEdges(), sum([len(edges) for edges in graph.edges.values()]))
+
+    def testRejectsStatesBeyondPositions(self):
+        problem = searchAgents.CornersProblem(getGameState('tinyCorners'))
+        self.assertRaises(Exception, searchAgents.CorridorSearchProblem, problem)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the incremental D* Lite planner and the DStarLiteAgent using it.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText
+
+import dStarLite, searchAgents
+from game import Actions
+
+class DStarLiteTest(unittest.TestCase):
+    def checkPlanner(self, planner):
+        # a goal with a ghost on it can't be reached
+        goals = [goal for goal in planner.goals if goal not in planner.blocked]
+        distances = searchFixtures.getGridDistances(planner.walls, goals, planner.blocked)
+        expected = distances.get(planner.start)
+        self.assertEqual(planner.getDistance(), expected)
+        path = planner.getPath()
+        if expected is None:
+            self.assertEqual(path, None)
+            return
+        self.assertEqual(len(path), expected)
+        position = planner.start
+        for action in path:
+            x, y = Actions.getSuccessor(position, action)
+            position = (int(x), int(y))
+            self.assertTrue(planner.isOpen(position))
+        self.assertTrue(position in planner.goals)
+
+    def testRandomChanges(self):
+        rand = random.Random(21)
+        for i in range(60):
+            state = getGameStateFromText(searchFixtures.getRandomLayoutText(10, 8, rand, 0.25, numFood=5))
+            walls = state.getWalls()
+            cells = walls.asList(False)
+            planner = dStarLite.DStarLite(walls, state.getFood().asList(), state.getPacmanPosition())
+            self.checkPlanner(planner)
+            for change in range(15):
+                choice = rand.random()
+                if choice < 0.3 and planner.goals:
+                    planner.removeGoal(rand.choice(list(planner.goals)))
+                elif choice < 0.4:
+                    planner.addGoal(rand.choice(cells))
+                elif choice < 0.7:
+                    cell = rand.choice(cells)
+                    if cell != planner.start:
+                        planner.setBlocked(cell, cell not in planner.blocked)
+                else:
+                    start = rand.choice([cell for cell in cells if cell not in planner.blocked])
+                    planner.moveStart(start)
+                self.checkPlanner(planner)
+
+    def testAgentEatsAllFood(self):
+        for name in ['tinySearch', 'smallSearch']:
+            state = getGameState(name)
+            agent = searchAgents.DStarLiteAgent()
+            agent.registerInitialState(state)
+            moves = 0
+            while state.getNumFood() > 0:
+                distances = searchFixtures.getGridDistances(state.getWalls(), state.getFood().asList())
+                distance = distances[state.getPacmanPosition()]
+                nextState = state.generateSuccessor(0, agent.getAction(state))
+                # every move that eats nothing brings Pacman closer to the nearest food
+                if nextState.getNumFood() == state.getNumFood():
+                    self.assertEqual(distances[nextState.getPacmanPosition()], distance - 1)
+                state = nextState
+                moves += 1
+                self.assertTrue(moves < 500)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for the multi-source distance field and its incremental repair.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText
+
+import distanceField, searchAgents
+from game import Actions
+
+class DistanceFieldTest(unittest.TestCase):
+    def checkField(self, field, walls, targets):
+        expected = searchFixtures.getGridDistances(walls, targets)
+        fresh = distanceField.DistanceField(walls, targets)
+        self.assertEqual(list(field.distances), list(fresh.distances))
+        for pos in walls.asList(False):
+            distance = expected.get(pos)
+            self.assertEqual(field.getDistance(pos), distance)
+            if distance is None:
+                self.assertEqual(field.getNearestTarget(pos), None)
+                self.assertEqual(field.getPath(pos), None)
+                continue
+            # the path is legal, as long as the distance, and ends at the target
+            path = field.getPath(pos)
+            self.assertEqual(len(path), distance)
+            for action in path:
+                x, y = Actions.getSuccessor(pos, action)
+                pos = (int(x), int(y))
+                self.assertFalse(walls[pos[0]][pos[1]])
+            self.assertEqual(pos, field.getNearestTarget(pos))
+            self.assertTrue(pos in targets)
+
+    def checkRemovals(self, state, rand):
+        walls = state.getWalls()
+        targets = state.getFood().asList()
+        field = distanceField.DistanceField(walls, targets)
+        self.checkField(field, walls, targets)
+        rand.shuffle(targets)
+        while targets:
+            field.removeTarget(targets.pop())
+            self.assertEqual(field.numTargets, len(targets))
+            self.checkField(field, walls, targets)
+
+    def testRemovalsMatchFreshSearch(self):
+        rand = random.Random(17)
+        for name in ['tinySearch', 'smallSearch', 'trickySearch']:
+            self.checkRemovals(getGameState(name), rand)
+        for i in range(30):
+            self.checkRemovals(getGameStateFromText(
+                searchFixtures.getRandomLayoutText(12, 8, rand, 0.3, numFood=8)), rand)
+
+    def testNotATarget(self):
+        state = getGameState('tinySearch')
+        field = distanceField.DistanceField(state.getWalls(), state.getFood().asList())
+        self.assertRaises(Exception, field.removeTarget, state.getPacmanPosition())
+
+    def testClosestDotAgentEatsAllFood(self):
+        for name in ['tinySearch', 'trickySearch']:
+            state = getGameState(name)
+            agent = searchAgents.ClosestDotSearchAgent()
+            agent.registerInitialState(state)
+            for action in agent.actions:
+                state = state.generateSuccessor(0, action)
+            self.assertEqual(state.getNumFood(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
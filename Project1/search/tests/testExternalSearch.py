@@ -0,0 +1,78 @@
+"""
+Tests for the external memory searches, externalBreadthFirstSearch and
+externalUniformCostSearch.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import os, shutil, tempfile, unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents, externalSearch
+
+COST_FUNCTIONS = [('mediumDottedMaze', lambda pos: .5 ** pos[0]),
+                  ('mediumScaryMaze', lambda pos: 2 ** pos[0])]
+
+class ExternalSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.settings = (externalSearch.BUFFER_RECORDS, externalSearch.MERGE_WIDTH,
+                         externalSearch.SEARCH_DIRECTORY)
+        # tiny buffers so every layer spills into several runs, merged in passes
+        externalSearch.BUFFER_RECORDS = 4
+        externalSearch.MERGE_WIDTH = 3
+        externalSearch.SEARCH_DIRECTORY = self.directory = tempfile.mkdtemp()
+        self.runs, self.mergePasses = 0, 0
+        addRun, mergeRuns = externalSearch.Layer.addRun, externalSearch.Layer.mergeRuns
+        def countedAddRun(layer, records):
+            self.runs += 1
+            addRun(layer, records)
+        def countedMergeRuns(layer):
+            if len(layer.runs) > externalSearch.MERGE_WIDTH:
+                self.mergePasses += 1
+            return mergeRuns(layer)
+        self.methods = addRun, mergeRuns
+        externalSearch.Layer.addRun = countedAddRun
+        externalSearch.Layer.mergeRuns = countedMergeRuns
+
+    def tearDown(self):
+        externalSearch.Layer.addRun, externalSearch.Layer.mergeRuns = self.methods
+        (externalSearch.BUFFER_RECORDS, externalSearch.MERGE_WIDTH,
+         externalSearch.SEARCH_DIRECTORY) = self.settings
+        # each search removes its files when it ends
+        self.assertEqual(os.listdir(self.directory), [])
+        shutil.rmtree(self.directory)
+
+    def checkPath(self, problem, actions, expectedCost):
+        self.assertTrue(problem.isGoalState(searchFixtures.followActions(problem, actions)))
+        self.assertAlmostEqual(problem.getCostOfActions(actions), expectedCost)
+
+    def testBreadthFirstMatchesInMemory(self):
+        for name in MAZES:
+            fewest = len(search.bfs(getPositionProblem(name)))
+            for locality in [None, 2]:
+                problem = getPositionProblem(name)
+                self.checkPath(problem, search.ebfs(problem, locality), fewest)
+        self.assertTrue(self.runs > 100)
+        self.assertTrue(self.mergePasses > 10)
+
+    def testUniformCostMatchesInMemory(self):
+        for name, costFn in [(name, searchAgents.unitCost) for name in MAZES] + COST_FUNCTIONS:
+            problem = getPositionProblem(name, costFn=costFn)
+            cheapest = problem.getCostOfActions(search.ucs(problem))
+            problem = getPositionProblem(name, costFn=costFn)
+            self.checkPath(problem, search.eucs(problem), cheapest)
+
+    def testCorners(self):
+        problem = searchAgents.CornersProblem(getGameState('tinyCorners'))
+        fewest = len(search.bfs(problem))
+        problem = searchAgents.CornersProblem(getGameState('tinyCorners'))
+        self.checkPath(problem, search.ebfs(problem), fewest)
+
+    def testNoPath(self):
+        self.assertEqual(search.ebfs(getPositionProblem('tinyMaze', goal=(0, 0))), None)
+        self.assertEqual(search.eucs(getPositionProblem('tinyMaze', goal=(0, 0))), None)
+
+if __name__ == '__main__':
+    unittest.main()
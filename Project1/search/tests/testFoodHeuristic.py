@@ -0,0 +1,64 @@
+"""
+Tests for foodHeuristic, the nearest food plus spanning tree estimate, and
+its heuristicInfo['foodTreeCosts'] memo.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText, getReachableStates
+
+import search, searchAgents
+
+def getSmallFoodStates():
+    "Returns the starting GameStates of a few small food layouts."
+    rand = random.Random(14)
+    gameStates = [getGameState('tinySearch'), getGameState('testSearch')]
+    for i in range(15):
+        text = searchFixtures.getRandomLayoutText(rand.randrange(6, 9), rand.randrange(6, 9), rand, 0.3, rand.randrange(1, 6))
+        gameStates.append(getGameStateFromText(text))
+    return gameStates
+
+class FoodHeuristicTest(unittest.TestCase):
+    def testConsistent(self):
+        for gameState in getSmallFoodStates():
+            problem = searchAgents.FoodSearchProblem(gameState)
+            for state in getReachableStates(problem):
+                estimate = searchAgents.foodHeuristic(state, problem)
+                if problem.isGoalState(state):
+                    self.assertEqual(estimate, 0)
+                for successor, action, stepCost in problem.getSuccessors(state):
+                    self.assertTrue(estimate <= stepCost + searchAgents.foodHeuristic(successor, problem))
+
+    def testOptimal(self):
+        for gameState in getSmallFoodStates():
+            fewest = searchFixtures.getFewestActions(searchAgents.FoodSearchProblem(gameState))
+            problem = searchAgents.FoodSearchProblem(gameState)
+            if fewest is None:
+                self.assertEqual(searchAgents.foodHeuristic(problem.getStartState(), problem), float('inf'))
+                continue
+            self.assertTrue(searchAgents.foodHeuristic(problem.getStartState(), problem) <= fewest)
+            actions = search.astar(problem, searchAgents.foodHeuristic)
+            self.assertEqual(problem.getCostOfActions(actions), fewest)
+
+    def testTreeCostMemo(self):
+        for gameState in getSmallFoodStates():
+            problem = searchAgents.FoodSearchProblem(gameState)
+            packed = searchAgents.PackedFoodSearchProblem(gameState)
+            foodKeys = set()
+            for state in getReachableStates(packed):
+                if not packed.isGoalState(state):
+                    foodKeys.add(state >> packed.packing.cellBits)
+                fresh = searchAgents.FoodSearchProblem(gameState)
+                expected = searchAgents.foodHeuristic(packed.decodeState(state), fresh)
+                # a memo shared over many states, packed or not, gives the same estimates
+                self.assertEqual(searchAgents.foodHeuristic(packed.decodeState(state), problem), expected)
+                self.assertEqual(searchAgents.foodHeuristic(state, packed), expected)
+            # one tree per set of food left
+            self.assertEqual(len(problem.heuristicInfo['foodTreeCosts']), len(foodKeys))
+            self.assertEqual(len(packed.heuristicInfo['foodTreeCosts']), len(foodKeys))
+
+if __name__ == '__main__':
+    unittest.main()
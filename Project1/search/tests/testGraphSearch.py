@@ -0,0 +1,57 @@
+"""
+Tests for the shared graph search behind dfs, bfs, ucs and astar.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents
+
+class GraphSearchTest(unittest.TestCase):
+    def checkReachesGoal(self, problem, actions):
+        self.assertTrue(actions is not None)
+        state = searchFixtures.followActions(problem, actions)
+        self.assertTrue(state is not None)
+        self.assertTrue(problem.isGoalState(state))
+
+    def testDepthFirstReachesGoal(self):
+        for name in MAZES:
+            problem = getPositionProblem(name)
+            self.checkReachesGoal(problem, search.dfs(problem))
+
+    def testBreadthFirstIsShortest(self):
+        for name in MAZES:
+            problem = getPositionProblem(name)
+            actions = search.bfs(problem)
+            self.checkReachesGoal(problem, actions)
+            self.assertEqual(len(actions), searchFixtures.getFewestActions(problem), name)
+
+    def testUniformCostAndAStarAreCheapest(self):
+        for name in MAZES:
+            problem = getPositionProblem(name)
+            cheapest = searchFixtures.getCheapestCost(problem)
+            for actions in [search.ucs(problem), search.astar(problem, searchAgents.manhattanHeuristic)]:
+                self.checkReachesGoal(problem, actions)
+                self.assertEqual(problem.getCostOfActions(actions), cheapest, name)
+
+    def testCornersProblem(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            problem = searchAgents.CornersProblem(getGameState(name))
+            fewest = searchFixtures.getFewestActions(problem)
+            for actions in [search.bfs(problem), search.ucs(problem),
+                            search.astar(problem, searchAgents.cornersHeuristic)]:
+                self.checkReachesGoal(problem, actions)
+                self.assertEqual(len(actions), fewest, name)
+
+    def testNoPath(self):
+        # a goal inside the walls can't be reached
+        problem = getPositionProblem('tinyMaze', goal=(0, 0))
+        for function in [search.dfs, search.bfs, search.ucs]:
+            self.assertEqual(function(problem), None)
+
+if __name__ == '__main__':
+    unittest.main()
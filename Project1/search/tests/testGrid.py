@@ -0,0 +1,80 @@
+"""
+Tests for the bitset-backed game.Grid.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import copy, cPickle, os, sys, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Grid, reconstituteGrid
+
+class GridTest(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(5, 3)
+        for x, y in [(0, 0), (1, 2), (4, 1)]:
+            self.grid[x][y] = True
+
+    def testReadsAndWrites(self):
+        self.assertTrue(self.grid[1][2])
+        self.assertFalse(self.grid[2][1])
+        self.assertTrue(self.grid[-1][-2])
+        self.grid[1][2] = False
+        self.assertFalse(self.grid[1][2])
+        self.assertEqual(self.grid.count(), 2)
+
+    def testColumnsAreCached(self):
+        self.assertTrue(self.grid[3] is self.grid[3])
+
+    def testOutOfRange(self):
+        self.assertRaises(IndexError, lambda: self.grid[5])
+        self.assertRaises(IndexError, lambda: self.grid[0][3])
+
+    def testOnlyBooleans(self):
+        self.assertRaises(TypeError, Grid, 2, 2, {})
+        self.assertRaises(TypeError, Grid, 2, 2, 0)
+        self.assertEqual(Grid(2, 2, True).count(), 4)
+
+    def testWritesStoreTruthValues(self):
+        self.grid[2][2] = 'food'
+        self.assertTrue(self.grid[2][2] is True)
+
+    def testCopiesAreIndependent(self):
+        for other in [self.grid.copy(), self.grid.shallowCopy(), self.grid.deepCopy(), copy.copy(self.grid)]:
+            other[0][0] = False
+            self.assertTrue(self.grid[0][0])
+            self.assertFalse(other[0][0])
+
+    def testCopyAfterReadSeesWrites(self):
+        self.grid[0][0]
+        other = self.grid.copy()
+        other[0][1] = True
+        self.assertFalse(self.grid[0][1])
+        self.assertTrue(other[0][1])
+
+    def testEqualityAndHash(self):
+        other = Grid(5, 3)
+        for x, y in self.grid.asList():
+            other[x][y] = True
+        self.assertEqual(self.grid, other)
+        self.assertEqual(hash(self.grid), hash(other))
+        other[3][0] = True
+        self.assertNotEqual(self.grid, other)
+
+    def testAsList(self):
+        self.assertEqual(sorted(self.grid.asList()), [(0, 0), (1, 2), (4, 1)])
+        self.assertEqual(len(self.grid.asList(False)), 12)
+
+    def testPackBitsRoundTrip(self):
+        self.assertEqual(reconstituteGrid(self.grid.packBits()), self.grid)
+
+    def testPickleRoundTrip(self):
+        self.grid[4]
+        other = cPickle.loads(cPickle.dumps(self.grid, cPickle.HIGHEST_PROTOCOL))
+        self.assertEqual(other, self.grid)
+        other[4][1] = False
+        self.assertTrue(self.grid[4][1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Tests for the Held-Karp planner behind heldKarpSearch and heldKarpHeuristic.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText
+
+import search, searchAgents
+
+UNREACHABLE_FOOD = ['%%%%%%%',
+                    '%P  %.%',
+                    '% . %%%',
+                    '%%%%%%%']
+
+class HeldKarpTest(unittest.TestCase):
+    def checkOptimal(self, problem, cheapest):
+        actions = searchAgents.heldKarpSearch(problem)
+        self.assertTrue(problem.isGoalState(searchFixtures.followActions(problem, actions)))
+        self.assertEqual(problem.getCostOfActions(actions), cheapest)
+        self.assertEqual(searchAgents.heldKarpHeuristic(problem.getStartState(), problem), cheapest)
+        actions = search.astar(problem, searchAgents.heldKarpHeuristic)
+        self.assertEqual(problem.getCostOfActions(actions), cheapest)
+
+    def testCorners(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            problem = searchAgents.CornersProblem(getGameState(name))
+            self.checkOptimal(problem, searchFixtures.getFewestActions(problem))
+
+    def testFoodLayouts(self):
+        problem = searchAgents.FoodSearchProblem(getGameState('tinySearch'))
+        cheapest = problem.getCostOfActions(search.astar(problem, searchAgents.foodHeuristic))
+        self.checkOptimal(searchAgents.FoodSearchProblem(getGameState('tinySearch')), cheapest)
+
+    def testRandomFood(self):
+        rand = random.Random(11)
+        for i in range(30):
+            state = getGameStateFromText(searchFixtures.getRandomLayoutText(8, 6, rand, numFood=4))
+            problem = searchAgents.FoodSearchProblem(state)
+            cheapest = searchFixtures.getFewestActions(problem)
+            if cheapest is None:
+                self.assertEqual(searchAgents.heldKarpSearch(searchAgents.FoodSearchProblem(state)), None)
+            else:
+                self.checkOptimal(searchAgents.FoodSearchProblem(state), cheapest)
+
+    def testUnreachableFood(self):
+        state = getGameStateFromText(UNREACHABLE_FOOD)
+        problem = searchAgents.FoodSearchProblem(state)
+        self.assertEqual(searchAgents.heldKarpHeuristic(problem.getStartState(), problem), float('inf'))
+        self.assertEqual(searchAgents.heldKarpSearch(problem), None)
+        self.assertEqual(search.astar(problem, searchAgents.heldKarpHeuristic), None)
+        self.assertEqual(searchAgents.walkThrough((1, 2), [(2, 1), (5, 2)], state), None)
+
+    def testTooManyTargets(self):
+        targets = range(searchAgents.MAX_HELD_KARP_TARGETS + 1)
+        self.assertRaises(Exception, searchAgents.HeldKarpPlanner, targets, lambda a, b: abs(a - b))
+
+if __name__ == '__main__':
+    unittest.main()
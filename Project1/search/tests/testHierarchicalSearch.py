@@ -0,0 +1,84 @@
+"""
+Tests for hierarchical pathfinding (hierarchicalSearch and ClusterGraph).
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getPositionProblem, getGameState, getGameStateFromText
+
+import search, hierarchicalPathfinding
+from game import Actions
+
+# a single open room, so every cluster border is one wide entrance
+OPEN_ROOM = ['%' * 32] + ['%' + ' ' * 30 + '%'] * 12 + ['%' * 32]
+
+class HierarchicalSearchTest(unittest.TestCase):
+    def checkPath(self, walls, start, goal, actions):
+        """
+        Checks that actions lead legally from start to goal and are never
+        fewer than the fewest possible, or are None when there is no path.
+        """
+        distance = searchFixtures.getGridDistances(walls, [goal]).get(start)
+        if distance is None:
+            self.assertEqual(actions, None)
+            return
+        self.assertTrue(len(actions) >= distance)
+        position = start
+        for action in actions:
+            x, y = Actions.getSuccessor(position, action)
+            position = (int(x), int(y))
+            self.assertFalse(walls[position[0]][position[1]])
+        self.assertEqual(position, goal)
+
+    def testMazes(self):
+        rand = random.Random(11)
+        for name in ['mediumMaze', 'bigMaze', 'openMaze']:
+            walls = getGameState(name).getWalls()
+            cells = walls.asList(False)
+            for i in range(30):
+                start, goal = rand.choice(cells), rand.choice(cells)
+                problem = getPositionProblem(name, start=start, goal=goal)
+                self.checkPath(walls, start, goal, search.hpa(problem))
+
+    def testAcrossClusterBorders(self):
+        rand = random.Random(5)
+        crossings = 0
+        for i in range(40):
+            text = searchFixtures.getRandomLayoutText(rand.randrange(8, 20), rand.randrange(8, 20), rand, 0.25)
+            walls = getGameStateFromText(text).getWalls()
+            cells = walls.asList(False)
+            graph = hierarchicalPathfinding.ClusterGraph(walls, rand.choice([2, 3, 4, 5]))
+            for j in range(10):
+                start, goal = rand.choice(cells), rand.choice(cells)
+                if graph.getCluster(start) != graph.getCluster(goal):
+                    crossings += 1
+                self.checkPath(walls, start, goal, graph.findPath(start, goal))
+        self.assertTrue(crossings > 200)
+
+    def testWideEntrances(self):
+        walls = getGameStateFromText(OPEN_ROOM).getWalls()
+        graph = hierarchicalPathfinding.ClusterGraph(walls)
+        # the open cells along the border x = 9 | 10 up to the cluster corner
+        # form one run longer than WIDE_ENTRANCE, with a transition at each end
+        self.assertTrue(9 >= hierarchicalPathfinding.WIDE_ENTRANCE)
+        for y in [1, 9]:
+            self.assertEqual(graph.edges[(9, y)][(10, y)], 1)
+        self.assertFalse((9, 5) in graph.edges)
+        cells = walls.asList(False)
+        rand = random.Random(2)
+        for i in range(100):
+            start, goal = rand.choice(cells), rand.choice(cells)
+            self.checkPath(walls, start, goal, graph.findPath(start, goal))
+
+    def testNoPath(self):
+        # a goal in a pocket cut off from the start
+        text = ['%%%%%%%', '%P % %%', '%  %.%%', '%%%%%%%']
+        walls = getGameStateFromText(text).getWalls()
+        graph = hierarchicalPathfinding.ClusterGraph(walls, 2)
+        self.assertEqual(graph.findPath((1, 2), (4, 1)), None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for util.IndexedPriorityQueue.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import os, random, sys, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import util
+
+class IndexedPriorityQueueTest(unittest.TestCase):
+    def testPopsInPriorityOrder(self):
+        queue = util.IndexedPriorityQueue()
+        for item, priority in [('a', 3), ('b', 1), ('c', 2)]:
+            queue.push(item, priority)
+        self.assertEqual([queue.pop() for i in range(3)], ['b', 'c', 'a'])
+        self.assertTrue(queue.isEmpty())
+
+    def testTiesAreFifo(self):
+        queue = util.IndexedPriorityQueue()
+        for item in 'abcd':
+            queue.push(item, 0)
+        self.assertEqual([queue.pop() for i in range(4)], list('abcd'))
+
+    def testHoldsEachItemOnce(self):
+        queue = util.IndexedPriorityQueue()
+        queue.push('a', 5)
+        queue.push('a', 2)
+        queue.push('a', 7)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.getPriority('a'), 2)
+
+    def testUpdateOnlyLowers(self):
+        queue = util.IndexedPriorityQueue()
+        queue.push('a', 1)
+        queue.push('b', 2)
+        queue.update('b', 5)
+        self.assertEqual(queue.getPriority('b'), 2)
+        queue.update('b', 0)
+        self.assertEqual(queue.peek(), 'b')
+        # a decreased item queues behind items already at its new priority
+        queue.update('a', 0)
+        self.assertEqual([queue.pop(), queue.pop()], ['b', 'a'])
+
+    def testSetPriorityAndRemove(self):
+        queue = util.IndexedPriorityQueue()
+        for i in range(10):
+            queue.push(i, i)
+        queue.setPriority(0, 20)
+        queue.setPriority(9, -1)
+        queue.remove(5)
+        self.assertFalse(queue.contains(5))
+        self.assertEqual(queue.getMinPriority(), -1)
+        self.assertEqual([queue.pop() for i in range(9)], [9, 1, 2, 3, 4, 6, 7, 8, 0])
+
+    def testMatchesSortedOrder(self):
+        rand = random.Random(7)
+        queue = util.IndexedPriorityQueue()
+        priorities = {}
+        for step in range(2000):
+            item = rand.randrange(200)
+            operation = rand.random()
+            if operation < 0.5:
+                priority = rand.randrange(1000)
+                queue.push(item, priority)
+                priorities[item] = min(priority, priorities.get(item, priority))
+            elif operation < 0.7 and item in priorities:
+                priority = rand.randrange(1000)
+                queue.setPriority(item, priority)
+                priorities[item] = priority
+            elif operation < 0.8 and item in priorities:
+                queue.remove(item)
+                del priorities[item]
+            elif priorities:
+                lowest = min(priorities.values())
+                popped = queue.pop()
+                self.assertEqual(priorities.pop(popped), lowest)
+            self.assertEqual(len(queue), len(priorities))
+        while priorities:
+            lowest = min(priorities.values())
+            self.assertEqual(priorities.pop(queue.pop()), lowest)
+        self.assertTrue(queue.isEmpty())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests for 4-connected Jump Point Search.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import MAZES, getGameState, getPositionProblem, getPositionProblemFromText
+
+import search, searchAgents
+
+# an open room with Pacman in the bottom left corner
+OPEN_ROOM = ['%' * 22] + ['%' + ' ' * 20 + '%'] * 9 + ['%P' + ' ' * 19 + '%'] + ['%' * 22]
+
+# a corridor with a side passage down to (5,1); the open cell below (5,4)
+# is a forced neighbor for a jump east along the corridor
+SIDE_PASSAGE = ['%%%%%%%%%%',
+                '%P       %',
+                '%%%%% %%%%',
+                '%%%%% %%%%',
+                '%%%%% %%%%',
+                '%%%%%%%%%%']
+
+class JumpPointSearchTest(unittest.TestCase):
+    def testMazes(self):
+        for name in MAZES:
+            problem = getPositionProblem(name)
+            searchFixtures.checkShortest(self, problem, search.jps(problem, searchAgents.manhattanHeuristic))
+
+    def testRandomPairs(self):
+        rand = random.Random(11)
+        for name in ['openMaze', 'bigMaze', 'contoursMaze']:
+            cells = getGameState(name).getWalls().asList(False)
+            for i in range(10):
+                start, goal = rand.choice(cells), rand.choice(cells)
+                problem = getPositionProblem(name, start=start, goal=goal)
+                searchFixtures.checkShortest(self, problem, search.jps(problem, searchAgents.manhattanHeuristic))
+
+    def testJumpsAcrossOpenRoom(self):
+        problem = getPositionProblemFromText(OPEN_ROOM, goal=(20, 10))
+        actions = search.jps(problem, searchAgents.manhattanHeuristic)
+        # one jump north to the goal's row, then one east to the goal
+        self.assertEqual(problem._visitedlist, [(1, 1), (1, 10)])
+        searchFixtures.checkShortest(self, problem, actions)
+
+    def testStopsAtForcedNeighbors(self):
+        problem = getPositionProblemFromText(SIDE_PASSAGE, goal=(5, 1))
+        actions = search.jps(problem)
+        # the jump east stops above the side passage, skipping the cells before it
+        self.assertEqual(problem._visitedlist, [(1, 4), (5, 4)])
+        searchFixtures.checkShortest(self, problem, actions)
+
+    def testNearestFood(self):
+        for name in ['mediumSearch', 'bigSearch']:
+            problem = searchAgents.AnyFoodSearchProblem(getGameState(name))
+            searchFixtures.checkShortest(self, problem, search.jps(problem))
+
+if __name__ == '__main__':
+    unittest.main()
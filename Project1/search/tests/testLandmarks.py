@@ -0,0 +1,63 @@
+"""
+Tests for the landmark (ALT) lower bounds and landmarkHeuristic.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getPositionProblem, getGameState, getGameStateFromText
+
+import search, searchAgents, landmarks
+
+class LandmarksTest(unittest.TestCase):
+    def checkBounds(self, walls, numLandmarks=landmarks.NUM_LANDMARKS):
+        """
+        Checks that the lower bound between every pair of connected cells is
+        at most their maze distance and changes by at most one per step.
+        """
+        table = landmarks.Landmarks(walls, numLandmarks)
+        self.assertTrue(len(table.landmarks) <= numLandmarks)
+        cells = walls.asList(False)
+        for goal in cells:
+            distances = searchFixtures.getGridDistances(walls, [goal])
+            for cell, distance in distances.items():
+                bound = table.getLowerBound(cell, goal)
+                self.assertTrue(bound <= distance)
+                x, y = cell
+                for neighbor in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+                    if neighbor in distances:
+                        self.assertTrue(abs(bound - table.getLowerBound(neighbor, goal)) <= 1)
+
+    def testRandomLayouts(self):
+        rand = random.Random(12)
+        for i in range(30):
+            text = searchFixtures.getRandomLayoutText(rand.randrange(4, 14), rand.randrange(4, 14), rand, 0.3)
+            self.checkBounds(getGameStateFromText(text).getWalls(), rand.choice([1, 2, landmarks.NUM_LANDMARKS]))
+
+    def testMediumMaze(self):
+        self.checkBounds(getGameState('mediumMaze').getWalls())
+
+    def testBoundsAreExactAtLandmarks(self):
+        walls = getGameState('mediumMaze').getWalls()
+        table = landmarks.Landmarks(walls)
+        for landmark in table.getLandmarkPositions():
+            distances = searchFixtures.getGridDistances(walls, [landmark])
+            for cell, distance in distances.items():
+                self.assertEqual(table.getLowerBound(cell, landmark), distance)
+
+    def testAStarIsOptimal(self):
+        rand = random.Random(3)
+        for name in ['mediumMaze', 'bigMaze', 'openMaze']:
+            cells = getGameState(name).getWalls().asList(False)
+            for i in range(10):
+                start, goal = rand.choice(cells), rand.choice(cells)
+                problem = getPositionProblem(name, start=start, goal=goal)
+                actions = search.astar(problem, searchAgents.landmarkHeuristic)
+                reference = getPositionProblem(name, start=start, goal=goal)
+                self.assertEqual(len(actions), searchFixtures.getFewestActions(reference))
+                self.assertEqual(searchFixtures.followActions(problem, actions), goal)
+
+if __name__ == '__main__':
+    unittest.main()
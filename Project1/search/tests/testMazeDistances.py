@@ -0,0 +1,109 @@
+"""
+Tests for the all-pairs maze distance tables and their on-disk cache.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import os, shutil, tempfile, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText, getPositionProblem
+
+import mazeDistances, searchAgents
+
+# the food at (5, 2) is walled off from Pacman
+UNREACHABLE_FOOD = ['%%%%%%%',
+                    '%P  %.%',
+                    '% . %%%',
+                    '%%%%%%%']
+
+class MazeDistancesTest(unittest.TestCase):
+    def setUp(self):
+        self.oldDirectory = mazeDistances.CACHE_DIRECTORY
+        self.directory = tempfile.mkdtemp()
+        mazeDistances.CACHE_DIRECTORY = self.directory
+        self.walls = getGameState('mediumMaze').getWalls()
+
+    def tearDown(self):
+        mazeDistances.CACHE_DIRECTORY = self.oldDirectory
+        shutil.rmtree(self.directory)
+
+    def getCachePath(self):
+        return os.path.join(self.directory, mazeDistances.getLayoutKey(self.walls) + '.dist')
+
+    def testMatchesBreadthFirstSearch(self):
+        distances = mazeDistances.MazeDistances(self.walls)
+        start = (1, 1)
+        for goal in self.walls.asList(False)[::37]:
+            problem = getPositionProblem('mediumMaze', start=start, goal=goal)
+            self.assertEqual(distances.getDistance(start, goal), searchFixtures.getFewestActions(problem))
+
+    def testSaveLoadRoundTrip(self):
+        computed = mazeDistances.MazeDistances(self.walls)
+        self.assertTrue(os.path.exists(self.getCachePath()))
+        loaded = mazeDistances.MazeDistances(self.walls)
+        # the second table is mapped from the file rather than computed
+        self.assertNotEqual(type(loaded.distances), type(computed.distances))
+        self.assertEqual(len(loaded.distances), len(computed.distances))
+        self.assertEqual(list(loaded.distances), list(computed.distances))
+
+    def testDamagedFileIsRecomputed(self):
+        mazeDistances.MazeDistances(self.walls)
+        open(self.getCachePath(), 'wb').write('short')
+        distances = mazeDistances.MazeDistances(self.walls)
+        self.assertEqual(list(distances.distances),
+                         list(mazeDistances.computeDistances(distances.neighbors)))
+
+    def testCacheCanBeTurnedOff(self):
+        mazeDistances.CACHE_DIRECTORY = ''
+        mazeDistances.MazeDistances(self.walls)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def testDefaultDirectoryIsOutsideTheSourceTree(self):
+        if 'PACMAN_DISTANCE_CACHE' in os.environ:
+            return
+        source = os.path.dirname(os.path.abspath(mazeDistances.__file__))
+        self.assertFalse(os.path.abspath(self.oldDirectory).startswith(source))
+
+    def testTablesAreSharedPerLayout(self):
+        other = getGameState('mediumMaze').getWalls()
+        self.assertTrue(mazeDistances.getMazeDistances(self.walls) is mazeDistances.getMazeDistances(other))
+
+    def testUnreachableAndWalls(self):
+        distances = mazeDistances.MazeDistances(self.walls)
+        self.assertRaises(Exception, distances.getDistance, (0, 0), (1, 1))
+        self.assertEqual(distances.getCellId((0, 0)), -1)
+
+class UnreachableDistanceTest(unittest.TestCase):
+    def setUp(self):
+        self.state = getGameStateFromText(UNREACHABLE_FOOD)
+        self.maxTableCells = searchAgents.MAX_TABLE_CELLS
+
+    def tearDown(self):
+        searchAgents.MAX_TABLE_CELLS = self.maxTableCells
+
+    def checkUnreachable(self):
+        state = self.state
+        self.assertEqual(searchAgents.mazeDistance((1, 2), (5, 2), state), None)
+        self.assertEqual(searchAgents.mazeDistance((1, 2), (2, 1), state), 2)
+        self.assertEqual(searchAgents.closestDistance((1, 2), [(5, 2), (2, 1)], state), 2)
+        self.assertEqual(searchAgents.closestDistance((1, 2), [(5, 2)], state), float('inf'))
+        self.assertEqual(searchAgents.spanningTreeCost([(1, 2), (3, 2), (2, 1)], state), 4)
+        self.assertEqual(searchAgents.spanningTreeCost([(1, 2), (5, 2), (2, 1)], state), float('inf'))
+        problem = searchAgents.FoodSearchProblem(state)
+        self.assertEqual(searchAgents.foodHeuristic(problem.getStartState(), problem), float('inf'))
+
+    def testTable(self):
+        self.checkUnreachable()
+
+    def testSearchWithoutTable(self):
+        searchAgents.MAX_TABLE_CELLS = 0
+        self.checkUnreachable()
+
+    def testTourSkipsUnreachableFood(self):
+        agent = searchAgents.TourSearchAgent(0.1)
+        agent.registerInitialState(self.state)
+        self.assertEqual(len(agent.actions), 2)
+
+if __name__ == '__main__':
+    unittest.main()
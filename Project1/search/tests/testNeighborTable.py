@@ -0,0 +1,61 @@
+"""
+Tests for the shared neighbor tables that PositionSearchProblem and
+CornersProblem read their successors from.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import collections, unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import searchAgents
+from game import Actions, Directions
+
+def getMoves(walls, position):
+    "Returns the (nextPosition, action) moves out of position, computed from the walls."
+    moves = []
+    for action in [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]:
+        x, y = position
+        dx, dy = Actions.directionToVector(action)
+        nextx, nexty = int(x + dx), int(y + dy)
+        if not walls[nextx][nexty]:
+            moves.append(((nextx, nexty), action))
+    return moves
+
+class NeighborTableTest(unittest.TestCase):
+    def testPositionSuccessors(self):
+        for name, costFn in [(name, searchAgents.unitCost) for name in MAZES] + \
+                            [('mediumScaryMaze', lambda pos: 2 ** pos[0])]:
+            problem = getPositionProblem(name, costFn=costFn)
+            walls = problem.walls
+            for position in walls.asList(False):
+                expected = [(nextPosition, action, costFn(nextPosition))
+                            for nextPosition, action in getMoves(walls, position)]
+                self.assertEqual(list(problem.getSuccessors(position)), expected)
+
+    def testCornersSuccessors(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            problem = searchAgents.CornersProblem(getGameState(name))
+            # every state reachable from the start
+            start = problem.getStartState()
+            seen, queue = set([start]), collections.deque([start])
+            while queue:
+                state = queue.popleft()
+                expected = [(problem.updateState(state, nextPosition), action, 1)
+                            for nextPosition, action in getMoves(problem.walls, state[0])]
+                successors = list(problem.getSuccessors(state))
+                self.assertEqual(successors, expected)
+                for successor, action, cost in successors:
+                    if successor not in seen:
+                        seen.add(successor)
+                        queue.append(successor)
+            self.assertEqual(problem._expanded, len(seen))
+
+    def testTablesAreSharedPerLayout(self):
+        walls, other = getGameState('mediumMaze').getWalls(), getGameState('mediumMaze').getWalls()
+        self.assertTrue(searchAgents.getNeighborTable(walls) is searchAgents.getNeighborTable(other))
+
+if __name__ == '__main__':
+    unittest.main()
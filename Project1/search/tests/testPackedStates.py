@@ -0,0 +1,72 @@
+"""
+Tests for PackedStates and the packed corners and food search problems.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, unittest
+import searchFixtures
+from searchFixtures import getGameState, getGameStateFromText, getReachableStates
+
+import searchAgents
+
+class PackedStatesTest(unittest.TestCase):
+    def testRoundTrip(self):
+        rand = random.Random(13)
+        for i in range(30):
+            text = searchFixtures.getRandomLayoutText(rand.randrange(4, 14), rand.randrange(4, 14), rand, 0.3)
+            walls = getGameStateFromText(text).getWalls()
+            cells = walls.asList(False)
+            targets = rand.sample(cells, min(len(cells), rand.randrange(0, 10)))
+            packing = searchAgents.PackedStates(walls, targets)
+            for j in range(20):
+                position = rand.choice(cells)
+                remaining = [target for target in targets if rand.random() < 0.5]
+                state = packing.encode(position, remaining)
+                self.assertEqual(packing.decode(state), (position, remaining))
+                self.assertEqual(packing.isDone(state), remaining == [])
+
+    def testCornersSuccessors(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            packed = searchAgents.PackedCornersProblem(getGameState(name))
+            plain = searchAgents.CornersProblem(getGameState(name))
+            self.assertEqual(packed.decodeState(packed.getStartState()), plain.getStartState())
+            for state in getReachableStates(packed):
+                expected = sorted([(successor, action) for successor, action, stepCost
+                                   in plain.getSuccessors(packed.decodeState(state))])
+                actual = sorted([(packed.decodeState(successor), action) for successor, action, stepCost
+                                 in packed.getSuccessors(state)])
+                self.assertEqual(actual, expected)
+                self.assertEqual(packed.isGoalState(state), plain.isGoalState(packed.decodeState(state)))
+
+    def testFoodSuccessors(self):
+        packed = searchAgents.PackedFoodSearchProblem(getGameState('tinySearch'))
+        plain = searchAgents.FoodSearchProblem(getGameState('tinySearch'))
+        self.assertEqual(packed.decodeState(packed.getStartState()), plain.getStartState())
+        for state in getReachableStates(packed):
+            expected = dict([(action, successor) for successor, action, stepCost
+                             in plain.getSuccessors(packed.decodeState(state))])
+            actual = dict([(action, packed.decodeState(successor)) for successor, action, stepCost
+                           in packed.getSuccessors(state)])
+            self.assertEqual(actual, expected)
+
+    def testCornersCosts(self):
+        for name in ['tinyCorners', 'mediumCorners']:
+            packed = searchAgents.PackedCornersProblem(getGameState(name))
+            plain = searchAgents.CornersProblem(getGameState(name))
+            self.assertEqual(searchFixtures.getFewestActions(packed), searchFixtures.getFewestActions(plain))
+
+    def testFoodCosts(self):
+        rand = random.Random(4)
+        gameStates = [getGameState('tinySearch'), getGameState('testSearch')]
+        for i in range(15):
+            text = searchFixtures.getRandomLayoutText(rand.randrange(6, 9), rand.randrange(6, 9), rand, 0.3, rand.randrange(0, 5))
+            gameStates.append(getGameStateFromText(text))
+        for gameState in gameStates:
+            packed = searchAgents.PackedFoodSearchProblem(gameState)
+            plain = searchAgents.FoodSearchProblem(gameState)
+            self.assertEqual(searchFixtures.getFewestActions(packed), searchFixtures.getFewestActions(plain))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests for hash distributed A* (hashDistributedAStarSearch), which forks
+worker processes that expand in lockstep rounds.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import multiprocessing, unittest
+import searchFixtures
+from searchFixtures import MAZES, getPositionProblem, getGameState
+
+import search, searchAgents, parallelSearch
+
+class ParallelSearchTest(unittest.TestCase):
+    def tearDown(self):
+        # every search stops and joins its workers, even when it fails
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def checkOptimal(self, getProblem, heuristic):
+        cheapest = getProblem().getCostOfActions(search.astar(getProblem(), heuristic))
+        for numWorkers in [1, 2, 3]:
+            problem = getProblem()
+            actions = parallelSearch.hashDistributedAStarSearch(problem, heuristic, numWorkers)
+            self.assertTrue(problem.isGoalState(searchFixtures.followActions(problem, actions)))
+            self.assertEqual(problem.getCostOfActions(actions), cheapest)
+            self.assertTrue(problem._expanded > 0)
+
+    def testMazes(self):
+        for name in ['tinyMaze', 'mediumMaze', 'openMaze']:
+            self.checkOptimal(lambda: getPositionProblem(name), searchAgents.manhattanHeuristic)
+
+    def testCorners(self):
+        self.checkOptimal(lambda: searchAgents.CornersProblem(getGameState('mediumCorners')),
+                          searchAgents.cornersHeuristic)
+
+    def testFood(self):
+        for name in ['testSearch', 'tinySearch']:
+            self.checkOptimal(lambda: searchAgents.FoodSearchProblem(getGameState(name)),
+                              searchAgents.foodHeuristic)
+
+    def testNoPath(self):
+        problem = getPositionProblem('mediumMaze', goal=(0, 0))
+        self.assertEqual(search.hdastar(problem, searchAgents.manhattanHeuristic), None)
+
+    def testFailingHeuristicStopsWorkers(self):
+        def heuristic(state, problem):
+            raise ValueError
+        self.assertRaises(ValueError, parallelSearch.hashDistributedAStarSearch,
+                          getPositionProblem('tinyMaze'), heuristic, 2)
+
+if __name__ == '__main__':
+    unittest.main()
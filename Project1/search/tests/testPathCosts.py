@@ -0,0 +1,44 @@
+"""
+Tests for the path costs ucs and astar accumulate on their search nodes.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import getPositionProblem
+
+import search, searchAgents
+
+# The cost functions of StayEastSearchAgent and StayWestSearchAgent
+COST_FUNCTIONS = [('mediumDottedMaze', lambda pos: .5 ** pos[0]),
+                  ('mediumScaryMaze', lambda pos: 2 ** pos[0])]
+
+class PathCostTest(unittest.TestCase):
+    def testUniformCostWithStepCosts(self):
+        for name, costFn in COST_FUNCTIONS:
+            problem = getPositionProblem(name, costFn=costFn)
+            actions = search.ucs(problem)
+            self.assertAlmostEqual(problem.getCostOfActions(actions),
+                                   searchFixtures.getCheapestCost(problem))
+
+    def testCheckedCostsAgree(self):
+        for name, costFn in COST_FUNCTIONS:
+            problem = getPositionProblem(name, costFn=costFn)
+            fringe = search.util.IndexedPriorityQueue()
+            actions = search.graphSearch(problem, fringe, lambda state, cost: cost, checkCosts=True)
+            self.assertEqual(actions, search.ucs(getPositionProblem(name, costFn=costFn)))
+
+    def testCheckedCostsWinOnMismatch(self):
+        # getSuccessors claims every step costs 1, getCostOfActions charges by x
+        problem = getPositionProblem('mediumScaryMaze', costFn=lambda pos: 2 ** pos[0])
+        problem.neighbors = searchAgents.getNeighborTable(problem.walls)
+        fringe = search.util.IndexedPriorityQueue()
+        actions = search.graphSearch(problem, fringe, lambda state, cost: cost, checkCosts=True)
+        self.assertAlmostEqual(problem.getCostOfActions(actions),
+                               problem.getCostOfActions(search.ucs(
+                                   getPositionProblem('mediumScaryMaze', costFn=lambda pos: 2 ** pos[0]))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Tests for the pattern database IDA* that solves sliding tile puzzles.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import os, random, shutil, tempfile, unittest
+import searchFixtures
+
+import npuzzle
+
+class PuzzleSolverTest(unittest.TestCase):
+    def setUp(self):
+        self.oldDirectory = npuzzle.PATTERN_DIRECTORY
+        self.directory = tempfile.mkdtemp()
+        npuzzle.PATTERN_DIRECTORY = self.directory
+
+    def tearDown(self):
+        npuzzle.PATTERN_DIRECTORY = self.oldDirectory
+        shutil.rmtree(self.directory)
+
+    def checkSolves(self, puzzle, length):
+        moves = npuzzle.solvePuzzle(puzzle)
+        self.assertEqual(len(moves), length)
+        for move in moves:
+            puzzle = puzzle.result(move)
+        self.assertTrue(puzzle.isGoal())
+
+    def testEightPuzzlesAreSolvedOptimally(self):
+        rand = random.Random(5)
+        for i in range(10):
+            puzzle = npuzzle.createRandomPuzzle(3, 40, rand)
+            self.checkSolves(puzzle, searchFixtures.getFewestActions(npuzzle.NPuzzleSearchProblem(puzzle)))
+
+    def testDefaultDirectoryIsOutsideTheSourceTree(self):
+        if 'PUZZLE_PATTERN_CACHE' in os.environ:
+            return
+        source = os.path.dirname(os.path.abspath(npuzzle.__file__))
+        self.assertFalse(os.path.abspath(self.oldDirectory).startswith(source))
+
+    def testDatabasesAreSaved(self):
+        npuzzle.getPatternDatabases(3)
+        self.assertEqual(len(os.listdir(self.directory)), len(npuzzle.PARTITIONS[3]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for searchProfiler.profileSearch.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+import searchFixtures
+from searchFixtures import getPositionProblem
+
+import search, searchAgents, searchProfiler, util
+
+class SearchProfilerTest(unittest.TestCase):
+    def testCountsMatchTheSearch(self):
+        problem = getPositionProblem('mediumMaze')
+        actions, profile = searchProfiler.profileSearch(search.astar, problem, searchAgents.manhattanHeuristic)
+        self.assertEqual(problem.getCostOfActions(actions),
+                         searchFixtures.getCheapestCost(getPositionProblem('mediumMaze')))
+        profile = profile.toDict()
+        self.assertEqual(profile['expanded'], problem._expanded)
+        self.assertEqual(profile['successorCalls'], problem._expanded)
+        self.assertEqual(profile['closed'], len(problem._visited))
+        self.assertTrue(profile['generated'] >= profile['expanded'])
+        self.assertTrue(profile['peakFrontier'] > 0)
+        self.assertTrue(profile['effectiveBranchingFactor'] >= 1)
+        self.assertEqual(profile['solutionCost'], problem.getCostOfActions(actions))
+
+    def testQueuesArePatchedOnlyInTheSearchModule(self):
+        push = util.IndexedPriorityQueue.__dict__['push']
+        seen = []
+        def heuristic(state, problem):
+            seen.append((search.util is util, util.IndexedPriorityQueue.__dict__['push'] is push))
+            return 0
+        searchProfiler.profileSearch(search.astar, getPositionProblem('tinyMaze'), heuristic)
+        # the search saw a profiled util while the util module itself was untouched
+        self.assertEqual(set(seen), set([(False, True)]))
+        self.assertTrue(search.util is util)
+
+    def testRestoresUtilWhenTheSearchFails(self):
+        def heuristic(state, problem):
+            raise ValueError
+        self.assertRaises(ValueError, searchProfiler.profileSearch, search.astar,
+                          getPositionProblem('tinyMaze'), heuristic)
+        self.assertTrue(search.util is util)
+
+    def testUnmeasuredCountsAreNull(self):
+        # jump point search never calls getSuccessors
+        problem = getPositionProblem('mediumMaze')
+        actions, profile = searchProfiler.profileSearch(search.jps, problem)
+        profile = profile.toDict()
+        self.assertEqual(profile['successorCalls'], 0)
+        self.assertTrue(profile['expanded'] > 0)
+        for name in ['generated', 'closed', 'effectiveBranchingFactor']:
+            self.assertEqual(profile[name], None, name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the memory bounded searches, smaStarSearch and
+iterativeDeepeningAStarSearch.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import heapq, unittest
+import searchFixtures
+from searchFixtures import getPositionProblem
+
+import search, searchAgents
+
+class StopSearch(Exception):
+    pass
+
+class MemoryBoundedSearchTest(unittest.TestCase):
+    def testCostsMatchUniformCost(self):
+        for name in ['tinyMaze', 'smallMaze', 'mediumMaze']:
+            cheapest = searchFixtures.getCheapestCost(getPositionProblem(name))
+            for function in [search.smastar, search.idastar]:
+                problem = getPositionProblem(name)
+                actions = function(problem, searchAgents.manhattanHeuristic)
+                self.assertEqual(problem.getCostOfActions(actions), cheapest, name)
+
+    def testSmallMemoryStillFindsCheapestPath(self):
+        problem = getPositionProblem('tinyMaze')
+        actions = search.smastar(problem, searchAgents.manhattanHeuristic, memoryLimit=20)
+        self.assertEqual(problem.getCostOfActions(actions), searchFixtures.getCheapestCost(problem))
+        self.assertTrue(problem._peakFrontier <= 20)
+
+    def testHeapsStayBounded(self):
+        # a goal far from the start with little memory keeps SMA* pruning and
+        # re-expanding, which used to leave stale heap entries piling up
+        memoryLimit, expansions = 60, 3000
+        problem = getPositionProblem('openMaze', start=(21, 6), goal=(11, 10))
+        getSuccessors = problem.getSuccessors
+        def limitedSuccessors(state):
+            if problem._expanded >= expansions: raise StopSearch
+            return getSuccessors(state)
+        problem.getSuccessors = limitedSuccessors
+        peak = [0]
+        heappush = heapq.heappush
+        def trackedPush(heap, item):
+            heappush(heap, item)
+            peak[0] = max(peak[0], len(heap))
+        heapq.heappush = trackedPush
+        try:
+            self.assertRaises(StopSearch, search.smastar, problem,
+                              searchAgents.manhattanHeuristic, memoryLimit=memoryLimit)
+        finally:
+            heapq.heappush = heappush
+        self.assertTrue(peak[0] <= search.SMA_STAR_HEAP_SLACK * memoryLimit + 1, peak[0])
+
+if __name__ == '__main__':
+    unittest.main()
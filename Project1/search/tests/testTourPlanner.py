@@ -0,0 +1,62 @@
+"""
+Tests for TourPlanner and the TourSearchAgent that follows its tours.
+
+Run from the search directory with:
+    python -m unittest discover -s tests
+"""
+
+import random, time, unittest
+import searchFixtures
+from searchFixtures import getGameState
+
+import searchAgents
+
+def getRandomPlanner(rand, numTargets):
+    "Returns a TourPlanner through random points with Manhattan distances."
+    points = [(rand.randrange(30), rand.randrange(30)) for i in range(numTargets + 1)]
+    return searchAgents.TourPlanner(points[0], points[1:],
+                                    lambda a, b: abs(a[0] - b[0]) + abs(a[1] - b[1]))
+
+class TourPlannerTest(unittest.TestCase):
+    def checkTour(self, planner, tour):
+        self.assertEqual(tour[0], 0)
+        self.assertEqual(sorted(tour), range(len(planner.points)))
+
+    def testMovesNeverLengthenTours(self):
+        rand = random.Random(18)
+        for i in range(40):
+            planner = getRandomPlanner(rand, rand.randrange(2, 25))
+            seed = [0] + rand.sample(range(1, len(planner.points)), len(planner.points) - 1)
+            for move in [planner.twoOpt, planner.orOpt]:
+                tour = list(seed)
+                move(tour, None)
+                self.checkTour(planner, tour)
+                self.assertTrue(planner.getLength(tour) <= planner.getLength(seed))
+            for tour in [seed, planner.getGreedyTour()]:
+                improved = planner.improve(tour)
+                self.checkTour(planner, improved)
+                self.assertTrue(planner.getLength(improved) <= planner.getLength(tour))
+
+    def testPlanIsNoLongerThanGreedy(self):
+        rand = random.Random(3)
+        for i in range(10):
+            planner = getRandomPlanner(rand, 12)
+            tour = planner.plan(time.time() + 0.2)
+            self.checkTour(planner, tour)
+            self.assertTrue(planner.getLength(tour) <= planner.getLength(planner.getGreedyTour()))
+            # never shorter than the optimal walk
+            targets = range(1, len(planner.points))
+            optimal = searchAgents.HeldKarpPlanner(targets, lambda i, j: planner.d[i][j]).getCost(0, targets)
+            self.assertTrue(planner.getLength(tour) >= optimal)
+
+    def testAgentEatsAllFood(self):
+        for name in ['tinySearch', 'trickySearch', 'mediumSearch']:
+            state = getGameState(name)
+            agent = searchAgents.TourSearchAgent(0.2)
+            agent.registerInitialState(state)
+            for action in agent.actions:
+                state = state.generateSuccessor(0, action)
+            self.assertEqual(state.getNumFood(), 0, name)
+
+if __name__ == '__main__':
+    unittest.main()
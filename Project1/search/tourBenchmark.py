@@ -0,0 +1,74 @@
+# tourBenchmark.py
+# ----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+Reports the tours TourPlanner finds through the food of each layout.
+
+For every layout with food, it prints the length of the greedy tour and
+of the improved tour, and how long planning took (including building the
+distance matrix).
+
+To run on every bundled layout with at least two pieces of food:
+    python tourBenchmark.py
+To run on the contest layouts with a longer time budget:
+    python tourBenchmark.py -l mediumSearch,bigSearch -t 10
+"""
+
+import os, sys, time
+import layout, pacman, searchAgents
+
+def benchmark(name, lay, timeLimit):
+    "Plans a tour through the food of lay and prints a row of results."
+    state = pacman.GameState()
+    state.initialize(lay, 0)
+    food = state.getFood().asList()
+
+    start = time.time()
+    planner = searchAgents.TourPlanner(state.getPacmanPosition(), food,
+                                       lambda a, b: searchAgents.mazeDistance(a, b, state))
+    tour = planner.plan(start + timeLimit)
+    planTime = time.time() - start
+
+    print '%-24s %6d %9d %9d %9.2f' % (
+        name, len(food), planner.getLength(planner.getGreedyTour()), planner.getLength(tour), planTime)
+
+def readCommand(argv):
+    from optparse import OptionParser
+    parser = OptionParser(__doc__)
+    parser.add_option('-l', '--layouts', dest='layouts', default='',
+                      help='comma separated layouts to run on (default: all with food)')
+    parser.add_option('-t', '--timeLimit', dest='timeLimit', type='float',
+                      default=searchAgents.TOUR_TIME_LIMIT,
+                      help='seconds spent improving each tour (default %default)')
+    options, otherjunk = parser.parse_args(argv)
+    if len(otherjunk) != 0:
+        raise Exception('Command line input not understood: ' + str(otherjunk))
+    return options
+
+def runBenchmarks(options):
+    names = [name for name in options.layouts.split(',') if name]
+    if not names:
+        names = sorted([name[:-4] for name in os.listdir('layouts') if name.endswith('.lay')])
+
+    print '%-24s %6s %9s %9s %9s' % ('layout', 'food', 'greedy', 'tour', 'seconds')
+    for name in names:
+        lay = layout.getLayout(name)
+        if lay == None: raise Exception("The layout " + name + " cannot be found")
+        if options.layouts or lay.food.count() >= 2:
+            benchmark(name, lay, options.timeLimit)
+
+if __name__ == '__main__':
+    options = readCommand(sys.argv[1:])
+    runBenchmarks(options)
@@ -186,6 +186,144 @@ class PriorityQueue:
     def isEmpty(self):
         return len(self.heap) == 0
 
+class IndexedPriorityQueue:
+    """
+      A priority queue that holds each item at most once and supports
+      changing the priority of a queued item.
+
+      Entries are [priority, count, item] lists kept in a binary heap, with a
+      dictionary mapping every queued item to its position in the heap.
+      Counts are unique, so comparing two entries never compares items.  This
+      gives O(log n) push, pop and decrease-key, and O(1) membership tests.
+      Items must be hashable.
+
+      Ties are broken in FIFO order, as in PriorityQueue: an item whose
+      priority is decreased queues behind items already at its new priority,
+      exactly as if it had been pushed again.
+    """
+    def  __init__(self):
+        self.heap = []
+        self.index = {}
+        self.count = 0
+
+    def push(self, item, priority):
+        "Queues item, or behaves like update if item is already queued"
+        if item in self.index:
+            self.update(item, priority)
+            return
+        self.heap.append([priority, self.count, item])
+        self.index[item] = len(self.heap) - 1
+        self.count += 1
+        self._siftUp(len(self.heap) - 1)
+
+    def pop(self):
+        "Removes and returns the item with the lowest priority"
+        last = self.heap.pop()
+        if self.heap:
+            top = self.heap[0]
+            self.heap[0] = last
+            self.index[last[2]] = 0
+            self._siftDown(0)
+        else:
+            top = last
+        del self.index[top[2]]
+        return top[2]
+
+    def update(self, item, priority):
+        """
+        If item is already queued with a higher priority, lowers its priority.
+        If it is queued with an equal or lower priority, does nothing.
+        Otherwise, pushes it.
+        """
+        if item not in self.index:
+            self.push(item, priority)
+            return
+        i = self.index[item]
+        entry = self.heap[i]
+        if entry[0] <= priority:
+            return
+        entry[0] = priority
+        entry[1] = self.count
+        self.count += 1
+        self._siftUp(i)
+
+    def contains(self, item):
+        "Returns true if item is currently queued"
+        return item in self.index
+
+    def getPriority(self, item):
+        "Returns the priority item is queued with"
+        return self.heap[self.index[item]][0]
+
+    def getMinPriority(self):
+        "Returns the lowest priority in the queue, which must not be empty"
+        return self.heap[0][0]
+
+    def peek(self):
+        "Returns the item with the lowest priority without removing it"
+        return self.heap[0][2]
+
+    def setPriority(self, item, priority):
+        "Changes the priority of a queued item, up or down"
+        i = self.index[item]
+        entry = self.heap[i]
+        entry[0] = priority
+        entry[1] = self.count
+        self.count += 1
+        self._siftUp(i)
+        self._siftDown(self.index[item])
+
+    def remove(self, item):
+        "Removes a queued item"
+        i = self.index.pop(item)
+        last = self.heap.pop()
+        if i < len(self.heap):
+            self.heap[i] = last
+            self.index[last[2]] = i
+            self._siftUp(i)
+            self._siftDown(self.index[last[2]])
+
+    def getItems(self):
+        "Returns a list of the queued items, in no particular order"
+        return [entry[2] for entry in self.heap]
+
+    def isEmpty(self):
+        return len(self.heap) == 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _siftUp(self, i):
+        heap, index = self.heap, self.index
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[i] = heap[parent]
+            index[heap[i][2]] = i
+            i = parent
+        heap[i] = entry
+        index[entry[2]] = i
+
+    def _siftDown(self, i):
+        heap, index = self.heap, self.index
+        entry = heap[i]
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[i] = heap[child]
+            index[heap[i][2]] = i
+            i = child
+        heap[i] = entry
+        index[entry[2]] = i
+
 class PriorityQueueWithFunction(PriorityQueue):
     """
     Implements a priority queue with the same push/pop signature of the
@@ -16,6 +16,7 @@
 from util import manhattanDistance
 from game import Directions
 import random, util
+import mazeDistances
 
 from game import Agent
 
@@ -77,11 +78,15 @@ class ReflexAgent(Agent):
 
         "*** YOUR CODE HERE ***"
         score = 0.
+        distances = mazeDistances.getMazeDistances(successorGameState.getWalls())
 
         # find closest piece of food
         closest_food_distance = float("inf")
         for food in newFood.asList():
-          dist = util.manhattanDistance(newPos, food)
+          dist = distances.getDistance(newPos, food)
+          # food walled off from pacman is never the closest
+          if dist is None:
+            continue
           if dist < closest_food_distance:
             closest_food_distance = dist
             closest_food = food
@@ -384,12 +389,15 @@ def betterEvaluationFunction(currentGameState):
     currentGhostStates = currentGameState.getGhostStates()
 
     score = currentGameState.getScore()
+    mazeDistance = mazeDistances.getMazeDistances(currentGameState.getWalls()).getDistance
 
     # get distance to closest food
     distances = list()
     for food in currentFood.asList():
-      dist = util.manhattanDistance(currentPos, food)
-      distances.append(dist)
+      dist = mazeDistance(currentPos, food)
+      # None for food pacman can't reach
+      if dist is not None:
+        distances.append(dist)
 
     if len(distances) != 0:
       closest_food_distance = min(distances)
@@ -423,8 +431,9 @@ def betterEvaluationFunction(currentGameState):
     # get distance to closest pellet
     distances = list()
     for pellet in currentPellets:
-      dist = util.manhattanDistance(currentPos, pellet)
-      distances.append(dist)
+      dist = mazeDistance(currentPos, pellet)
+      if dist is not None:
+        distances.append(dist)
     
     if len(distances) != 0:
       closest_pellet_distance = min(distances)
@@ -17,6 +17,7 @@
 
 from game import Directions, Actions
 import util
+import mazeDistances
 
 class FeatureExtractor:
     def getFeatures(self, state, action):
@@ -46,23 +47,17 @@ def closestFood(pos, food, walls):
     """
     closestFood -- this is similar to the function that we have
     worked on in the search project; here its all in one place
+
+    Maze distances come from the per-layout table in mazeDistances.py,
+    so this is one lookup per remaining food instead of a search.
     """
-    fringe = [(pos[0], pos[1], 0)]
-    expanded = set()
-    while fringe:
-        pos_x, pos_y, dist = fringe.pop(0)
-        if (pos_x, pos_y) in expanded:
-            continue
-        expanded.add((pos_x, pos_y))
-        # if we find a food at this location then exit
-        if food[pos_x][pos_y]:
-            return dist
-        # otherwise spread out from the location to its neighbours
-        nbrs = Actions.getLegalNeighbors((pos_x, pos_y), walls)
-        for nbr_x, nbr_y in nbrs:
-            fringe.append((nbr_x, nbr_y, dist+1))
-    # no food found
-    return None
+    distances = mazeDistances.getMazeDistances(walls)
+    closest = None
+    for foodPos in food.asList():
+        dist = distances.getDistance(pos, foodPos)
+        if dist is not None and (closest is None or dist < closest):
+            closest = dist
+    return closest
 
 class SimpleExtractor(FeatureExtractor):
     """
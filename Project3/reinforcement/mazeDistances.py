@@ -0,0 +1,213 @@
+# mazeDistances.py
+# ----------------
+# Licensing Information:  You are free to use or extend these projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to UC Berkeley, including a link to
+# http://inst.eecs.berkeley.edu/~cs188/pacman/pacman.html
+#
+# Attribution Information: The Pacman AI projects were developed at UC Berkeley.
+# The core projects and autograders were primarily created by John DeNero
+# (denero@cs.berkeley.edu) and Dan Klein (klein@cs.berkeley.edu).
+# Student side autograding was added by Brad Miller, Nick Hay, and
+# Pieter Abbeel (pabbeel@cs.berkeley.edu).
+
+
+"""
+This file contains a MazeDistances object which computes the shortest path
+between every pair of open cells in a layout once, and then answers maze
+distance queries with a single array lookup.
+
+Example:
+distances = getMazeDistances(gameState.getWalls())
+distances.getDistance( (1,1), (10,10) )
+
+Every open cell is given an integer id, and the distance between cells i
+and j is stored at index i * numCells + j of a flat array.  Tables are
+cached per wall layout, so all agents and heuristics playing on the same
+layout share one table.
+
+Tables are also saved to CACHE_DIRECTORY, under a hash of the layout's
+walls, the first time they are computed.  Later runs memory-map the saved
+file read-only instead of recomputing it, so repeated games and parallel
+worker processes share a single copy of each table.
+
+Each project runs on its own, so this file is copied unchanged into
+Project1/search, Project2/multiagent, Project3/reinforcement and tracking,
+like util.py and game.py.  The copies must be kept the same: make any
+change to all four.
+"""
+
+import array, ctypes, hashlib, mmap, os, tempfile
+
+# Stored for pairs of cells that are not connected.  Distances are kept as
+# unsigned shorts, which is plenty for any layout whose table fits in memory.
+UNREACHABLE = 0xFFFF
+
+# Directory where distance tables are saved between runs, under the user's
+# cache directory ($XDG_CACHE_HOME, or ~/.cache) rather than the source tree.
+# Set the PACMAN_DISTANCE_CACHE environment variable to use another
+# directory, or to an empty string to turn the on-disk cache off.
+CACHE_DIRECTORY = os.environ.get('PACMAN_DISTANCE_CACHE',
+    os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                 'pacman', 'distanceCache'))
+
+class MazeDistances:
+    def __init__(self, walls):
+        """
+        Computes all-pairs maze distances for the open cells of walls, a Grid.
+        """
+        self.width = walls.width
+        self.height = walls.height
+
+        # cellIds[x * height + y] is the id of open cell (x,y), or -1 for a wall
+        self.cells = []
+        self.cellIds = array.array('i', [-1]) * (self.width * self.height)
+        for x in range(self.width):
+            for y in range(self.height):
+                if not walls[x][y]:
+                    self.cellIds[x * self.height + y] = len(self.cells)
+                    self.cells.append((x, y))
+
+        # neighbors[i] is a tuple of the ids of the open cells next to cell i
+        self.neighbors = []
+        for x, y in self.cells:
+            adjacent = []
+            for nextx, nexty in [(x, y+1), (x, y-1), (x+1, y), (x-1, y)]:
+                if 0 <= nextx < self.width and 0 <= nexty < self.height and not walls[nextx][nexty]:
+                    adjacent.append(self.cellIds[nextx * self.height + nexty])
+            self.neighbors.append(tuple(adjacent))
+
+        self.numCells = len(self.cells)
+        self.distances = loadDistances(walls, self.neighbors)
+
+    def getCellId(self, pos):
+        """
+        Returns the id of the open cell at pos, or -1 if pos is a wall or off the board.
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        return self.cellIds[int(x) * self.height + int(y)]
+
+    def getDistance(self, pos1, pos2):
+        """
+        Returns the maze distance between two open cells, or None if there is no
+        path between them.
+        """
+        x1, y1 = int(pos1[0]), int(pos1[1])
+        x2, y2 = int(pos2[0]), int(pos2[1])
+        if 0 <= x1 < self.width and 0 <= y1 < self.height and \
+           0 <= x2 < self.width and 0 <= y2 < self.height:
+            id1 = self.cellIds[x1 * self.height + y1]
+            id2 = self.cellIds[x2 * self.height + y2]
+        else:
+            id1 = id2 = -1
+        if id1 < 0 or id2 < 0:
+            raise Exception("Positions not open cells: " + str((pos1, pos2)))
+        distance = self.distances[id1 * self.numCells + id2]
+        if distance == UNREACHABLE:
+            return None
+        return distance
+
+def computeDistances(neighbors):
+    """
+    Runs a breadth first search from every cell of the graph given by the
+    neighbors lists and returns the distances as a flat array, where the
+    distance from cell i to cell j is at index i * len(neighbors) + j.
+    """
+    numCells = len(neighbors)
+    distances = array.array('H', [UNREACHABLE]) * (numCells * numCells)
+    for source in range(numCells):
+        row = source * numCells
+        distances[row + source] = 0
+        frontier = [source]
+        distance = 0
+        while frontier:
+            distance += 1
+            nextFrontier = []
+            for cell in frontier:
+                for neighbor in neighbors[cell]:
+                    if distances[row + neighbor] == UNREACHABLE:
+                        distances[row + neighbor] = distance
+                        nextFrontier.append(neighbor)
+            frontier = nextFrontier
+    return distances
+
+##################################
+# SAVING DISTANCE TABLES TO DISK #
+##################################
+
+def getLayoutKey(walls):
+    """
+    Returns a file name safe hash identifying a wall Grid.
+    """
+    packed = ','.join(['%d' % n for n in walls.packBits()])
+    return hashlib.sha1(packed).hexdigest()
+
+def loadDistances(walls, neighbors):
+    """
+    Returns the distance table for the graph given by neighbors, mapping it
+    from the on-disk cache if it was saved by an earlier run, and computing
+    and saving it otherwise.
+    """
+    size = len(neighbors) * len(neighbors)
+    if not CACHE_DIRECTORY or size == 0:
+        return computeDistances(neighbors)
+
+    path = os.path.join(CACHE_DIRECTORY, getLayoutKey(walls) + '.dist')
+    itemSize = ctypes.sizeof(ctypes.c_ushort)
+    if os.path.exists(path) and os.path.getsize(path) == size * itemSize:
+        f = open(path, 'rb')
+        try:
+            # a copy-on-write mapping that is never written shares its pages
+            # with every other process mapping the same file
+            table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        finally:
+            f.close()
+        return (ctypes.c_ushort * size).from_buffer(table)
+
+    distances = computeDistances(neighbors)
+    saveDistances(path, distances)
+    return distances
+
+def saveDistances(path, distances):
+    """
+    Writes a distance table to path.  The table is written to a temporary
+    file first and then renamed, so concurrent readers never see a partial
+    table.  Failures are ignored: the cache is only an optimization.
+    """
+    directory = os.path.dirname(path)
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tempPath = tempfile.mkstemp(dir=directory)
+        f = os.fdopen(fd, 'wb')
+        try:
+            distances.tofile(f)
+        finally:
+            f.close()
+        os.rename(tempPath, path)
+    except (IOError, OSError):
+        pass
+
+######################################
+# SHARING DISTANCE TABLES PER LAYOUT #
+######################################
+
+distanceMap = {}
+lastWalls, lastDistances = None, None
+
+def getMazeDistances(walls):
+    """
+    Returns the MazeDistances for a wall Grid, computing them only the first
+    time a layout with these walls is seen.
+    """
+    global lastWalls, lastDistances
+    # Game states share their layout's wall grid, so this is almost always a hit
+    if walls is lastWalls:
+        return lastDistances
+    if walls not in distanceMap:
+        distanceMap[walls] = MazeDistances(walls)
+    lastWalls, lastDistances = walls, distanceMap[walls]
+    return lastDistances
@@ -23,6 +23,9 @@ Example:
 distancer = Distancer(gameState.data.layout)
 distancer.getDistance( (1,1), (10,10) )
 
+Distances come from the per-layout tables in mazeDistances.py, which are
+saved to disk and memory-mapped by later runs instead of being recomputed.
+
 The Distancer object also serves as an example of sharing data
 safely among agents via a global dictionary (distanceMap),
 and performing asynchronous computation via threads. These
@@ -32,6 +35,7 @@ distances.
 """
 
 import threading, sys, time, random
+import mazeDistances
 
 class Distancer:
   def __init__(self, layout, background=True, default=10000):
@@ -76,11 +80,10 @@ class Distancer:
     return bestDistance
 
   def getDistanceOnGrid(self, pos1, pos2):
-    key = (pos1, pos2)
-    if key in self._distances:
-      return self._distances[key]
-    else:
-      raise Exception("Positions not in grid: " + str(key))
+    distance = self._distances.getDistance(pos1, pos2)
+    if distance == None:
+      return sys.maxint
+    return distance
 
   def isReadyForMazeDistance(self):
     return self._distances != None
@@ -132,7 +135,7 @@ class DistanceCalculator(threading.Thread):
       if distanceThread != None: raise Exception('Multiple distance threads')
       distanceThread = self
 
-      distances = computeDistances(self.layout)
+      distances = mazeDistances.getMazeDistances(self.layout.walls)
       print >>sys.stdout, '[Distancer]: Switching to maze distances'
 
       distanceMap[self.layout.walls] = distances
@@ -142,51 +145,3 @@ class DistanceCalculator(threading.Thread):
 
     distanceMapSemaphore.release()
     self.distancer._distances = distances
-
-def computeDistances(layout):
-    distances = {}
-    allNodes = layout.walls.asList(False)
-    for source in allNodes:
-        dist = {}
-        closed = {}
-        for node in allNodes:
-            dist[node] = sys.maxint
-        import util
-        queue = util.PriorityQueue()
-        queue.push(source, 0)
-        dist[source] = 0
-        while not queue.isEmpty():
-            node = queue.pop()
-            if node in closed:
-                continue
-            closed[node] = True
-            nodeDist = dist[node]
-            adjacent = []
-            x, y = node
-            if not layout.isWall((x,y+1)):
-                adjacent.append((x,y+1))
-            if not layout.isWall((x,y-1)):
-                adjacent.append((x,y-1) )
-            if not layout.isWall((x+1,y)):
-                adjacent.append((x+1,y) )
-            if not layout.isWall((x-1,y)):
-                adjacent.append((x-1,y))
-            for other in adjacent:
-                if not other in dist:
-                    continue
-                oldDist = dist[other]
-                newDist = nodeDist+1
-                if newDist < oldDist:
-                    dist[other] = newDist
-                    queue.push(other, newDist)
-        for target in allNodes:
-            distances[(target, source)] = dist[target]
-    return distances
-
-
-def getDistanceOnGrid(distances, pos1, pos2):
-    key = (pos1, pos2)
-    if key in distances:
-      return distances[key]
-    return 100000
-